@@ -1,5 +1,6 @@
 """Shared dependencies for API routes."""
 
+import asyncio
 import logging
 from typing import Optional
 from nuvo_sdk import NuVoClient
@@ -12,6 +13,11 @@ logger = logging.getLogger(__name__)
 _client: Optional[NuVoClient] = None
 _mcs_client: Optional[MCSClient] = None
 
+# Serialize reconnects so concurrent requests share one handshake
+# Lazy-initialized to avoid event loop issues
+_client_reconnect_lock: Optional[asyncio.Lock] = None
+_mcs_reconnect_lock: Optional[asyncio.Lock] = None
+
 
 async def get_client() -> NuVoClient:
     """
@@ -39,16 +45,23 @@ async def get_client() -> NuVoClient:
 
     # If connection is down, try to reconnect
     if not _client._connected:
-        logging.info("[Dependencies] MRAD connection is down, attempting reconnect...")
-        try:
-            await _client.connect()
-            logging.info("[Dependencies] MRAD reconnected successfully")
-        except Exception as e:
-            logging.error(f"[Dependencies] MRAD reconnection failed: {e}")
-            raise HTTPException(
-                status_code=503,
-                detail=f"NuVo device connection is down and reconnection failed: {str(e)}"
-            )
+        global _client_reconnect_lock
+        if _client_reconnect_lock is None:
+            _client_reconnect_lock = asyncio.Lock()
+
+        async with _client_reconnect_lock:
+            # Another request may have reconnected while we waited
+            if not _client._connected:
+                logging.info("[Dependencies] MRAD connection is down, attempting reconnect...")
+                try:
+                    await _client.connect()
+                    logging.info("[Dependencies] MRAD reconnected successfully")
+                except Exception as e:
+                    logging.error(f"[Dependencies] MRAD reconnection failed: {e}")
+                    raise HTTPException(
+                        status_code=503,
+                        detail=f"NuVo device connection is down and reconnection failed: {str(e)}"
+                    )
 
     return _client
 
@@ -96,16 +109,23 @@ async def get_mcs_client() -> MCSClient:
 
     # If connection is down, try to reconnect
     if not _mcs_client._connected:
-        logging.info("[Dependencies] MCS connection is down, attempting reconnect...")
-        try:
-            await _mcs_client.reconnect()
-            logging.info("[Dependencies] MCS reconnected successfully")
-        except Exception as e:
-            logging.error(f"[Dependencies] MCS reconnection failed: {e}")
-            raise HTTPException(
-                status_code=503,
-                detail=f"Music Control Server (MCS) connection is down and reconnection failed: {str(e)}"
-            )
+        global _mcs_reconnect_lock
+        if _mcs_reconnect_lock is None:
+            _mcs_reconnect_lock = asyncio.Lock()
+
+        async with _mcs_reconnect_lock:
+            # Another request may have reconnected while we waited
+            if not _mcs_client._connected:
+                logging.info("[Dependencies] MCS connection is down, attempting reconnect...")
+                try:
+                    await _mcs_client.reconnect()
+                    logging.info("[Dependencies] MCS reconnected successfully")
+                except Exception as e:
+                    logging.error(f"[Dependencies] MCS reconnection failed: {e}")
+                    raise HTTPException(
+                        status_code=503,
+                        detail=f"Music Control Server (MCS) connection is down and reconnection failed: {str(e)}"
+                    )
 
     return _mcs_client
 
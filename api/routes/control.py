@@ -216,8 +216,9 @@ async def _play_radio_station_impl(
             )
 
         # Step 4: Set host zone to Music Server A source
-        await nuvo_client.set_zone(host_zone.guid)
-        await nuvo_client.set_source(music_server_source.guid)
+        await nuvo_client.set_zone_and(
+            host_zone.guid, [f"setSource {music_server_source.guid}"]
+        )
 
         # Step 5: Set MCS instance (if not already set)
         # Check if instance is already set to avoid double-setting after reconnect
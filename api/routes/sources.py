@@ -1,26 +1,29 @@
 """Source information endpoints."""
 
 from typing import List
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Request
 
 from nuvo_sdk import NuVoClient
 from ..dependencies import get_client
 from ..models import SourceResponse
+from ..services.etag import etag_json_response
 
 router = APIRouter(prefix="/sources", tags=["System"])
 
 
 @router.get("", response_model=List[SourceResponse])
-async def list_sources(client: NuVoClient = Depends(get_client)):
+async def list_sources(request: Request, client: NuVoClient = Depends(get_client)):
     """
     Get all sources.
 
+    Supports conditional GET via ETag / If-None-Match.
+
     Returns:
         List of available sources
     """
     try:
         sources = await client.get_sources()
-        return [
+        return etag_json_response(request, [
             SourceResponse(
                 guid=s.guid,
                 name=s.name,
@@ -30,7 +33,7 @@ async def list_sources(client: NuVoClient = Depends(get_client)):
                 zone_count=s.zone_count,
             )
             for s in sources
-        ]
+        ])
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
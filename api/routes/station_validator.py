@@ -1,15 +1,20 @@
 """TuneIn Radio Station Validation - Filter out dead/invalid stations."""
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
-from typing import List
+from typing import AsyncIterator, List
 import asyncio
 
-from nuvo_sdk.mcs_client_simple import SimpleMCSClient as MCSClient
+from nuvo_sdk.mcs_client_simple import SimpleMCSClient as MCSClient, PickListItem
 from ..dependencies import get_mcs_client
+from ..services.mcs_helpers import ensure_instance_and_browse
 
 router = APIRouter(prefix="/tunein", tags=["Radio"])
 
+# Device acknowledgement that a PlayRadioStation request was accepted
+TUNING_MARKER = "Tuning to"
+
 
 class StationValidationResult(BaseModel):
     """Result of station validation."""
@@ -19,7 +24,103 @@ class StationValidationResult(BaseModel):
     message: str
 
 
-@router.get("/validate-stations", response_model=List[StationValidationResult])
+async def _load_stations(mcs_client: MCSClient, instance: str) -> List[PickListItem]:
+    """
+    Select the instance and browse its stations, retrying on failure.
+
+    Raises:
+        HTTPException: 503 if browsing keeps failing, 404 if no stations exist
+    """
+    max_retries = 3
+    try:
+        stations = await ensure_instance_and_browse(mcs_client, instance, retries=max_retries)
+    except Exception as e:
+        raise HTTPException(
+            status_code=503,
+            detail=f"Failed to browse stations after {max_retries} attempts: {str(e)}"
+        )
+
+    if not stations:
+        raise HTTPException(
+            status_code=404,
+            detail="No radio stations found"
+        )
+
+    return stations
+
+
+async def _validate_station(mcs_client: MCSClient, station: PickListItem) -> StationValidationResult:
+    """Quick-check a single station by looking for a "Tuning to" acknowledgement."""
+    guid = station.guid
+    title = station.title
+
+    try:
+        response = await mcs_client._execute_command(f"PlayRadioStation {guid}")
+
+        # Look for "Tuning to" message naming the station in the response
+        name_token = title.split()[0]
+        tuning_found = any(
+            TUNING_MARKER in line and name_token in line for line in response
+        )
+
+        if tuning_found:
+            return StationValidationResult(
+                guid=guid,
+                title=title,
+                appears_valid=True,
+                message="Station acknowledged by device"
+            )
+        return StationValidationResult(
+            guid=guid,
+            title=title,
+            appears_valid=False,
+            message="No tuning confirmation received"
+        )
+
+    except Exception as e:
+        return StationValidationResult(
+            guid=guid,
+            title=title,
+            appears_valid=False,
+            message=f"Error: {str(e)}"
+        )
+
+
+async def _iter_validation_results(
+    mcs_client: MCSClient,
+    stations: List[PickListItem],
+    quick_check: bool,
+) -> AsyncIterator[StationValidationResult]:
+    """
+    Yield a validation result for each station as soon as it is available.
+
+    Stations are checked one after another: every check goes through the
+    single MCS connection, so issuing them concurrently would only queue
+    on the client's command lock.
+    """
+    for station in stations:
+        if quick_check:
+            yield await _validate_station(mcs_client, station)
+
+            # Small delay between checks
+            await asyncio.sleep(0.5)
+
+        else:
+            # Full validation: Actually play and check (slow!)
+            # TODO: Implement full playback verification if needed
+            yield StationValidationResult(
+                guid=station.guid,
+                title=station.title,
+                appears_valid=True,
+                message="Full validation not yet implemented"
+            )
+
+
+@router.get(
+    "/validate-stations",
+    response_class=ORJSONResponse,
+    responses={200: {"model": List[StationValidationResult]}},
+)
 async def validate_all_stations(
     instance: str = "Music_Server_A",
     quick_check: bool = True,
@@ -43,92 +144,53 @@ async def validate_all_stations(
         List of validation results for each station
     """
     try:
-        await mcs_client.set_instance(instance)
-
-        # Browse all stations with retry logic
-        stations = None
-        max_retries = 3
-
-        for attempt in range(max_retries):
-            try:
-                stations = await mcs_client.browse_pick_list()
-                if stations:
-                    break
-                await asyncio.sleep(1.0)
-            except Exception as e:
-                if attempt < max_retries - 1:
-                    await asyncio.sleep(1.0)
-                else:
-                    raise HTTPException(
-                        status_code=503,
-                        detail=f"Failed to browse stations after {max_retries} attempts: {str(e)}"
-                    )
-
-        if not stations:
-            raise HTTPException(
-                status_code=404,
-                detail="No radio stations found"
-            )
+        stations = await _load_stations(mcs_client, instance)
+        # Results are built here, so skip response_model re-validation
+        return ORJSONResponse([
+            result.model_dump()
+            async for result in _iter_validation_results(mcs_client, stations, quick_check)
+        ])
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/validate-stations/stream")
+async def stream_station_validation(
+    instance: str = "Music_Server_A",
+    quick_check: bool = True,
+    mcs_client: MCSClient = Depends(get_mcs_client)
+):
+    """
+    Validate all TuneIn radio stations, streaming each result as it completes.
 
-        results = []
-
-        for station in stations:
-            guid = station.guid
-            title = station.title
-
-            if quick_check:
-                # Quick validation: Just send PlayRadioStation and check response
-                try:
-                    response = await mcs_client._execute_command(f"PlayRadioStation {guid}")
-
-                    # Look for "Tuning to" message in response
-                    tuning_found = False
-                    for line in response:
-                        if "Tuning to" in line and title.split()[0] in line:
-                            tuning_found = True
-                            break
-
-                    if tuning_found:
-                        results.append(StationValidationResult(
-                            guid=guid,
-                            title=title,
-                            appears_valid=True,
-                            message="Station acknowledged by device"
-                        ))
-                    else:
-                        results.append(StationValidationResult(
-                            guid=guid,
-                            title=title,
-                            appears_valid=False,
-                            message="No tuning confirmation received"
-                        ))
-
-                except Exception as e:
-                    results.append(StationValidationResult(
-                        guid=guid,
-                        title=title,
-                        appears_valid=False,
-                        message=f"Error: {str(e)}"
-                    ))
-
-                # Small delay between checks
-                await asyncio.sleep(0.5)
-
-            else:
-                # Full validation: Actually play and check (slow!)
-                # TODO: Implement full playback verification if needed
-                results.append(StationValidationResult(
-                    guid=guid,
-                    title=title,
-                    appears_valid=True,
-                    message="Full validation not yet implemented"
-                ))
-
-        return results
+    Same checks as /validate-stations, but the response is newline-delimited
+    JSON (one StationValidationResult per line) so clients can show progress
+    after the first station instead of waiting for the whole sweep.
 
+    Args:
+        instance: Music Server instance
+        quick_check: If True, just check for "Tuning to" message (fast)
+
+    Returns:
+        application/x-ndjson stream of validation results
+    """
+    try:
+        # Resolve stations up front so browse failures still map to a status code
+        stations = await _load_stations(mcs_client, instance)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+    async def generate():
+        async for result in _iter_validation_results(mcs_client, stations, quick_check):
+            yield result.model_dump_json() + "\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
 
 @router.get("/working-stations")
 async def get_working_stations(
@@ -147,32 +209,12 @@ async def get_working_stations(
         List of working stations (same format as browse endpoint)
     """
     try:
-        # Get validation results
-        validation_results = await validate_all_stations(
-            instance=instance,
-            quick_check=True,
-            mcs_client=mcs_client
-        )
-
-        # Browse all stations with retry logic
-        await mcs_client.set_instance(instance)
-        all_stations = None
-        max_retries = 3
-
-        for attempt in range(max_retries):
-            try:
-                all_stations = await mcs_client.browse_pick_list()
-                if all_stations:
-                    break
-                await asyncio.sleep(1.0)
-            except Exception as e:
-                if attempt < max_retries - 1:
-                    await asyncio.sleep(1.0)
-                else:
-                    raise
-
-        if not all_stations:
-            all_stations = []
+        # Validate the same station list we filter below
+        all_stations = await _load_stations(mcs_client, instance)
+        validation_results = [
+            result
+            async for result in _iter_validation_results(mcs_client, all_stations, quick_check=True)
+        ]
 
         # Filter to only valid ones
         valid_guids = {r.guid for r in validation_results if r.appears_valid}
@@ -5,8 +5,10 @@ from pydantic import BaseModel
 from typing import List
 import asyncio
 
-from nuvo_sdk import NuVoClient, MCSClient
+from nuvo_sdk import NuVoClient
+from nuvo_sdk.mcs_client_simple import SimpleMCSClient as MCSClient
 from ..dependencies import get_client, get_mcs_client
+from ..services.mcs_helpers import ensure_instance_and_browse
 from ..models import CommandResponse
 
 router = APIRouter(prefix="/tunein", tags=["Radio"])
@@ -42,29 +44,11 @@ async def play_tunein_station(
         await nuvo_client.party_mode_toggle()
         await asyncio.sleep(1.5)
 
-        # 2. Set Music Server instance
-        print(f"[TuneIn] Setting instance to {request.music_server_instance}")
-        await mcs_client.set_instance(request.music_server_instance)
-        await asyncio.sleep(1.0)
-
-        # 3. Browse TuneIn radio stations with retry logic
-        print("[TuneIn] Browsing radio stations...")
-        stations = None
-        max_retries = 3
-
-        for attempt in range(max_retries):
-            try:
-                stations = await mcs_client.browse_pick_list()
-                if stations:
-                    break
-                print(f"[TuneIn] Browse returned empty, retrying... ({attempt + 1}/{max_retries})")
-                await asyncio.sleep(1.0)
-            except Exception as e:
-                print(f"[TuneIn] Browse error on attempt {attempt + 1}: {e}")
-                if attempt < max_retries - 1:
-                    await asyncio.sleep(1.0)
-                else:
-                    raise
+        # 2-3. Set Music Server instance and browse TuneIn radio stations
+        print(f"[TuneIn] Browsing radio stations on {request.music_server_instance}...")
+        stations = await ensure_instance_and_browse(
+            mcs_client, request.music_server_instance, settle_delay=1.0
+        )
 
         if not stations:
             raise HTTPException(
@@ -74,25 +58,13 @@ async def play_tunein_station(
 
         print(f"[TuneIn] Found {len(stations)} radio stations")
 
-        # 4. Find the requested station
-        station = None
-        for s in stations:
-            # Match by exact name or partial match
-            if (request.station_name.lower() == s.title.lower() or
-                request.station_name.lower() in s.title.lower()):
-                station = s
-                print(f"[TuneIn] Matched station: {s.title}")
-                break
-
-        if not station:
-            # Try fuzzy match
-            for s in stations:
-                # Extract just the station name (before parentheses)
-                station_name = s.title.split('(')[0].strip()
-                if request.station_name.lower() in station_name.lower():
-                    station = s
-                    print(f"[TuneIn] Fuzzy matched station: {s.title}")
-                    break
+        # 4. Find the requested station (exact or partial, case-insensitive).
+        # Matching the part before any "(...)" suffix is implied by this,
+        # since that prefix is itself part of the title.
+        query = request.station_name.lower()
+        station = next((s for s in stations if query in s.title.lower()), None)
+        if station:
+            print(f"[TuneIn] Matched station: {station.title}")
 
         if not station:
             available = ", ".join([s.title for s in stations[:10]])
@@ -1,10 +1,26 @@
 """WebSocket endpoint for real-time updates."""
 
+import asyncio
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 from ..services.websocket_manager import websocket_manager
 
 router = APIRouter(tags=["WebSocket"])
 
+# Seconds between server-sent heartbeat messages
+HEARTBEAT_INTERVAL = 30.0
+
+
+async def _heartbeat(websocket: WebSocket) -> None:
+    """Periodically send a small ping message to keep the connection alive."""
+    while True:
+        await asyncio.sleep(HEARTBEAT_INTERVAL)
+        try:
+            await websocket.send_text('{"type":"ping"}')
+        except Exception:
+            # Client is gone; the receive loop handles the disconnect. Ending
+            # quietly keeps the task's error from going unretrieved.
+            return
+
 
 @router.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
@@ -21,19 +37,22 @@ async def websocket_endpoint(websocket: WebSocket):
         "value": "50",
         "timestamp": 1234567890.123
     }
+
+    The server also sends {"type": "ping"} every HEARTBEAT_INTERVAL seconds.
+    Messages sent by the client are read and discarded.
     """
     await websocket_manager.connect(websocket)
+    heartbeat_task = asyncio.create_task(_heartbeat(websocket))
 
     try:
-        # Keep connection alive
+        # Drain client messages so disconnects are noticed
         while True:
-            # Wait for any client messages (ping/pong)
-            data = await websocket.receive_text()
-            # Echo back for heartbeat
-            await websocket.send_text(data)
+            await websocket.receive_text()
 
     except WebSocketDisconnect:
         websocket_manager.disconnect(websocket)
     except Exception as e:
         print(f"WebSocket error: {e}")
         websocket_manager.disconnect(websocket)
+    finally:
+        heartbeat_task.cancel()
@@ -1,12 +1,13 @@
 """Zone control endpoints."""
 
-from typing import List
-from fastapi import APIRouter, HTTPException, Depends
+from typing import List, Literal, Optional, Union, cast
+from fastapi import APIRouter, HTTPException, Depends, Request
 from pydantic import BaseModel
 
-from nuvo_sdk import NuVoClient
+from nuvo_sdk import NuVoClient, Zone
 from ..dependencies import get_client
 from ..models import ZoneResponse, CommandResponse
+from ..services.etag import etag_json_response
 
 router = APIRouter(prefix="/zones", tags=["System"])
 
@@ -23,33 +24,45 @@ class SourceRequest(BaseModel):
     source_guid: str
 
 
+class ZoneOperation(BaseModel):
+    """One command in a bulk zone request."""
+
+    zone: int
+    op: Literal["power_on", "power_off", "volume", "mute", "source"]
+    value: Optional[Union[int, str]] = None  # volume (0-79) or source GUID
+
+
+def _zone_response(z: Zone) -> ZoneResponse:
+    """Build a ZoneResponse from an SDK zone."""
+    return ZoneResponse(
+        guid=z.guid,
+        name=z.name,
+        zone_id=z.zone_id,
+        zone_number=z.zone_number,
+        is_on=z.is_on,
+        volume=z.volume,
+        mute=z.mute,
+        source_id=z.source_id,
+        source_name=z.source_name,
+        party_mode=z.party_mode,
+        max_volume=z.max_volume,
+        min_volume=z.min_volume,
+    )
+
+
 @router.get("", response_model=List[ZoneResponse])
-async def list_zones(client: NuVoClient = Depends(get_client)):
+async def list_zones(request: Request, client: NuVoClient = Depends(get_client)):
     """
     Get all zones.
 
+    Supports conditional GET via ETag / If-None-Match.
+
     Returns:
         List of zones with current status
     """
     try:
         zones = await client.get_zones()
-        return [
-            ZoneResponse(
-                guid=z.guid,
-                name=z.name,
-                zone_id=z.zone_id,
-                zone_number=z.zone_number,
-                is_on=z.is_on,
-                volume=z.volume,
-                mute=z.mute,
-                source_id=z.source_id,
-                source_name=z.source_name,
-                party_mode=z.party_mode,
-                max_volume=z.max_volume,
-                min_volume=z.min_volume,
-            )
-            for z in zones
-        ]
+        return etag_json_response(request, [_zone_response(z) for z in zones])
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -69,20 +82,7 @@ async def get_zone(zone_number: int, client: NuVoClient = Depends(get_client)):
         zones = await client.get_zones()
         for z in zones:
             if z.zone_number == zone_number:
-                return ZoneResponse(
-                    guid=z.guid,
-                    name=z.name,
-                    zone_id=z.zone_id,
-                    zone_number=z.zone_number,
-                    is_on=z.is_on,
-                    volume=z.volume,
-                    mute=z.mute,
-                    source_id=z.source_id,
-                    source_name=z.source_name,
-                    party_mode=z.party_mode,
-                    max_volume=z.max_volume,
-                    min_volume=z.min_volume,
-                )
+                return _zone_response(z)
         raise HTTPException(status_code=404, detail=f"Zone {zone_number} not found")
     except HTTPException:
         raise
@@ -90,6 +90,69 @@ async def get_zone(zone_number: int, client: NuVoClient = Depends(get_client)):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/bulk", response_model=CommandResponse)
+async def bulk_zone_operations(
+    operations: List[ZoneOperation],
+    client: NuVoClient = Depends(get_client),
+):
+    """
+    Apply several zone commands in one request.
+
+    Operations run in order; the first failure stops the batch.
+
+    Args:
+        operations: Zone commands, e.g. {"zone": 1, "op": "volume", "value": 40}
+    """
+    for operation in operations:
+        if operation.op == "volume" and not (
+            isinstance(operation.value, int) and 0 <= operation.value <= 79
+        ):
+            raise HTTPException(
+                status_code=422, detail="Volume must be between 0 and 79"
+            )
+        if operation.op == "source" and not isinstance(operation.value, str):
+            raise HTTPException(status_code=422, detail="Source requires a GUID")
+
+    try:
+        zone_guids = {}
+        if any(operation.op == "source" for operation in operations):
+            zone_guids = {z.zone_number: z.guid for z in await client.get_zones()}
+
+        # Check every source zone before running anything, so an unknown
+        # zone fails the batch without applying part of it
+        for operation in operations:
+            if operation.op == "source" and operation.zone not in zone_guids:
+                # 422 rather than 404 so clients can tell this apart
+                # from an API without the bulk endpoint
+                raise HTTPException(
+                    status_code=422, detail=f"Zone {operation.zone} not found"
+                )
+
+        for operation in operations:
+            zone_number = operation.zone
+            if operation.op == "power_on":
+                await client.power_on(zone_number)
+            elif operation.op == "power_off":
+                await client.power_off(zone_number)
+            elif operation.op == "volume":
+                # Validated above as an int in 0-79
+                await client.set_volume(cast(int, operation.value), zone_number)
+            elif operation.op == "mute":
+                await client.mute_toggle(zone_number)
+            else:
+                await client.set_zone_and(
+                    zone_guids[zone_number], [f"setSource {operation.value}"]
+                )
+
+        return CommandResponse(
+            success=True, message=f"Applied {len(operations)} zone operations"
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.post("/{zone_number}/power/on", response_model=CommandResponse)
 async def power_on(zone_number: int, client: NuVoClient = Depends(get_client)):
     """
@@ -189,8 +252,7 @@ async def set_source(
         if not zone:
             raise HTTPException(status_code=404, detail=f"Zone {zone_number} not found")
 
-        await client.set_zone(zone.guid)
-        await client.set_source(request.source_guid)
+        await client.set_zone_and(zone.guid, [f"setSource {request.source_guid}"])
 
         return CommandResponse(
             success=True, message=f"Zone {zone_number} source changed"
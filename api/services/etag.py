@@ -0,0 +1,33 @@
+"""ETag support for conditional GET requests."""
+
+import hashlib
+from typing import Any
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+
+def etag_json_response(request: Request, content: Any) -> Response:
+    """
+    Build a JSON response tagged with an ETag of its body.
+
+    If the request's If-None-Match header already carries that ETag, an
+    empty 304 Not Modified is returned instead, so polling clients only
+    download data that actually changed.
+
+    Args:
+        request: Incoming request (checked for If-None-Match)
+        content: Response payload (models, lists, dicts)
+
+    Returns:
+        JSONResponse with an ETag header, or a bare 304 response
+    """
+    response = JSONResponse(jsonable_encoder(content))
+    etag = f'"{hashlib.md5(response.body, usedforsecurity=False).hexdigest()}"'
+
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+
+    response.headers["ETag"] = etag
+    return response
@@ -0,0 +1,85 @@
+"""Shared Music Server (MCS) helpers for API routes."""
+
+import asyncio
+import random
+from typing import List
+
+from nuvo_sdk.exceptions import ConnectionError as NuVoConnectionError
+from nuvo_sdk.mcs_client_simple import SimpleMCSClient as MCSClient, PickListItem
+
+# Errors worth retrying; anything else is treated as permanent
+TRANSIENT_ERRORS = (asyncio.TimeoutError, OSError, NuVoConnectionError)
+
+
+def backoff_delay(attempt: int, base: float = 0.2, cap: float = 4.0) -> float:
+    """
+    Exponential backoff with jitter for retry attempt N (0-based).
+
+    Jitter spreads retries from concurrent requests so they don't all hit
+    the device at the same moment.
+    """
+    return min(base * 2 ** attempt, cap) * (0.5 + random.random())
+
+
+async def ensure_instance(
+    mcs_client: MCSClient,
+    instance: str,
+    settle_delay: float = 0.0,
+) -> None:
+    """
+    Select a Music Server instance unless it is already the active one.
+
+    Args:
+        mcs_client: MCS client to use
+        instance: Music Server instance (e.g., "Music_Server_A")
+        settle_delay: Seconds to wait after actually switching instances
+    """
+    if getattr(mcs_client, "_current_instance", None) == instance:
+        return
+
+    await mcs_client.set_instance(instance)
+    if settle_delay:
+        await asyncio.sleep(settle_delay)
+
+
+async def ensure_instance_and_browse(
+    mcs_client: MCSClient,
+    instance: str,
+    retries: int = 3,
+    settle_delay: float = 0.0,
+) -> List[PickListItem]:
+    """
+    Select an instance and browse its pick list, retrying on failure.
+
+    An empty pick list or a transient (timeout/connection) error is retried
+    with jittered exponential backoff; other errors are raised immediately.
+
+    Args:
+        mcs_client: MCS client to use
+        instance: Music Server instance (e.g., "Music_Server_A")
+        retries: Maximum number of browse attempts
+        settle_delay: Seconds to wait after actually switching instances
+
+    Returns:
+        Pick list items (empty if every attempt returned nothing)
+
+    Raises:
+        Exception: A non-transient browse error, or the last transient one
+            if the final attempt fails
+    """
+    await ensure_instance(mcs_client, instance, settle_delay)
+
+    items: List[PickListItem] = []
+    for attempt in range(retries):
+        try:
+            items = await mcs_client.browse_pick_list()
+            if items:
+                break
+        except TRANSIENT_ERRORS:
+            if attempt == retries - 1:
+                raise
+
+        if attempt < retries - 1:
+            await asyncio.sleep(backoff_delay(attempt))
+
+    return items
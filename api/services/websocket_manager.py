@@ -2,7 +2,8 @@
 
 import asyncio
 import json
-from typing import List
+from collections import OrderedDict
+from typing import List, Tuple
 from fastapi import WebSocket
 from nuvo_sdk.models import StateChangeEvent
 
@@ -10,8 +11,13 @@ from nuvo_sdk.models import StateChangeEvent
 class WebSocketManager:
     """Manages WebSocket connections and broadcasts events."""
 
+    # Max (target, property) pairs remembered for duplicate suppression
+    MAX_TRACKED_STATES = 1024
+
     def __init__(self):
         self.active_connections: List[WebSocket] = []
+        # Last broadcast value per (target, property), oldest first
+        self._last_values: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
 
     async def connect(self, websocket: WebSocket):
         """
@@ -44,6 +50,17 @@ class WebSocketManager:
         Args:
             event: StateChangeEvent to broadcast
         """
+        # Skip events that repeat the last value seen for this
+        # target/property. Values are recorded even with no clients
+        # connected, so a later change back to an old value isn't dropped.
+        key = (event.target, event.property)
+        if self._last_values.get(key) == event.value:
+            return
+        self._last_values[key] = event.value
+        self._last_values.move_to_end(key)
+        if len(self._last_values) > self.MAX_TRACKED_STATES:
+            self._last_values.popitem(last=False)
+
         if not self.active_connections:
             return
 
@@ -10,6 +10,12 @@ This example demonstrates:
 """
 
 import asyncio
+
+try:
+    import uvloop  # Optional: faster event loop
+except ImportError:
+    uvloop = None
+
 from nuvo_sdk import NuVoClient, StateChangeEvent
 
 # Configure your device
@@ -108,4 +114,6 @@ async def main():
 
 
 if __name__ == "__main__":
+    if uvloop is not None:
+        uvloop.install()
     asyncio.run(main())
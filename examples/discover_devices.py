@@ -4,6 +4,12 @@ Example: Discover NuVo MusicPort devices on your network.
 """
 
 import asyncio
+
+try:
+    import uvloop  # Optional: faster event loop
+except ImportError:
+    uvloop = None
+
 from nuvo_sdk.discovery import discover_devices, get_local_network
 
 
@@ -14,8 +20,12 @@ async def main():
     network = get_local_network()
     print(f"Scanning {network} for NuVo MusicPort devices...")
 
+    def show_progress(done: int, total: int) -> None:
+        print(f"\r  Scanned {done}/{total} hosts", end="", flush=True)
+
     # Discover devices
-    devices = await discover_devices(network)
+    devices = await discover_devices(network, max_concurrent=64, progress=show_progress)
+    print()
 
     if not devices:
         print("No devices found!")
@@ -35,4 +45,6 @@ async def main():
 
 
 if __name__ == "__main__":
+    if uvloop is not None:
+        uvloop.install()
     asyncio.run(main())
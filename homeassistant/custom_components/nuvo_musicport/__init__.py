@@ -17,13 +17,21 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up NuVo MusicPort from a config entry."""
 
     coordinator = NuVoCoordinator(hass, entry)
-    await coordinator.async_config_entry_first_refresh()
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        # Setup will be retried with a new coordinator; close this one's session
+        await coordinator.async_shutdown()
+        raise
 
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    # Receive state changes as they happen instead of waiting for the next poll
+    coordinator.async_start_event_stream(entry)
+
     return True
 
 
@@ -31,6 +39,10 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
 
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+        coordinator: NuVoCoordinator = hass.data[DOMAIN][entry.entry_id]
+        # Cancels the refresh debouncer, event stream and pending commands
+        # and closes the HTTP session before the coordinator is dropped
+        await coordinator.async_shutdown()
         hass.data[DOMAIN].pop(entry.entry_id)
 
     return unload_ok
@@ -3,10 +3,12 @@
 from typing import Any
 import voluptuous as vol
 import aiohttp
+import orjson
 
 from homeassistant import config_entries
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResult
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 import homeassistant.helpers.config_validation as cv
 
 from .const import DOMAIN, CONF_API_HOST, CONF_API_PORT, DEFAULT_API_PORT
@@ -16,12 +18,13 @@ async def validate_connection(hass: HomeAssistant, host: str, port: int) -> dict
     """Validate the API connection."""
     url = f"http://{host}:{port}/health"
 
+    session = async_get_clientsession(hass)
+
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, timeout=aiohttp.ClientTimeout(total=5)) as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    return {"title": "NuVo MusicPort", "device": data.get("device")}
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=5)) as resp:
+            if resp.status == 200:
+                data = orjson.loads(await resp.read())
+                return {"title": "NuVo MusicPort", "device": data.get("device")}
     except Exception as err:
         raise ConnectionError(f"Cannot connect to {url}: {err}")
 
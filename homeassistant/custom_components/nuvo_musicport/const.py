@@ -10,4 +10,10 @@ DEFAULT_API_PORT = 8000
 DEFAULT_NAME = "NuVo MusicPort"
 
 # Update intervals
-UPDATE_INTERVAL = 30  # seconds
+# State changes are pushed over the API's WebSocket; polling is a safety net
+UPDATE_INTERVAL = 300  # seconds
+EVENT_RECONNECT_DELAY = 5  # seconds between WebSocket reconnect attempts
+REQUEST_REFRESH_COOLDOWN = 0.3  # seconds - coalesces bursts of entity actions
+
+# Zone commands issued within this window are sent as one bulk request
+COMMAND_BATCH_WINDOW = 0.02  # seconds
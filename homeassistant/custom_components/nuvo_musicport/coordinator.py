@@ -1,18 +1,73 @@
 """DataUpdateCoordinator for NuVo MusicPort."""
 
+import asyncio
 from datetime import timedelta
 import logging
 import aiohttp
+import orjson
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.config_entries import ConfigEntry
 
-from .const import DOMAIN, CONF_API_HOST, CONF_API_PORT, UPDATE_INTERVAL
+from .const import (
+    DOMAIN,
+    CONF_API_HOST,
+    CONF_API_PORT,
+    UPDATE_INTERVAL,
+    REQUEST_REFRESH_COOLDOWN,
+    EVENT_RECONNECT_DELAY,
+    COMMAND_BATCH_WINDOW,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _json_dumps(obj) -> str:
+    """Serialize request bodies with orjson (aiohttp expects str)."""
+    return orjson.dumps(obj).decode()
+
+
+def _to_bool(value: str) -> bool:
+    return value == "True"
+
+
+# StateChanged property -> (zone field, converter)
+_EVENT_FIELDS = {
+    "Volume": ("volume", int),
+    "PowerOn": ("is_on", _to_bool),
+    "Mute": ("mute", _to_bool),
+    "SourceId": ("source_id", int),
+    "SourceName": ("source_name", str),
+    "PartyMode": ("party_mode", str),
+    "MaxVolume": ("max_volume", int),
+    "MinVolume": ("min_volume", int),
+}
+
+# party_mode values meaning a zone is not in party mode
+_OFF_VALUES = frozenset({"Off", ""})
+
+
+def _party_mode_on(zones: list[dict]) -> bool:
+    """Party mode is on if any zone reports party mode active."""
+    return any(z.get("party_mode") not in _OFF_VALUES for z in zones)
+
+
+# Polled collection -> API path
+_COLLECTION_PATHS = {"zones": "/api/zones", "sources": "/api/sources"}
+
+# Bulk op -> (single-zone endpoint suffix, JSON body key for the op's value)
+_OP_ENDPOINTS = {
+    "power_on": ("/power/on", None),
+    "power_off": ("/power/off", None),
+    "volume": ("/volume", "volume"),
+    "mute": ("/mute", None),
+    "source": ("/source", "source_guid"),
+}
+
+
 class NuVoCoordinator(DataUpdateCoordinator):
     """NuVo MusicPort data update coordinator."""
 
@@ -20,72 +75,276 @@ class NuVoCoordinator(DataUpdateCoordinator):
         """Initialize coordinator."""
         self.host = entry.data[CONF_API_HOST]
         self.port = entry.data[CONF_API_PORT]
-        self.base_url = f"http://{self.host}:{self.port}/api"
+        # Requests use paths relative to this; aiohttp joins them itself
+        self.base_url = f"http://{self.host}:{self.port}"
+
+        # Shared HTTP session, created on first use and closed in async_shutdown
+        self._session: aiohttp.ClientSession | None = None
+
+        # Last ETag per polled collection ("zones", "sources")
+        self._etags: dict[str, str] = {}
+
+        # Background task applying pushed state changes
+        self._event_task: asyncio.Task | None = None
+
+        # Zone commands waiting for the batch window to close
+        self._pending: list[tuple[dict, asyncio.Future]] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        # Cleared if the API predates POST /zones/bulk
+        self._bulk_supported = True
 
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
             update_interval=timedelta(seconds=UPDATE_INTERVAL),
+            # Wait out the cooldown so rapid actions share one refresh
+            request_refresh_debouncer=Debouncer(
+                hass, _LOGGER, cooldown=REQUEST_REFRESH_COOLDOWN, immediate=False
+            ),
+        )
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it if needed."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                base_url=self.base_url, json_serialize=_json_dumps
+            )
+        return self._session
+
+    async def async_shutdown(self) -> None:
+        """
+        Release everything the coordinator holds.
+
+        The base class cancels the refresh debouncer and scheduled polls;
+        this also stops the event stream, cancels queued zone commands and
+        closes the HTTP session.
+        """
+        await super().async_shutdown()
+        if self._event_task is not None:
+            self._event_task.cancel()
+            self._event_task = None
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        for _, future in self._pending:
+            future.cancel()
+        self._pending = []
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    @callback
+    def async_start_event_stream(self, entry: ConfigEntry) -> None:
+        """Start applying state changes pushed by the API's WebSocket."""
+        self._event_task = entry.async_create_background_task(
+            self.hass, self._async_event_stream(), f"{DOMAIN} event stream"
         )
 
+    async def _async_event_stream(self) -> None:
+        """Listen for state changes, reconnecting whenever the stream drops."""
+        while True:
+            try:
+                async with self._get_session().ws_connect("/ws") as ws:
+                    # Resync whatever changed while the stream was down
+                    await self.async_request_refresh()
+                    async for msg in ws:
+                        if msg.type is aiohttp.WSMsgType.TEXT:
+                            self._async_apply_event(msg.json(loads=orjson.loads))
+                        elif msg.type is aiohttp.WSMsgType.ERROR:
+                            break
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as err:
+                _LOGGER.debug("Event stream from %s unavailable: %s", self.base_url, err)
+            except asyncio.CancelledError:
+                raise
+            except Exception:  # Keep the stream alive whatever goes wrong
+                _LOGGER.exception("Unexpected error in event stream from %s", self.base_url)
+
+            await asyncio.sleep(EVENT_RECONNECT_DELAY)
+
+    @callback
+    def _async_apply_event(self, event: dict) -> None:
+        """Patch cached zone data from a state_change event."""
+        if event.get("type") != "state_change" or not self.data:
+            return
+
+        field = _EVENT_FIELDS.get(event.get("property"))
+        zone = self.data["zones_by_id"].get(event.get("target"))
+        if field is None or zone is None:
+            return
+
+        name, convert = field
+        try:
+            zone[name] = convert(event["value"])
+        except (KeyError, ValueError):
+            return
+
+        if name == "party_mode":
+            self.data["party_mode"] = _party_mode_on(self.data["zones"])
+
+        self._etags.pop("zones", None)
+        self.async_set_updated_data(self.data)
+
     async def _async_update_data(self):
         """Fetch data from API."""
-        try:
-            async with aiohttp.ClientSession() as session:
-                # Get zones
-                async with session.get(f"{self.base_url}/zones") as resp:
-                    zones = await resp.json()
+        session = self._get_session()
 
-                # Get sources
-                async with session.get(f"{self.base_url}/sources") as resp:
-                    sources = await resp.json()
+        async def _get_json(key: str):
+            # Conditional GET: unchanged data comes back as an empty 304
+            headers = {}
+            if self.data and key in self._etags:
+                headers["If-None-Match"] = self._etags[key]
 
-                return {"zones": zones, "sources": sources}
+            async with session.get(_COLLECTION_PATHS[key], headers=headers) as resp:
+                if resp.status == 304:
+                    return self.data[key]
+                resp.raise_for_status()
+                if etag := resp.headers.get("ETag"):
+                    self._etags[key] = etag
+                return orjson.loads(await resp.read())
+
+        try:
+            # Zones and sources are independent - fetch them concurrently
+            zones, sources = await asyncio.gather(
+                _get_json("zones"), _get_json("sources")
+            )
+            # Sources rarely change; keep the previous name list when they don't
+            if self.data and self.data.get("sources") == sources:
+                source_names = self.data["source_names"]
+            else:
+                source_names = [s["name"] for s in sources]
+
+            return {
+                "zones": zones,
+                "sources": sources,
+                # Lookup tables so entities don't scan the lists on every read
+                "zones_by_number": {z["zone_number"]: z for z in zones},
+                "zones_by_id": {z["zone_id"]: z for z in zones},
+                "sources_by_name": {s["name"]: s for s in sources},
+                # Shared by every zone entity's source_list
+                "source_names": source_names,
+                # Read by the party mode switch on every state write
+                "party_mode": _party_mode_on(zones),
+            }
 
         except Exception as err:
             raise UpdateFailed(f"Error communicating with API: {err}")
 
+    def async_patch_zone(self, zone_number: int, **fields) -> None:
+        """
+        Optimistically apply a change to the cached zone data.
+
+        The zones ETag is dropped so the next poll fetches the full list
+        and corrects the patch if the device disagrees.
+        """
+        zone = self.data.get("zones_by_number", {}).get(zone_number)
+        if zone is not None:
+            zone.update(fields)
+        self._etags.pop("zones", None)
+        self.async_update_listeners()
+
     async def power_on(self, zone_number: int) -> None:
         """Turn zone on."""
-        await self._api_request("POST", f"/zones/{zone_number}/power/on")
+        await self._queue_zone_op(zone_number, "power_on")
 
     async def power_off(self, zone_number: int) -> None:
         """Turn zone off."""
-        await self._api_request("POST", f"/zones/{zone_number}/power/off")
+        await self._queue_zone_op(zone_number, "power_off")
 
     async def set_volume(self, zone_number: int, volume: int) -> None:
         """Set zone volume."""
-        await self._api_request(
-            "POST",
-            f"/zones/{zone_number}/volume",
-            json={"volume": volume}
-        )
+        await self._queue_zone_op(zone_number, "volume", volume)
 
     async def mute_toggle(self, zone_number: int) -> None:
         """Toggle zone mute."""
-        await self._api_request("POST", f"/zones/{zone_number}/mute")
+        await self._queue_zone_op(zone_number, "mute")
 
     async def set_source(self, zone_number: int, source_guid: str) -> None:
         """Set zone source."""
-        await self._api_request(
-            "POST",
-            f"/zones/{zone_number}/source",
-            json={"source_guid": source_guid}
+        await self._queue_zone_op(zone_number, "source", source_guid)
+
+    def _queue_zone_op(
+        self, zone_number: int, op: str, value: int | str | None = None
+    ) -> asyncio.Future:
+        """
+        Queue a zone command for the next bulk request.
+
+        Commands issued within COMMAND_BATCH_WINDOW of each other share one
+        POST; the returned future resolves once this command has been sent.
+        """
+        future = self.hass.loop.create_future()
+        self._pending.append(({"zone": zone_number, "op": op, "value": value}, future))
+        if self._flush_handle is None:
+            self._flush_handle = self.hass.loop.call_later(
+                COMMAND_BATCH_WINDOW, self._flush_pending
+            )
+        return future
+
+    @callback
+    def _flush_pending(self) -> None:
+        """Send every queued zone command."""
+        self._flush_handle = None
+        pending, self._pending = self._pending, []
+        self.hass.async_create_background_task(
+            self._async_send_zone_ops(pending), f"{DOMAIN} zone commands"
         )
 
+    async def _async_send_zone_ops(
+        self, pending: list[tuple[dict, asyncio.Future]]
+    ) -> None:
+        """Send queued commands in one bulk request, or one by one as a fallback."""
+        if self._bulk_supported:
+            try:
+                sent = await self._api_bulk_request([op for op, _ in pending])
+            except Exception as err:
+                for _, future in pending:
+                    if not future.done():
+                        future.set_exception(err)
+                return
+
+            if sent:
+                for _, future in pending:
+                    if not future.done():
+                        future.set_result(None)
+                return
+
+            _LOGGER.debug("API has no bulk zone endpoint, sending commands singly")
+            self._bulk_supported = False
+
+        for op, future in pending:
+            endpoint, key = _OP_ENDPOINTS[op["op"]]
+            kwargs = {"json": {key: op["value"]}} if key else {}
+            try:
+                await self._api_request(
+                    "POST", f"/api/zones/{op['zone']}{endpoint}", **kwargs
+                )
+            except Exception as err:
+                if not future.done():
+                    future.set_exception(err)
+            else:
+                if not future.done():
+                    future.set_result(None)
+
+    async def _api_bulk_request(self, ops: list[dict]) -> bool:
+        """POST zone commands to /zones/bulk; False if the endpoint is missing."""
+        try:
+            async with self._get_session().post("/api/zones/bulk", json=ops) as resp:
+                # Older APIs answer 404, or 405 via the GET /zones/{zone_number} route
+                if resp.status in (404, 405):
+                    return False
+                resp.raise_for_status()
+                return True
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            raise HomeAssistantError(f"API request failed: {err}") from err
+
     async def toggle_party_mode(self) -> None:
         """Toggle party mode."""
-        await self._api_request("POST", "/control/partymode")
+        await self._api_request("POST", "/api/control/partymode")
 
-    async def _api_request(self, method: str, endpoint: str, **kwargs) -> None:
+    async def _api_request(self, method: str, path: str, **kwargs) -> None:
         """Make API request."""
-        url = f"{self.base_url}{endpoint}"
-
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.request(method, url, **kwargs) as resp:
-                    resp.raise_for_status()
-        except Exception as err:
-            _LOGGER.error("API request failed: %s", err)
-            raise
+            async with self._get_session().request(method, path, **kwargs) as resp:
+                resp.raise_for_status()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            raise HomeAssistantError(f"API request failed: {err}") from err
@@ -1,5 +1,7 @@
 """Media player platform for NuVo MusicPort."""
 
+import asyncio
+from dataclasses import dataclass
 import logging
 from typing import Any
 
@@ -9,7 +11,7 @@ from homeassistant.components.media_player import (
     MediaPlayerState,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -19,6 +21,19 @@ from .coordinator import NuVoCoordinator
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, slots=True)
+class VolumeScale:
+    """A zone's max volume and its reciprocal, for 0..1 scaling."""
+
+    max_volume: int
+    inverse: float
+
+    @classmethod
+    def for_max(cls, max_volume: int) -> "VolumeScale":
+        """Build the scale for a zone's max volume."""
+        return cls(max_volume, 1.0 / max_volume)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -53,88 +68,118 @@ class NuVoZone(CoordinatorEntity, MediaPlayerEntity):
         self._zone_number = zone["zone_number"]
         self._attr_unique_id = f"nuvo_zone_{self._zone_number}"
         self._attr_name = zone["name"]
-
-    @property
-    def zone_data(self) -> dict:
-        """Get current zone data from coordinator."""
-        zones = self.coordinator.data.get("zones", [])
-        return next(
-            (z for z in zones if z["zone_number"] == self._zone_number),
-            {}
+        # This zone's entry in coordinator data, refreshed on each update
+        self._zone: dict = zone
+        self._scale = VolumeScale.for_max(zone.get("max_volume", 79))
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Look up this zone once per update rather than on every property read."""
+        self._zone = self.coordinator.data.get("zones_by_number", {}).get(
+            self._zone_number, {}
         )
+        max_volume = self._zone.get("max_volume", 79)
+        if max_volume != self._scale.max_volume:
+            self._scale = VolumeScale.for_max(max_volume)
+        super()._handle_coordinator_update()
 
     @property
     def state(self) -> MediaPlayerState:
         """Return the state of the zone."""
-        if self.zone_data.get("is_on"):
+        if self._zone.get("is_on"):
             return MediaPlayerState.ON
         return MediaPlayerState.OFF
 
     @property
     def volume_level(self) -> float:
         """Volume level (0..1)."""
-        volume = self.zone_data.get("volume", 0)
-        max_volume = self.zone_data.get("max_volume", 79)
-        return volume / max_volume
+        return self._zone.get("volume", 0) * self._scale.inverse
 
     @property
     def is_volume_muted(self) -> bool:
         """Return if volume is muted."""
-        return self.zone_data.get("mute", False)
+        return self._zone.get("mute", False)
 
     @property
     def source(self) -> str:
         """Return the current source."""
-        return self.zone_data.get("source_name", "")
+        return self._zone.get("source_name", "")
 
     @property
     def source_list(self) -> list[str]:
         """List of available sources."""
-        sources = self.coordinator.data.get("sources", [])
-        return [s["name"] for s in sources]
+        return self.coordinator.data.get("source_names", [])
+
+    def _patch_zone(self, **fields: Any) -> None:
+        """
+        Optimistically apply a change to the cached zone data.
+
+        Avoids refetching every zone after each command; the periodic
+        coordinator refresh remains the source of truth.
+        """
+        self.coordinator.async_patch_zone(self._zone_number, **fields)
 
     async def async_turn_on(self) -> None:
         """Turn the zone on."""
         await self.coordinator.power_on(self._zone_number)
-        await self.coordinator.async_request_refresh()
+        self._patch_zone(is_on=True)
 
     async def async_turn_off(self) -> None:
         """Turn the zone off."""
         await self.coordinator.power_off(self._zone_number)
-        await self.coordinator.async_request_refresh()
+        self._patch_zone(is_on=False)
 
     async def async_set_volume_level(self, volume: float) -> None:
         """Set volume level (0..1)."""
-        max_volume = self.zone_data.get("max_volume", 79)
-        nuvo_volume = int(volume * max_volume)
+        nuvo_volume = int(volume * self._scale.max_volume)
         await self.coordinator.set_volume(self._zone_number, nuvo_volume)
-        await self.coordinator.async_request_refresh()
+        self._patch_zone(volume=nuvo_volume)
 
     async def async_volume_up(self) -> None:
         """Volume up."""
-        current = self.zone_data.get("volume", 0)
-        max_volume = self.zone_data.get("max_volume", 79)
-        new_volume = min(current + 5, max_volume)
-        await self.coordinator.set_volume(self._zone_number, new_volume)
-        await self.coordinator.async_request_refresh()
+        self._step_volume(min(self._zone.get("volume", 0) + 5, self._scale.max_volume))
 
     async def async_volume_down(self) -> None:
         """Volume down."""
-        current = self.zone_data.get("volume", 0)
-        new_volume = max(current - 5, 0)
-        await self.coordinator.set_volume(self._zone_number, new_volume)
-        await self.coordinator.async_request_refresh()
+        self._step_volume(max(self._zone.get("volume", 0) - 5, 0))
+
+    def _step_volume(self, new_volume: int) -> None:
+        """
+        Patch the new volume and send it without waiting for the API.
+
+        Repeated button presses then step from the patched value instead
+        of waiting a round trip each. If the API call fails, the error is
+        logged and the coordinator refetches the real volume.
+        """
+        self._patch_zone(volume=new_volume)
+        task = self.hass.async_create_background_task(
+            self.coordinator.set_volume(self._zone_number, new_volume),
+            f"{DOMAIN} zone {self._zone_number} volume",
+        )
+        task.add_done_callback(self._async_volume_step_done)
+
+    @callback
+    def _async_volume_step_done(self, task: asyncio.Task) -> None:
+        """Undo a failed volume step by refreshing from the API."""
+        if task.cancelled() or (err := task.exception()) is None:
+            return
+        _LOGGER.error("Failed to set volume for zone %s: %s", self._zone_number, err)
+        self.hass.async_create_task(self.coordinator.async_request_refresh())
 
     async def async_mute_volume(self, mute: bool) -> None:
         """Mute the volume."""
+        # The device only supports toggling, so skip if already in that state
+        if self.is_volume_muted == mute:
+            return
         await self.coordinator.mute_toggle(self._zone_number)
-        await self.coordinator.async_request_refresh()
+        self._patch_zone(mute=mute)
 
     async def async_select_source(self, source: str) -> None:
         """Select source."""
-        sources = self.coordinator.data.get("sources", [])
-        source_data = next((s for s in sources if s["name"] == source), None)
+        source_data = self.coordinator.data.get("sources_by_name", {}).get(source)
 
         if source_data:
             await self.coordinator.set_source(self._zone_number, source_data["guid"])
-            await self.coordinator.async_request_refresh()
+            self._patch_zone(
+                source_id=source_data["source_id"], source_name=source_data["name"]
+            )
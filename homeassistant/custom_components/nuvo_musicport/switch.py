@@ -40,18 +40,23 @@ class NuVoPartyModeSwitch(CoordinatorEntity, SwitchEntity):
     @property
     def is_on(self) -> bool:
         """Return if party mode is on."""
-        zones = self.coordinator.data.get("zones", [])
-        # Party mode is on if any zone reports party mode active
-        return any(z.get("party_mode") not in ["Off", ""] for z in zones)
+        return self.coordinator.data.get("party_mode", False)
 
     async def async_turn_on(self, **kwargs) -> None:
         """Turn party mode on."""
         if not self.is_on:
             await self.coordinator.toggle_party_mode()
-            await self.coordinator.async_request_refresh()
+            self._async_refresh_in_background()
 
     async def async_turn_off(self, **kwargs) -> None:
         """Turn party mode off."""
         if self.is_on:
             await self.coordinator.toggle_party_mode()
-            await self.coordinator.async_request_refresh()
+            self._async_refresh_in_background()
+
+    def _async_refresh_in_background(self) -> None:
+        """Request a refresh without waiting on the debouncer cooldown."""
+        self.hass.async_create_background_task(
+            self.coordinator.async_request_refresh(),
+            f"{DOMAIN} party mode refresh",
+        )
@@ -2,8 +2,10 @@
 
 import asyncio
 import logging
+import socket
 import time
-from typing import List, Optional, Callable
+from collections import deque
+from typing import Deque, List, Optional, Callable, Tuple, Union
 
 logger = logging.getLogger(__name__)
 from .models import Zone, Source, SystemStatus, StateChangeEvent
@@ -19,6 +21,33 @@ from .events import EventManager
 from .exceptions import ConnectionError, ProtocolError, CommandError
 
 
+# Separates lines in the raw response buffer. ASCII record separator, so it
+# can't collide with line breaks inside multi-line XML.
+RESPONSE_LINE_SEP = b"\x1e"
+RESPONSE_LINE_SEP_STR = RESPONSE_LINE_SEP.decode()
+
+# A bare acknowledgement of a setup or control command, and the ending of a
+# line closing an XML element (which ends a read's response). The ack must
+# match exactly, since a status value may itself end in "Ok".
+RESPONSE_OK = b"Ok"
+RESPONSE_XML_END = b">"
+
+# Opening and closing tags of XML list responses
+XML_LIST_TAGS = ((b"<Zones", b"</Zones>"), (b"<Sources", b"</Sources>"))
+
+
+def set_nodelay(writer: asyncio.StreamWriter) -> None:
+    """
+    Disable Nagle's algorithm on a stream's socket.
+
+    Commands are a few bytes each; without TCP_NODELAY they can sit behind
+    the peer's delayed ACK for tens of milliseconds.
+    """
+    sock = writer.get_extra_info("socket")
+    if sock is not None:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+
 class NuVoClient:
     """
     Async client for NuVo MusicPort MRAD protocol (port 5006).
@@ -37,6 +66,35 @@ class NuVoClient:
     READ_TIMEOUT = 10.0
     COMMAND_TIMEOUT = 5.0
 
+    # Longest a control command waits for the device to react before the
+    # next command may be sent
+    CONTROL_ACK_TIMEOUT = 0.1
+
+    # StreamReader buffer limit; large XML lists exceed the 64 KiB default
+    STREAM_LIMIT = 1 << 20
+
+    # Events buffered for subscribers before the oldest are dropped
+    EVENT_QUEUE_SIZE = 1024
+
+    # A response without a terminator line ends after this much silence
+    RESPONSE_IDLE_TIMEOUT = 0.5
+
+    # How long a GetStatus response may be reused by get_zones
+    STATUS_CACHE_TTL = 0.5
+
+    # Pre-encoded control commands; templates take integer arguments
+    _CMD_POWER_ON = b"Power On %d\r"
+    _CMD_POWER_OFF = b"Power Off %d\r"
+    _CMD_VOLUME = b"Volume %d\r"
+    _CMD_VOLUME_ZONE = b"Volume %d %d\r"
+    _CMD_MUTE_TOGGLE = build_command("Mute Toggle")
+    _CMD_MUTE_TOGGLE_ZONE = b"Mute Toggle %d\r"
+    _CMD_PARTY_MODE_TOGGLE = build_command("PartyMode Toggle")
+    _CMD_ALL_OFF = build_command("AllOff")
+
+    # Sent once after the wake-up command on every new connection
+    INIT_COMMANDS = ("SetXMLMode Lists", "SubscribeEvents smart")
+
     def __init__(self, host: Optional[str] = None, port: int = DEFAULT_PORT):
         """
         Initialize NuVo client.
@@ -51,27 +109,54 @@ class NuVoClient:
         self._reader: Optional[asyncio.StreamReader] = None
         self._writer: Optional[asyncio.StreamWriter] = None
         self._connected = False
+        # Set by disconnect() so the listener treats EOF as expected
+        self._closing = False
         self._listener_task: Optional[asyncio.Task] = None
+        self._dispatcher_task: Optional[asyncio.Task] = None
         self._event_manager = EventManager()
 
-        # Response queue for command replies - listener puts responses here
-        # Lazy-initialized to avoid event loop issues
-        self._response_queue: Optional[asyncio.Queue] = None
-        self._waiting_for_response = False
-
-        # Lock to serialize command execution (prevent concurrent requests)
-        # Lazy-initialized to avoid event loop issues
+        # Events waiting for the dispatcher, so slow subscribers never stall
+        # the socket reader. Created per connection.
+        self._event_queue: Optional[asyncio.Queue] = None
+
+        # One future per command awaiting a response, oldest first. The
+        # listener appends raw lines to _response_buffer and resolves the
+        # oldest future when a terminator line arrives; the buffer is
+        # decoded once per response rather than once per line.
+        self._pending_responses: Deque[asyncio.Future] = deque()
+        self._response_buffer = bytearray()
+        self._last_response_line = 0.0
+
+        # Locks, lazy-initialized to avoid event loop issues:
+        # _command_lock serializes commands that read a response,
+        # _control_lock serializes control commands (one ack at a time),
+        # _write_lock serializes socket writes and drains between them.
+        # Control commands don't take _command_lock, so they never queue
+        # behind a slow BrowseZones/GetStatus read.
         self._command_lock: Optional[asyncio.Lock] = None
+        self._control_lock: Optional[asyncio.Lock] = None
+        self._write_lock: Optional[asyncio.Lock] = None
+
+        # Resolved by the listener with the first line after a control
+        # command that can only be its reaction: a StateChanged event, or
+        # an "Ok" while no read is pending
+        self._control_ack: Optional[asyncio.Future] = None
+
+        # Last GetStatus response as (monotonic time, lines); cleared by
+        # control commands so a cached status never hides a change
+        self._last_status: Tuple[float, List[str]] = (0.0, [])
 
         # Active zone context (for commands that don't specify zone)
         self._active_zone: Optional[str] = None
 
     def _ensure_async_resources(self):
         """Ensure asyncio resources are created in the event loop context."""
-        if self._response_queue is None:
-            self._response_queue = asyncio.Queue()
         if self._command_lock is None:
             self._command_lock = asyncio.Lock()
+        if self._control_lock is None:
+            self._control_lock = asyncio.Lock()
+        if self._write_lock is None:
+            self._write_lock = asyncio.Lock()
 
     async def connect(self, host: Optional[str] = None, port: Optional[int] = None) -> None:
         """
@@ -97,9 +182,10 @@ class NuVoClient:
 
         try:
             self._reader, self._writer = await asyncio.wait_for(
-                asyncio.open_connection(self.host, self.port),
+                asyncio.open_connection(self.host, self.port, limit=self.STREAM_LIMIT),
                 timeout=self.COMMAND_TIMEOUT,
             )
+            set_nodelay(self._writer)
             self._connected = True
             logger.info(f"[NuVoClient] TCP connection established to {self.host}:{self.port}")
 
@@ -107,7 +193,11 @@ class NuVoClient:
             await self._initialize()
             logger.info(f"[NuVoClient] Initialization complete for {self.host}:{self.port}")
 
-            # Start background listener for events
+            # Start background listener for events. A connection the device
+            # dropped leaves its dispatcher waiting on the old queue.
+            await self._stop_dispatcher()
+            self._event_queue = asyncio.Queue(maxsize=self.EVENT_QUEUE_SIZE)
+            self._dispatcher_task = asyncio.create_task(self._event_dispatcher())
             self._listener_task = asyncio.create_task(self._event_listener())
 
         except asyncio.TimeoutError:
@@ -119,38 +209,53 @@ class NuVoClient:
         """Close connection to device."""
         logger.info(f"[NuVoClient] Disconnecting from {self.host}:{self.port}")
         self._connected = False
+        self._closing = True
 
-        # Cancel listener task
-        if self._listener_task:
-            self._listener_task.cancel()
-            try:
-                await self._listener_task
-            except asyncio.CancelledError:
-                pass
-            self._listener_task = None
-
-        # Close connection
+        # Closing our end feeds EOF to the reader, so the listener handles
+        # anything already received and then exits on its own
         if self._writer:
             self._writer.close()
             try:
                 await self._writer.wait_closed()
-            except:
-                pass
-            self._writer = None
-            self._reader = None
+            except OSError as e:
+                logger.debug(f"[NuVoClient] Error closing connection to {self.host}:{self.port}: {e}")
+
+        if self._listener_task:
+            try:
+                await asyncio.wait_for(self._listener_task, timeout=self.COMMAND_TIMEOUT)
+            except asyncio.TimeoutError:
+                logger.warning(f"[NuVoClient] Event listener for {self.host}:{self.port} did not stop, cancelled it")
+            self._listener_task = None
+
+        await self._stop_dispatcher()
+
+        self._writer = None
+        self._reader = None
+        self._closing = False
 
         logger.info(f"[NuVoClient] Disconnected from {self.host}:{self.port}")
 
+    async def _stop_dispatcher(self) -> None:
+        """Stop the event dispatcher of the current or a dropped connection."""
+        # The dispatcher only waits on the event queue; nothing to drain
+        if self._dispatcher_task:
+            self._dispatcher_task.cancel()
+            try:
+                await self._dispatcher_task
+            except asyncio.CancelledError:
+                pass
+            self._dispatcher_task = None
+
     async def _initialize(self) -> None:
         """Send initialization commands to device."""
-        # Send wake-up command
-        self._writer.write(b"*\r")
+        # Send wake-up and protocol setup in a single write instead of
+        # waiting on the banner between them
+        self._writer.write(b"*\r" + b"".join(build_command(c) for c in self.INIT_COMMANDS))
         await self._writer.drain()
-        await asyncio.sleep(0.2)
 
         # Read welcome banner
         try:
-            banner = await asyncio.wait_for(
+            await asyncio.wait_for(
                 self._reader.readuntil(b"\x07"),  # Bell character at end of banner
                 timeout=3.0,
             )
@@ -158,36 +263,25 @@ class NuVoClient:
             # If no banner, that's okay
             pass
 
-        # Clear any remaining init data
+        # Read init responses until each setup command is acknowledged,
+        # or the device goes quiet
+        acks = 0
         try:
-            while True:
-                line = await asyncio.wait_for(self._reader.readline(), timeout=0.1)
-                if not line:
-                    break
-        except asyncio.TimeoutError:
-            pass
-
-        # Initialize protocol - send batch command
-        init_cmd = "SetXMLMode Lists\rSubscribeEvents smart\r"
-        self._writer.write(init_cmd.encode("utf-8"))
-        await self._writer.drain()
-
-        # Read init responses
-        await asyncio.sleep(0.3)
-        try:
-            while True:
+            while acks < len(self.INIT_COMMANDS):
                 line = await asyncio.wait_for(self._reader.readline(), timeout=0.2)
                 if not line:
                     break
+                if line.strip() == RESPONSE_OK:
+                    acks += 1
         except asyncio.TimeoutError:
             pass
 
-    async def _send_command(self, command: str) -> None:
+    async def _send_command(self, command: Union[str, bytes]) -> None:
         """
         Send a command to the device.
 
         Args:
-            command: Command string
+            command: Command string, or already-encoded bytes ending in \\r
 
         Raises:
             ConnectionError: If not connected
@@ -197,64 +291,88 @@ class NuVoClient:
             raise ConnectionError("Not connected to device")
 
         try:
-            cmd_bytes = build_command(command)
-            self._writer.write(cmd_bytes)
-            await self._writer.drain()
+            cmd_bytes = command if isinstance(command, bytes) else build_command(command)
+            async with self._write_lock:
+                self._writer.write(cmd_bytes)
+                await self._writer.drain()
         except OSError as e:
             logger.error(f"[NuVoClient] Connection lost during send to {self.host}:{self.port}: {e}")
             self._connected = False
             raise CommandError(f"Failed to send command: {e}")
 
-    async def _read_response(self, timeout: float = COMMAND_TIMEOUT) -> List[str]:
-        """
-        Read response lines from device via the queue populated by listener.
+    def _expect_response(self) -> asyncio.Future:
+        """Register a future for the next command response."""
+        future = asyncio.get_running_loop().create_future()
+        self._pending_responses.append(future)
+        return future
 
-        Args:
-            timeout: Read timeout in seconds
+    def _finish_response(self, future: asyncio.Future) -> List[str]:
+        """
+        Complete a response with whatever lines have arrived so far.
 
-        Returns:
-            List of response lines
+        Used when a response has no terminator line (e.g. GetStatus) or the
+        device stops sending.
         """
-        # Signal listener that we're waiting for a command response
-        self._waiting_for_response = True
+        if future.done():
+            return future.result()
 
-        lines = []
-        start_time = time.time()
+        lines: List[str] = []
+        if self._pending_responses and self._pending_responses[0] is future:
+            self._pending_responses.popleft()
+            lines = self._take_response()
+        future.set_result(lines)
+        return lines
 
-        try:
-            while time.time() - start_time < timeout:
-                remaining = timeout - (time.time() - start_time)
-                if remaining <= 0:
-                    break
+    def _take_response(self) -> List[str]:
+        """Decode the buffered response into lines and reset the buffer."""
+        data, self._response_buffer = self._response_buffer, bytearray()
+        return data.decode("utf-8", errors="ignore").split(RESPONSE_LINE_SEP_STR)[:-1]
 
-                try:
-                    # Get lines from queue (populated by listener)
-                    line = await asyncio.wait_for(
-                        self._response_queue.get(),
-                        timeout=min(remaining, 0.5)
-                    )
+    def _clear_pending_responses(self) -> None:
+        """Drop futures and buffered lines left over from a finished command."""
+        for future in self._pending_responses:
+            future.cancel()
+        self._pending_responses.clear()
+        self._response_buffer = bytearray()
 
-                    if line is None:  # Sentinel for end of response
-                        break
+    async def _read_response(
+        self, future: asyncio.Future, timeout: float = COMMAND_TIMEOUT
+    ) -> List[str]:
+        """
+        Wait for the listener to complete a command response.
 
-                    lines.append(line)
+        A response ends at a terminator line (one ending in ">").
+        Without one, it ends once the device has been idle for
+        RESPONSE_IDLE_TIMEOUT after sending at least one line, or when
+        timeout expires.
 
-                    # Check if this looks like end of response
-                    if line.endswith(">") or line == "Ok":
-                        break
+        Args:
+            future: Future returned by _expect_response for this command
+            timeout: Read timeout in seconds
 
-                except asyncio.TimeoutError:
-                    # No more data available
-                    if lines:
-                        break
-                    continue
+        Returns:
+            List of response lines
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
 
-        except Exception as e:
-            raise ProtocolError(f"Failed to read response: {e}")
-        finally:
-            self._waiting_for_response = False
+        while (remaining := deadline - loop.time()) > 0:
+            try:
+                return await asyncio.wait_for(
+                    asyncio.shield(future),
+                    timeout=min(remaining, self.RESPONSE_IDLE_TIMEOUT),
+                )
+            except asyncio.TimeoutError:
+                # Unterminated response: done once the device goes quiet
+                if (
+                    self._response_buffer
+                    and self._pending_responses
+                    and self._pending_responses[0] is future
+                    and loop.time() - self._last_response_line >= self.RESPONSE_IDLE_TIMEOUT
+                ):
+                    break
 
-        return lines
+        return self._finish_response(future)
 
     async def _execute_command(self, command: str, timeout: float = COMMAND_TIMEOUT) -> List[str]:
         """
@@ -277,39 +395,157 @@ class NuVoClient:
             self._ensure_async_resources()
 
         async with self._command_lock:
-            await self._send_command(command)
-            return await self._read_response(timeout)
+            # Register before sending so no response line can be missed
+            future = self._expect_response()
+            try:
+                await self._send_command(command)
+                return await self._read_response(future, timeout)
+            finally:
+                self._clear_pending_responses()
+
+    async def _execute_pipeline(
+        self, commands: List[str], timeout: float = COMMAND_TIMEOUT
+    ) -> List[List[str]]:
+        """
+        Send several commands in one write, then read their responses in order.
+
+        The device answers commands in the order received, so one round trip
+        replaces one per command. Each response is delimited the same way as
+        in _read_response, so a command whose response has no terminator
+        (e.g. GetStatus) should go last.
+
+        Args:
+            commands: Command strings to send
+            timeout: Read timeout per response in seconds
+
+        Returns:
+            One list of response lines per command
+
+        Raises:
+            ConnectionError: If not connected
+            CommandError: If sending fails
+            ProtocolError: If response parsing fails
+        """
+        if self._command_lock is None:
+            self._ensure_async_resources()
+
+        async with self._command_lock:
+            futures = [self._expect_response() for _ in commands]
+            try:
+                await self._send_command("\r".join(commands))
+                return [await self._read_response(f, timeout) for f in futures]
+            finally:
+                self._clear_pending_responses()
+
+    async def _execute_control(self, command: Union[str, bytes]) -> None:
+        """
+        Send a control command and wait for the device to react.
+
+        Control commands have no response body; a StateChanged event, or an
+        "Ok" while no read is in flight, shows the device has processed it.
+        Lines of a concurrent read's response never count. If nothing
+        arrives within CONTROL_ACK_TIMEOUT the command is assumed applied,
+        as before.
+
+        Args:
+            command: Command string or encoded bytes to send
+
+        Raises:
+            ConnectionError: If not connected
+            CommandError: If command fails
+        """
+        if self._control_lock is None:
+            self._ensure_async_resources()
+
+        async with self._control_lock:
+            self._last_status = (0.0, [])
+            self._control_ack = asyncio.get_running_loop().create_future()
+            try:
+                await self._send_command(command)
+                await asyncio.wait_for(self._control_ack, self.CONTROL_ACK_TIMEOUT)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                self._control_ack = None
+
+    def _resolve_control_ack(self, line: bytes) -> None:
+        """Complete the pending control command's ack, if any."""
+        if self._control_ack is not None and not self._control_ack.done():
+            self._control_ack.set_result(line)
+
+    def _queue_event(self, event: StateChangeEvent) -> None:
+        """Hand an event to the dispatcher, dropping the oldest if backed up."""
+        if self._event_queue.full():
+            self._event_queue.get_nowait()
+            logger.warning(f"[NuVoClient] Event queue full for {self.host}:{self.port}, dropped oldest event")
+        self._event_queue.put_nowait(event)
+
+    async def _event_dispatcher(self) -> None:
+        """Background task delivering queued events to subscribers."""
+        while True:
+            event = await self._event_queue.get()
+            await self._event_manager.notify(event)
 
     async def _event_listener(self) -> None:
         """
         Background task to listen for all incoming data.
-        Routes command responses to queue and events to subscribers.
+        Routes command responses to pending futures and events to subscribers.
         """
         logger.info(f"[NuVoClient] Event listener started for {self.host}:{self.port}")
-        while self._connected:
+        while True:
             try:
                 line = await self._reader.readline()
                 if not line:
                     # Connection closed
-                    logger.warning(f"[NuVoClient] Connection closed by device {self.host}:{self.port} (readline returned empty)")
+                    if not self._closing:
+                        logger.warning(f"[NuVoClient] Connection closed by device {self.host}:{self.port} (readline returned empty)")
                     self._connected = False
                     break
 
-                decoded = line.decode("utf-8", errors="ignore").strip()
-                if not decoded:
+                # Read the rest of an XML list that spans several lines in
+                # one call, so it reaches the parser as a single response
+                if line.startswith(b"<"):
+                    for opening, closing in XML_LIST_TAGS:
+                        if (
+                            line.startswith(opening)
+                            and closing not in line
+                            and not line.rstrip().endswith(b"/>")
+                        ):
+                            line += await self._reader.readuntil(closing)
+                            break
+
+                # Route on the raw bytes; only events and command responses
+                # are decoded
+                line = line.strip()
+                if not line:
                     continue
 
-                # Route based on content and whether we're waiting for response
-                if decoded.startswith("StateChanged"):
+                if line.startswith(b"StateChanged"):
+                    self._resolve_control_ack(line)
                     # This is an event - always broadcast
-                    event = parse_state_changed(decoded)
+                    event = parse_state_changed(line.decode("utf-8", errors="ignore"))
                     if event:
                         event.timestamp = time.time()
-                        await self._event_manager.notify(event)
-
-                elif self._waiting_for_response:
-                    # This is part of a command response - put in queue
-                    await self._response_queue.put(decoded)
+                        self._queue_event(event)
+
+                elif line == RESPONSE_OK:
+                    # Only control commands answer with a bare "Ok"; reads end
+                    # on their XML or go idle. During a read it may be a late
+                    # ack of an earlier control, so it neither ends the read
+                    # nor acknowledges the current control.
+                    if not self._pending_responses:
+                        self._resolve_control_ack(line)
+
+                elif self._pending_responses:
+                    # This is part of a command response
+                    self._response_buffer += line
+                    self._response_buffer += RESPONSE_LINE_SEP
+                    self._last_response_line = asyncio.get_running_loop().time()
+                    if line.endswith(RESPONSE_XML_END):
+                        future = self._pending_responses.popleft()
+                        lines = self._take_response()
+                        if not future.done():
+                            future.set_result(lines)
 
                 else:
                     # Unsolicited data (banner, prompts, etc.) - ignore or log
@@ -318,6 +554,10 @@ class NuVoClient:
             except asyncio.CancelledError:
                 logger.info(f"[NuVoClient] Event listener cancelled for {self.host}:{self.port}")
                 break
+            except asyncio.IncompleteReadError:
+                # Connection closed partway through a multi-line response
+                self._connected = False
+                break
             except Exception as e:
                 logger.error(f"[NuVoClient] Error in event listener for {self.host}:{self.port}: {e}")
                 await asyncio.sleep(1.0)
@@ -326,6 +566,17 @@ class NuVoClient:
 
     # Discovery methods
 
+    def _cached_status(self) -> Optional[List[str]]:
+        """Return the last GetStatus response if it is recent enough to reuse."""
+        fetched_at, lines = self._last_status
+        if lines and time.monotonic() - fetched_at < self.STATUS_CACHE_TTL:
+            return lines
+        return None
+
+    def _store_status(self, lines: List[str]) -> None:
+        """Remember a GetStatus response for STATUS_CACHE_TTL seconds."""
+        self._last_status = (time.monotonic(), lines)
+
     async def get_zones(self) -> List[Zone]:
         """
         Get all zones from the device.
@@ -340,7 +591,16 @@ class NuVoClient:
         # Retry logic for reliability
         for attempt in range(3):
             try:
-                response = await self._execute_command("BrowseZones", timeout=10.0)
+                # Reuse a recent GetStatus; otherwise fetch it in the same
+                # round trip as BrowseZones
+                status_response = self._cached_status()
+                if status_response is None:
+                    response, status_response = await self._execute_pipeline(
+                        ["BrowseZones", "GetStatus"], timeout=10.0
+                    )
+                    self._store_status(status_response)
+                else:
+                    response = await self._execute_command("BrowseZones", timeout=10.0)
 
                 # Find XML response
                 xml_data = "".join(response)
@@ -353,10 +613,7 @@ class NuVoClient:
                 # Parse zones
                 zones = parse_zones_xml(xml_data)
 
-                # Get detailed status to fill in volume, mute, etc.
-                status_response = await self._execute_command("GetStatus", timeout=5.0)
-
-                # Update zones with status data
+                # Update zones with status data (volume, mute, etc.)
                 update_zones_from_status(zones, status_response)
 
                 return zones
@@ -414,12 +671,25 @@ class NuVoClient:
             ConnectionError: If not connected
             ProtocolError: If response parsing fails
         """
-        # Get zones and sources
-        zones = await self.get_zones()
-        sources = await self.get_sources()
-
-        # Get system properties
-        status_response = await self._execute_command("GetStatus", timeout=3.0)
+        # Fetch zones, sources and status in one round trip. GetStatus goes
+        # last because its response has no terminator line.
+        for attempt in range(3):
+            zones_response, sources_response, status_response = await self._execute_pipeline(
+                ["BrowseZones", "BrowseSources", "GetStatus"], timeout=10.0
+            )
+            zones_xml = "".join(zones_response)
+            sources_xml = "".join(sources_response)
+            if "<Zones" in zones_xml and "<Sources" in sources_xml:
+                self._store_status(status_response)
+                break
+            if attempt < 2:  # Retry if not last attempt
+                await asyncio.sleep(0.5)
+                continue
+            raise ProtocolError("No zones or sources data in response")
+
+        zones = parse_zones_xml(zones_xml)
+        update_zones_from_status(zones, status_response)
+        sources = parse_sources_xml(sources_xml)
         system_props = parse_system_properties(status_response)
 
         return SystemStatus(
@@ -446,11 +716,29 @@ class NuVoClient:
             ConnectionError: If not connected
             CommandError: If command fails
         """
-        async with self._command_lock:
-            await self._send_command(f"setZone {zone_guid}")
-            self._active_zone = zone_guid
-            # Small delay for command to process
-            await asyncio.sleep(0.1)
+        await self._execute_control(f"setZone {zone_guid}")
+        self._active_zone = zone_guid
+
+    async def set_zone_and(self, zone_guid: str, commands: List[str]) -> None:
+        """
+        Activate a zone and run commands against it in a single write.
+
+        Saves a round trip over set_zone() followed by each command.
+
+        Args:
+            zone_guid: Zone GUID to activate
+            commands: Commands to run in that zone's context
+                     (e.g. ["setSource <guid>", "Volume 50"])
+
+        Raises:
+            ConnectionError: If not connected
+            CommandError: If command fails
+
+        Example:
+            >>> await client.set_zone_and(zone.guid, [f"setSource {source.guid}"])
+        """
+        await self._execute_control("\r".join([f"setZone {zone_guid}", *commands]))
+        self._active_zone = zone_guid
 
     async def power_on(self, zone_number: int) -> None:
         """
@@ -463,9 +751,7 @@ class NuVoClient:
             ConnectionError: If not connected
             CommandError: If command fails
         """
-        async with self._command_lock:
-            await self._send_command(f"Power On {zone_number}")
-            await asyncio.sleep(0.1)
+        await self._execute_control(self._CMD_POWER_ON % zone_number)
 
     async def power_off(self, zone_number: int) -> None:
         """
@@ -478,9 +764,7 @@ class NuVoClient:
             ConnectionError: If not connected
             CommandError: If command fails
         """
-        async with self._command_lock:
-            await self._send_command(f"Power Off {zone_number}")
-            await asyncio.sleep(0.1)
+        await self._execute_control(self._CMD_POWER_OFF % zone_number)
 
     async def set_volume(self, volume: int, zone_number: Optional[int] = None) -> None:
         """
@@ -498,12 +782,10 @@ class NuVoClient:
         if not 0 <= volume <= 79:
             raise ValueError("Volume must be between 0 and 79")
 
-        async with self._command_lock:
-            if zone_number:
-                await self._send_command(f"Volume {volume} {zone_number}")
-            else:
-                await self._send_command(f"Volume {volume}")
-            await asyncio.sleep(0.1)
+        if zone_number:
+            await self._execute_control(self._CMD_VOLUME_ZONE % (volume, zone_number))
+        else:
+            await self._execute_control(self._CMD_VOLUME % volume)
 
     async def mute_toggle(self, zone_number: Optional[int] = None) -> None:
         """
@@ -516,12 +798,10 @@ class NuVoClient:
             ConnectionError: If not connected
             CommandError: If command fails
         """
-        async with self._command_lock:
-            if zone_number:
-                await self._send_command(f"Mute Toggle {zone_number}")
-            else:
-                await self._send_command("Mute Toggle")
-            await asyncio.sleep(0.1)
+        if zone_number:
+            await self._execute_control(self._CMD_MUTE_TOGGLE_ZONE % zone_number)
+        else:
+            await self._execute_control(self._CMD_MUTE_TOGGLE)
 
     # Source control methods
 
@@ -536,9 +816,7 @@ class NuVoClient:
             ConnectionError: If not connected
             CommandError: If command fails
         """
-        async with self._command_lock:
-            await self._send_command(f"setSource {source_guid}")
-            await asyncio.sleep(0.1)
+        await self._execute_control(f"setSource {source_guid}")
 
     # System control methods
 
@@ -550,9 +828,7 @@ class NuVoClient:
             ConnectionError: If not connected
             CommandError: If command fails
         """
-        async with self._command_lock:
-            await self._send_command("PartyMode Toggle")
-            await asyncio.sleep(0.1)
+        await self._execute_control(self._CMD_PARTY_MODE_TOGGLE)
 
     async def all_off(self) -> None:
         """
@@ -562,9 +838,7 @@ class NuVoClient:
             ConnectionError: If not connected
             CommandError: If command fails
         """
-        async with self._command_lock:
-            await self._send_command("AllOff")
-            await asyncio.sleep(0.1)
+        await self._execute_control(self._CMD_ALL_OFF)
 
     # Event subscription
 
@@ -2,10 +2,18 @@
 
 import asyncio
 import ipaddress
+import re
 import socket
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional
 from dataclasses import dataclass
 
+from .client import set_nodelay
+
+
+# Used by the CLI to pull a firmware version out of a device banner
+_VERSION_RE = re.compile(r"version\s+([\d.]+)", re.IGNORECASE)
+_NEWLINES_TO_SPACES = str.maketrans({"\r": " ", "\n": " "})
+
 
 @dataclass
 class DiscoveredDevice:
@@ -37,8 +45,8 @@ async def scan_port(ip: str, port: int, timeout: float = 1.0) -> bool:
             asyncio.open_connection(ip, port),
             timeout=timeout
         )
-        writer.close()
-        await writer.wait_closed()
+        # Reset rather than close gracefully; nothing was exchanged
+        writer.transport.abort()
         return True
     except (asyncio.TimeoutError, ConnectionRefusedError, OSError):
         return False
@@ -48,46 +56,71 @@ async def probe_mrad_port(ip: str, port: int = 5006, timeout: float = 2.0) -> Op
     """
     Probe MRAD port and try to identify device.
 
+    Connecting is also the port check, so no separate scan_port is needed.
+
     Args:
         ip: IP address
         port: MRAD port (default 5006)
         timeout: Connection timeout
 
     Returns:
-        Device info string if successful, None otherwise
+        Device info string if the port is open ("Unknown device" if it
+        doesn't identify itself), None otherwise
     """
     try:
         reader, writer = await asyncio.wait_for(
             asyncio.open_connection(ip, port),
             timeout=timeout
         )
+    except (asyncio.TimeoutError, OSError):
+        return None
+
+    try:
+        set_nodelay(writer)
 
         # Send wake-up command
         writer.write(b"*\r")
         await writer.drain()
 
         # Try to read banner
-        try:
-            banner = await asyncio.wait_for(
-                reader.readuntil(b"\x07"),  # Bell character
-                timeout=1.0
-            )
-            device_info = banner.decode("utf-8", errors="ignore")
-
-            # Look for NuVo identification
-            if "NuVo" in device_info or "Autonomic" in device_info:
-                writer.close()
-                await writer.wait_closed()
-                return device_info.strip()
-
-        except asyncio.TimeoutError:
-            pass
-
-        writer.close()
-        await writer.wait_closed()
-        return "Unknown device"
-
-    except Exception:
+        banner = await asyncio.wait_for(
+            reader.readuntil(b"\x07"),  # Bell character
+            timeout=1.0
+        )
+        device_info = banner.decode("utf-8", errors="ignore")
+
+        # Look for NuVo identification
+        if "NuVo" in device_info or "Autonomic" in device_info:
+            return device_info.strip()
+
+    except (asyncio.TimeoutError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, OSError):
+        pass
+
+    finally:
+        # Reset rather than wait on a graceful close; the probe is done
+        writer.transport.abort()
+
+    return "Unknown device"
+
+
+async def resolve_hostname(ip: str, timeout: float = 2.0) -> Optional[str]:
+    """
+    Reverse-resolve an IP address without blocking the event loop.
+
+    Args:
+        ip: IP address to look up
+        timeout: Lookup timeout in seconds
+
+    Returns:
+        Hostname, or None if the address has no name or the lookup fails
+    """
+    try:
+        hostname, _ = await asyncio.wait_for(
+            asyncio.get_running_loop().getnameinfo((ip, 0), socket.NI_NAMEREQD),
+            timeout=timeout,
+        )
+        return hostname
+    except (OSError, asyncio.TimeoutError):
         return None
 
 
@@ -101,24 +134,18 @@ async def scan_device(ip: str) -> Optional[DiscoveredDevice]:
     Returns:
         DiscoveredDevice if found, None otherwise
     """
-    # Check both ports
-    mrad_open = await scan_port(ip, 5006, timeout=0.5)
-    mcs_open = await scan_port(ip, 5004, timeout=0.5)
+    # Check both ports at once; the MRAD probe also identifies the device
+    device_info, mcs_open = await asyncio.gather(
+        probe_mrad_port(ip, timeout=0.5),
+        scan_port(ip, 5004, timeout=0.5),
+    )
+    mrad_open = device_info is not None
 
     if not (mrad_open or mcs_open):
         return None
 
-    # If MRAD port is open, try to identify device
-    device_info = None
-    if mrad_open:
-        device_info = await probe_mrad_port(ip, timeout=1.0)
-
-    # Get hostname
-    hostname = None
-    try:
-        hostname = socket.gethostbyaddr(ip)[0]
-    except:
-        pass
+    # Get hostname; only hosts with an open port get this far
+    hostname = await resolve_hostname(ip)
 
     return DiscoveredDevice(
         ip=ip,
@@ -134,6 +161,7 @@ async def scan_device(ip: str) -> Optional[DiscoveredDevice]:
 async def discover_devices(
     network: str = "192.168.1.0/24",
     max_concurrent: int = 50,
+    progress: Optional[Callable[[int, int], None]] = None,
 ) -> List[DiscoveredDevice]:
     """
     Discover NuVo MusicPort devices on the network.
@@ -141,9 +169,11 @@ async def discover_devices(
     Args:
         network: Network CIDR (e.g., "192.168.1.0/24")
         max_concurrent: Maximum concurrent scans
+        progress: Optional callback, called as progress(done, total) after
+            each host finishes scanning
 
     Returns:
-        List of discovered devices
+        List of discovered devices, in address order
 
     Example:
         >>> devices = await discover_devices("192.168.1.0/24")
@@ -159,21 +189,28 @@ async def discover_devices(
     # Get all host IPs
     hosts = [str(ip) for ip in net.hosts()]
 
-    # Scan in batches
-    devices = []
-    semaphore = asyncio.Semaphore(max_concurrent)
+    # A fixed pool of workers pulls hosts from a queue, so a large network
+    # holds max_concurrent coroutines rather than one per host
+    queue: asyncio.Queue = asyncio.Queue()
+    for ip in hosts:
+        queue.put_nowait(ip)
 
-    async def scan_with_semaphore(ip: str):
-        async with semaphore:
-            return await scan_device(ip)
+    devices = []
+    done = 0
 
-    # Scan all hosts
-    tasks = [scan_with_semaphore(ip) for ip in hosts]
-    results = await asyncio.gather(*tasks)
+    async def worker():
+        nonlocal done
+        while not queue.empty():
+            device = await scan_device(queue.get_nowait())
+            if device is not None:
+                devices.append(device)
+            done += 1
+            if progress is not None:
+                progress(done, len(hosts))
 
-    # Filter out None results
-    devices = [d for d in results if d is not None]
+    await asyncio.gather(*(worker() for _ in range(min(max_concurrent, len(hosts)))))
 
+    devices.sort(key=lambda d: ipaddress.ip_address(d.ip))
     return devices
 
 
@@ -235,11 +272,10 @@ async def main():
         print(f"   MCS (5004):  {'[Y]' if device.responds_to_mcs else '[N]'}")
         if device.device_info:
             # Clean up device info
-            info = device.device_info.replace("\r\n", " ").replace("\n", " ")
+            info = device.device_info.translate(_NEWLINES_TO_SPACES)
             if "NuVo" in info or "Autonomic" in info:
                 # Extract version info
-                import re
-                match = re.search(r"version\s+([\d.]+)", info, re.IGNORECASE)
+                match = _VERSION_RE.search(info)
                 if match:
                     print(f"   Version: {match.group(1)}")
         print()
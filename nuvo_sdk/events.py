@@ -9,7 +9,9 @@ class EventManager:
     """Manages event subscriptions and distribution."""
 
     def __init__(self):
-        self._subscribers: List[Callable[[StateChangeEvent], None]] = []
+        # Split by kind at subscribe time so notify needn't inspect callbacks
+        self._sync_subscribers: List[Callable[[StateChangeEvent], None]] = []
+        self._async_subscribers: List[Callable[[StateChangeEvent], None]] = []
 
     def subscribe(self, callback: Callable[[StateChangeEvent], None]) -> None:
         """
@@ -18,8 +20,12 @@ class EventManager:
         Args:
             callback: Function to call with StateChangeEvent
         """
-        if callback not in self._subscribers:
-            self._subscribers.append(callback)
+        if asyncio.iscoroutinefunction(callback):
+            subscribers = self._async_subscribers
+        else:
+            subscribers = self._sync_subscribers
+        if callback not in subscribers:
+            subscribers.append(callback)
 
     def unsubscribe(self, callback: Callable[[StateChangeEvent], None]) -> None:
         """
@@ -28,27 +34,37 @@ class EventManager:
         Args:
             callback: Function to remove
         """
-        if callback in self._subscribers:
-            self._subscribers.remove(callback)
+        for subscribers in (self._sync_subscribers, self._async_subscribers):
+            if callback in subscribers:
+                subscribers.remove(callback)
 
     async def notify(self, event: StateChangeEvent) -> None:
         """
         Notify all subscribers of an event.
 
+        Sync callbacks run first, in order; async callbacks then run
+        concurrently so a slow subscriber doesn't delay the others.
+
         Args:
             event: StateChangeEvent to distribute
         """
-        for callback in self._subscribers:
+        for callback in self._sync_subscribers:
             try:
-                # Handle both sync and async callbacks
-                if asyncio.iscoroutinefunction(callback):
-                    await callback(event)
-                else:
-                    callback(event)
+                callback(event)
             except Exception as e:
                 # Don't let subscriber errors break the event system
                 print(f"Error in event subscriber: {e}")
 
+        if self._async_subscribers:
+            results = await asyncio.gather(
+                *(callback(event) for callback in self._async_subscribers),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    print(f"Error in event subscriber: {result}")
+
     def clear(self) -> None:
         """Remove all subscribers."""
-        self._subscribers.clear()
+        self._sync_subscribers.clear()
+        self._async_subscribers.clear()
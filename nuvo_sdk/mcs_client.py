@@ -1,12 +1,61 @@
 """Media Control Server (MCS) client for NuVo MusicPort."""
 
 import asyncio
+import logging
+import re
 import xml.etree.ElementTree as ET
-from typing import List, Optional, Dict, Any, Callable
+from typing import List, Optional, Dict, Any, Callable, Tuple, Union
 from dataclasses import dataclass
 
+from .client import set_nodelay
+from .models import slots_dataclass
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+
+# A <PickListItem ...> tag and the name="value" attributes inside it
+_PICK_LIST_ITEM_RE = re.compile(r'<PickListItem([^>]*)>')
+_ATTRIBUTE_RE = re.compile(r'(\w+)="([^"]*)"')
+
+# A line completes a response if it is exactly "Ok" or ends in "=Done" or
+# "=Ok"; a closing XML tag anywhere in a line also completes it. A bare
+# "Ok" must match exactly, since a status value may itself end in "Ok".
+_RESPONSE_OK = b'Ok'
+_RESPONSE_END_MARKERS = (b'=Done', b'=Ok')
+
+
+def _ends_response(line: bytes) -> bool:
+    """Return True if a stripped line is a completion marker."""
+    return line == _RESPONSE_OK or line.endswith(_RESPONSE_END_MARKERS)
+
+
+def _decode_lines(lines: List[bytes]) -> List[str]:
+    """Decode response lines in one call; stripped lines hold no newlines."""
+    if not lines:
+        return []
+    return b'\n'.join(lines).decode('utf-8', errors='ignore').split('\n')
+
+
+# GetMCEStatus keys -> (status key, value converter)
+_STATUS_FIELDS: Dict[str, Tuple[str, Callable[[str], Any]]] = {
+    'ServerName': ('server_name', str),
+    'InstanceName': ('instance_name', str),
+    'Running': ('running', lambda value: 'True' in value),
+    'Volume': ('volume', int),
+    'Mute': ('mute', lambda value: 'True' in value),
+    'PlayState': ('play_state', str),
+    'SupportedAudioTypes': ('supported_types', lambda value: value.split(',')),
+}
+
+# GetMCEStatus keys -> now_playing key
+_NOW_PLAYING_FIELDS = {
+    'TrackName': 'track',
+    'ArtistName': 'artist',
+    'StationName': 'station',
+}
+
+
+@slots_dataclass
 class MusicServer:
     """Represents a Music Server instance."""
     name: str
@@ -23,6 +72,10 @@ class MusicServer:
 @dataclass
 class PickListItem:
     """Represents an item in a browse menu/pick list."""
+    # Browse lists hold up to SetPickListCount of these. Slots are written
+    # out by hand since dataclass(slots=True) needs Python 3.10.
+    __slots__ = ('index', 'title', 'guid', 'item_type', 'metadata')
+
     index: int
     title: str
     guid: str
@@ -47,8 +100,35 @@ class MCSClient:
     """
 
     DEFAULT_PORT = 5004
-    READ_TIMEOUT = 15.0  # Increased for slow devices
     COMMAND_TIMEOUT = 10.0  # Increased for slow devices
+    INIT_IDLE_TIMEOUT = 0.5  # Quiet period that ends the init responses
+    RESPONSE_IDLE_TIMEOUT = 0.5  # Quiet period that ends an unterminated response
+    # Longest line the reader will buffer; list responses can exceed
+    # asyncio's 64 KiB default
+    STREAM_LIMIT = 1 << 20
+    MAX_INIT_LINES = 20
+
+    # Pre-encoded commands; the numeric ones take a % argument
+    _CMD_BROWSE_INSTANCES = b"BrowseInstancesEX\r\n"
+    _CMD_BROWSE_PICK_LIST = b"BrowsePickList\r\n"
+    _CMD_BROWSE_NOW_PLAYING = b"BrowseNowPlaying\r\n"
+    _CMD_GET_STATUS = b"GetMCEStatus\r\n"
+    _CMD_PLAY_ALL_MUSIC = b"PlayAllMusic\r\n"
+    _CMD_ADD_LIST_TO_QUEUE = b"AddListToQueue\r\n"
+    _CMD_CLEAR_NOW_PLAYING = b"ClearNowPlaying\r\n"
+    _CMD_ACK_PICK_ITEM = b"AckPickItem %d\r\n"
+    _CMD_JUMP_TO_NOW_PLAYING_ITEM = b"JumpToNowPlayingItem %d\r\n"
+    _CMD_REMOVE_NOW_PLAYING_ITEM = b"RemoveNowPlayingItem %d\r\n"
+    _CMD_SET_VOLUME = b"SetVolume %d\r\n"
+
+    # Session setup sent after SetHost on every connect
+    INIT_COMMANDS = (
+        "SetXMLMode Lists",
+        'SetClientType "Python"',
+        "SetEncoding 65001",
+        "SetPickListCount 100",
+        "SubscribeEvents",
+    )
 
     def __init__(self, host: Optional[str] = None, port: int = DEFAULT_PORT):
         """
@@ -67,20 +147,27 @@ class MCSClient:
         self._current_instance: Optional[str] = None
 
         # Async resources (created in event loop)
-        self._response_queue: Optional[asyncio.Queue] = None
         self._command_lock: Optional[asyncio.Lock] = None
         self._reconnect_lock: Optional[asyncio.Lock] = None
-        self._listen_task: Optional[asyncio.Task] = None
         self._is_reconnecting: bool = False
+        # Clear while a reconnect is in progress, set once it finishes
+        self._reconnect_done: Optional[asyncio.Event] = None
 
     def _ensure_async_resources(self):
-        """Ensure asyncio resources are created in the event loop context."""
-        if self._response_queue is None:
-            self._response_queue = asyncio.Queue()
+        """
+        Ensure asyncio resources are created in the event loop context.
+
+        Called from connect() and reconnect() rather than per command. On
+        Python 3.9 a lock binds to the current loop when created, so it
+        can't simply be made in __init__.
+        """
         if self._command_lock is None:
             self._command_lock = asyncio.Lock()
         if self._reconnect_lock is None:
             self._reconnect_lock = asyncio.Lock()
+        if self._reconnect_done is None:
+            self._reconnect_done = asyncio.Event()
+            self._reconnect_done.set()
 
     async def connect(self, host: Optional[str] = None, port: Optional[int] = None) -> None:
         """
@@ -102,20 +189,19 @@ class MCSClient:
 
         try:
             self._reader, self._writer = await asyncio.open_connection(
-                self.host, self.port
+                self.host, self.port, limit=self.STREAM_LIMIT
             )
+            set_nodelay(self._writer)
             self._connected = True
 
-            # Start listener task
-            self._listen_task = asyncio.create_task(self._listen())
+            # Initialize connection; the setup commands don't depend on each
+            # other's replies, so send them in a single write
+            init_commands = (f"SetHost {self.host}",) + self.INIT_COMMANDS
+            self._writer.write("".join(f"{cmd}\r\n" for cmd in init_commands).encode('utf-8'))
+            await self._writer.drain()
 
-            # Initialize connection
-            await self._send_command(f"SetHost {self.host}")
-            await self._send_command("SetXMLMode Lists")
-            await self._send_command('SetClientType "Python"')
-            await self._send_command("SetEncoding 65001")
-            await self._send_command("SetPickListCount 100")
-            await self._send_command("SubscribeEvents")
+            # Consume the init responses so the first command doesn't read them
+            await self._discard_init_responses()
 
         except Exception as e:
             self._connected = False
@@ -125,222 +211,212 @@ class MCSClient:
         """Disconnect from MCS server."""
         self._connected = False
 
-        if self._listen_task:
-            self._listen_task.cancel()
-            try:
-                await self._listen_task
-            except asyncio.CancelledError:
-                pass
-
         if self._writer:
             self._writer.close()
             await self._writer.wait_closed()
 
     async def reconnect(self) -> None:
         """Reconnect to MCS server after connection loss."""
-        if self._reconnect_lock is None:
-            self._ensure_async_resources()
+        self._ensure_async_resources()
+        assert self._reconnect_lock is not None and self._reconnect_done is not None
 
         # Use lock to prevent multiple simultaneous reconnections
         async with self._reconnect_lock:
             # If already reconnecting, wait
             if self._is_reconnecting:
-                print("[MCS] Already reconnecting, waiting...")
-                for _ in range(10):
-                    await asyncio.sleep(0.5)
-                    if self._connected:
-                        print("[MCS] Reconnection completed by another thread")
-                        return
+                logger.debug("[MCS] Already reconnecting, waiting...")
+                try:
+                    await asyncio.wait_for(self._reconnect_done.wait(), timeout=5.0)
+                except asyncio.TimeoutError:
+                    pass
+                if self._connected:
+                    logger.debug("[MCS] Reconnection completed by another task")
+                    return
                 raise ConnectionError("Reconnection timeout - another reconnection in progress")
 
             if self._connected:
-                print("[MCS] Already connected, no reconnection needed")
+                logger.debug("[MCS] Already connected, no reconnection needed")
                 return
 
             self._is_reconnecting = True
-            print("[MCS] Attempting to reconnect...")
+            self._reconnect_done.clear()
+            logger.info("[MCS] Attempting to reconnect to %s:%s", self.host, self.port)
 
             try:
                 # THOROUGH cleanup of old connection state
                 self._connected = False
 
-                # Cancel and wait for listener task to fully stop
-                if self._listen_task and not self._listen_task.done():
-                    print("[MCS] Stopping old listener task...")
-                    self._listen_task.cancel()
-                    try:
-                        await asyncio.wait_for(self._listen_task, timeout=2.0)
-                    except (asyncio.CancelledError, asyncio.TimeoutError):
-                        pass
-                self._listen_task = None
-
                 # Close writer and wait for it
                 if self._writer and not self._writer.is_closing():
-                    print("[MCS] Closing old writer...")
+                    logger.debug("[MCS] Closing old writer...")
                     try:
                         self._writer.close()
                         await asyncio.wait_for(self._writer.wait_closed(), timeout=2.0)
                     except asyncio.TimeoutError:
-                        print("[MCS] Writer close timed out")
+                        logger.debug("[MCS] Writer close timed out")
                         pass
                 self._writer = None
                 self._reader = None
 
-                # Clear any stale responses from queue
-                if self._response_queue:
-                    while not self._response_queue.empty():
-                        try:
-                            self._response_queue.get_nowait()
-                        except:
-                            break
-
                 # Wait for device to settle (old devices need time)
-                print("[MCS] Waiting 3s for device to settle...")
+                logger.debug("[MCS] Waiting 3s for device to settle...")
                 await asyncio.sleep(3.0)
 
                 # Reconnect with fresh state
-                print("[MCS] Creating new connection...")
+                logger.debug("[MCS] Creating new connection...")
                 await self.connect()
-                print("[MCS] Reconnected successfully")
+                logger.info("[MCS] Reconnected successfully")
 
                 # Give connection time to stabilize before use (old device needs lots of time!)
-                print("[MCS] Waiting 3s for connection to stabilize...")
+                logger.debug("[MCS] Waiting 3s for connection to stabilize...")
                 await asyncio.sleep(3.0)
 
                 # Restore instance if one was set
                 if self._current_instance:
-                    print(f"[MCS] Restoring instance: {self._current_instance}")
-                    # Use _send_command directly to avoid recursion
-                    self._writer.write(f"SetInstance {self._current_instance}\r\n".encode('utf-8'))
-                    await self._writer.drain()
-                    await asyncio.sleep(1.0)
+                    logger.debug("[MCS] Restoring instance: %s", self._current_instance)
+                    # Bypass _execute_command to avoid recursion; read the
+                    # reply so it isn't taken as the next command's response
+                    await self._send_command(f"SetInstance {self._current_instance}")
+                    await self._read_response()
 
             except Exception as e:
-                print(f"[MCS] Reconnection failed: {e}")
-                import traceback
-                traceback.print_exc()
+                logger.exception("[MCS] Reconnection failed: %s", e)
                 self._is_reconnecting = False
                 self._connected = False
                 raise
             finally:
                 self._is_reconnecting = False
+                self._reconnect_done.set()
 
-    async def _send_command(self, command: str) -> None:
-        """Send a command to the server."""
+    async def _send_command(self, command: Union[str, bytes]) -> None:
+        """Send a command string, or already-encoded bytes ending in \\r\\n."""
         if not self._writer:
             raise ConnectionError("Not connected")
 
-        self._writer.write(f"{command}\r\n".encode('utf-8'))
+        if isinstance(command, str):
+            command = f"{command}\r\n".encode('utf-8')
+        self._writer.write(command)
         await self._writer.drain()
 
-    async def _listen(self) -> None:
-        """Background task to listen for server responses."""
-        try:
-            while self._connected and self._reader:
+    async def _discard_init_responses(self) -> None:
+        """Read and drop init responses until the server goes quiet."""
+        assert self._reader is not None  # Only called from connect()
+        for _ in range(self.MAX_INIT_LINES):
+            try:
                 line = await asyncio.wait_for(
                     self._reader.readline(),
-                    timeout=self.READ_TIMEOUT
+                    timeout=self.INIT_IDLE_TIMEOUT
                 )
+            except asyncio.TimeoutError:
+                break
+            if not line:
+                break
 
-                if not line:
-                    break
-
-                text = line.decode('utf-8', errors='ignore').strip()
-                if text:
-                    await self._response_queue.put(text)
-
-        except asyncio.CancelledError:
-            pass
-        except Exception as e:
-            import traceback
-            print(f"MCS listen error: {type(e).__name__}: {e}")
-            traceback.print_exc()
-
-            # Mark connection as broken
-            self._connected = False
+    async def _read_response(self, timeout: float = COMMAND_TIMEOUT) -> List[bytes]:
+        """
+        Read response lines directly from the stream.
 
-            # Auto-reconnect after a delay
-            print("[MCS] Connection lost in listener, will auto-reconnect on next command")
-            # Don't reconnect here to avoid conflicts - let the next command trigger reconnect
+        Only called with the command lock held, so this is the sole reader.
+        StateChanged events are skipped; this client doesn't dispatch them.
+        Lines are returned undecoded; see _decode_lines.
+        """
+        if self._reader is None:
+            raise ConnectionError("Not connected")
 
-    async def _read_response(self, timeout: float = COMMAND_TIMEOUT) -> List[str]:
-        """Read response lines from queue."""
-        lines = []
-        deadline = asyncio.get_event_loop().time() + timeout
+        lines: List[bytes] = []
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
 
         while True:
-            remaining = deadline - asyncio.get_event_loop().time()
+            remaining = deadline - loop.time()
             if remaining <= 0:
                 break
 
+            # Until the first line arrives, wait out the whole timeout in
+            # one go; after that, a quiet spell ends the response
             try:
                 line = await asyncio.wait_for(
-                    self._response_queue.get(),
-                    timeout=min(0.5, remaining)
+                    self._reader.readline(),
+                    timeout=min(self.RESPONSE_IDLE_TIMEOUT, remaining) if lines else remaining
                 )
-                lines.append(line)
+            except asyncio.TimeoutError:
+                break
 
-                # Check for completion markers
-                if any(marker in line for marker in ['=Done', 'Ok', '</']) or len(lines) > 100:
-                    break
+            if not line:
+                raise ConnectionError("Connection closed by server")
 
-            except asyncio.TimeoutError:
-                if lines:  # Got some response, that's OK
-                    break
+            line = line.strip()
+            if not line or line.startswith(b'StateChanged'):
+                continue
+            lines.append(line)
+
+            # Check for completion markers
+            if _ends_response(line) or b'</' in line:
+                break
 
         return lines
 
-    async def _execute_command(self, command: str, timeout: float = COMMAND_TIMEOUT, retry: bool = True) -> List[str]:
-        """Execute command and get response with automatic reconnection on failure."""
-        if self._command_lock is None:
-            self._ensure_async_resources()
+    async def _execute_command(self, command: Union[str, bytes], timeout: float = COMMAND_TIMEOUT, retry: bool = True) -> List[str]:
+        """Execute command and return its decoded response lines."""
+        return _decode_lines(await self._execute_raw(command, timeout, retry))
+
+    async def _execute_raw(self, command: Union[str, bytes], timeout: float = COMMAND_TIMEOUT, retry: bool = True) -> List[bytes]:
+        """
+        Execute command and get response with automatic reconnection on failure.
+
+        The response lines are left undecoded, for commands whose response
+        is ignored.
+
+        The command lock is created by connect(), which must have been
+        called once before any command.
+
+        Raises:
+            ConnectionError: If connect() has never been called
+        """
+        if self._command_lock is None or self._reconnect_done is None:
+            raise ConnectionError("Not connected")
 
         async with self._command_lock:
             # Check if connection is alive, reconnect if needed (but not if already reconnecting!)
             if not self._is_reconnecting and (not self._connected or not self._writer or self._writer.is_closing()):
                 if retry:
-                    print(f"[MCS] Connection not alive before command '{command}', reconnecting...")
+                    logger.info("[MCS] Connection not alive before command %r, reconnecting...", command)
                     try:
                         await self.reconnect()
                     except Exception as e:
-                        print(f"[MCS] Pre-command reconnection failed: {e}")
+                        logger.warning("[MCS] Pre-command reconnection failed: %s", e)
                         raise ConnectionError(f"MCS connection is down and reconnection failed: {e}")
                 else:
                     raise ConnectionError("MCS connection is not alive")
             elif self._is_reconnecting:
                 # If reconnection is in progress, wait for it
-                print(f"[MCS] Waiting for reconnection to complete before '{command}'...")
-                for _ in range(20):
-                    await asyncio.sleep(0.5)
-                    if not self._is_reconnecting and self._connected:
-                        break
+                logger.debug("[MCS] Waiting for reconnection to complete before %r...", command)
+                try:
+                    await asyncio.wait_for(self._reconnect_done.wait(), timeout=10.0)
+                except asyncio.TimeoutError:
+                    pass
                 if not self._connected:
                     raise ConnectionError("Reconnection did not complete in time")
 
             try:
-                # Clear queue
-                while not self._response_queue.empty():
-                    self._response_queue.get_nowait()
-
                 await self._send_command(command)
                 return await self._read_response(timeout)
 
             except (ConnectionResetError, ConnectionError, BrokenPipeError, OSError) as e:
+                # Mark connection as broken so reconnect() starts fresh
+                self._connected = False
                 if not retry:
                     raise
 
-                print(f"[MCS] Connection error during command '{command}': {e}")
-                print("[MCS] Attempting to reconnect and retry...")
+                logger.warning("[MCS] Connection error during command %r: %s; reconnecting and retrying", command, e)
 
                 try:
                     await self.reconnect()
                     # Retry the command once after reconnecting
-                    while not self._response_queue.empty():
-                        self._response_queue.get_nowait()
                     await self._send_command(command)
                     return await self._read_response(timeout)
                 except Exception as retry_error:
-                    print(f"[MCS] Retry after reconnection failed: {retry_error}")
+                    logger.warning("[MCS] Retry after reconnection failed: %s", retry_error)
                     raise
 
     # ==================== CONFIGURATION ====================
@@ -352,30 +428,32 @@ class MCSClient:
         Args:
             instance_name: e.g., "Music_Server_A", "Music_Server_B", etc.
         """
-        await self._execute_command(f"SetInstance {instance_name}")
+        await self._execute_raw(f"SetInstance {instance_name}")
         self._current_instance = instance_name
 
     async def set_pick_list_count(self, count: int) -> None:
         """Set number of items returned in browse lists."""
-        await self._execute_command(f"SetPickListCount {count}")
+        await self._execute_raw(f"SetPickListCount {count}")
 
     # ==================== BROWSING ====================
 
     async def browse_instances(self) -> List[str]:
         """Get list of available Music Server instances."""
-        response = await self._execute_command("BrowseInstancesEX")
-        # Parse XML response to get instance names
+        response = await self._execute_command(self._CMD_BROWSE_INSTANCES)
+
+        # Wrap the lines in a root element so stray status text parses too
         instances = []
-        for line in response:
-            if '<Instance' in line:
-                try:
-                    # Extract instance name from XML
-                    import re
-                    match = re.search(r'name="([^"]+)"', line)
-                    if match:
-                        instances.append(match.group(1))
-                except:
-                    pass
+        try:
+            root = ET.fromstring(f"<Response>{''.join(response)}</Response>")
+        except ET.ParseError as e:
+            logger.warning("[MCS] Error parsing instances: %s", e)
+            return instances
+
+        for element in root.iter():
+            if element.tag.startswith('Instance'):
+                name = element.get('name')
+                if name:
+                    instances.append(name)
         return instances
 
     async def browse_pick_list(self) -> List[PickListItem]:
@@ -383,41 +461,36 @@ class MCSClient:
         Browse current menu/pick list items.
         Returns list of items (stations, albums, playlists, etc.).
         """
-        response = await self._execute_command("BrowsePickList")
+        response = await self._execute_command(self._CMD_BROWSE_PICK_LIST)
         items = []
 
-        # Parse XML response
-        xml_data = '\n'.join(response)
-        print(f"[MCS] BrowsePickList response lines: {len(response)}")
-        if len(response) > 0:
-            print(f"[MCS] First response line: {response[0][:100] if response[0] else 'EMPTY'}")
-        try:
-            # Simple parsing for pick list items
-            import re
-            matches = re.finditer(r'<PickListItem[^>]*>', xml_data)
-            for i, match in enumerate(matches):
-                item_str = match.group(0)
-
-                # Extract attributes
-                title = re.search(r'title="([^"]*)"', item_str)
-                guid = re.search(r'guid="([^"]*)"', item_str)
-                item_type = re.search(r'type="([^"]*)"', item_str)
-
-                items.append(PickListItem(
-                    index=i,
-                    title=title.group(1) if title else f"Item {i}",
-                    guid=guid.group(1) if guid else "",
-                    item_type=item_type.group(1) if item_type else "Unknown",
-                    metadata={}
-                ))
-        except:
-            pass
+        logger.debug("[MCS] BrowsePickList response lines: %d", len(response))
+        if response and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[MCS] First response line: %s", response[0][:100] or 'EMPTY')
+
+        # Scan line by line rather than joining the response into one
+        # string; each item tag arrives on a single line
+        matches = (
+            match
+            for line in response
+            for match in _PICK_LIST_ITEM_RE.finditer(line)
+        )
+        for i, match in enumerate(matches):
+            attrs = dict(_ATTRIBUTE_RE.findall(match.group(1)))
+
+            items.append(PickListItem(
+                index=i,
+                title=attrs.get('title', f"Item {i}"),
+                guid=attrs.get('guid', ""),
+                item_type=attrs.get('type', "Unknown"),
+                metadata={}
+            ))
 
         return items
 
     async def browse_now_playing(self) -> List[Dict[str, Any]]:
         """Browse now playing queue."""
-        response = await self._execute_command("BrowseNowPlaying")
+        response = await self._execute_raw(self._CMD_BROWSE_NOW_PLAYING)
         # TODO: Parse queue items from response
         return []
 
@@ -431,16 +504,16 @@ class MCSClient:
             filter_value: Search term or filter (empty to clear)
         """
         if filter_value:
-            await self._execute_command(f"SetRadioFilter {filter_value}")
+            await self._execute_raw(f"SetRadioFilter {filter_value}")
         else:
-            await self._execute_command("SetRadioFilter Clear")
+            await self._execute_raw("SetRadioFilter Clear")
 
     async def set_music_filter(self, filter_value: str = "") -> None:
         """Set music library filter/search."""
         if filter_value:
-            await self._execute_command(f"SetMusicFilter {filter_value}")
+            await self._execute_raw(f"SetMusicFilter {filter_value}")
         else:
-            await self._execute_command("SetMusicFilter Clear")
+            await self._execute_raw("SetMusicFilter Clear")
 
     # ==================== PLAYBACK ====================
 
@@ -452,41 +525,41 @@ class MCSClient:
         Args:
             index: Index of item in the pick list (0-based)
         """
-        await self._execute_command(f"AckPickItem {index}")
+        await self._execute_raw(self._CMD_ACK_PICK_ITEM % index)
 
     async def play_album(self, guid: str) -> None:
         """Play a specific album by GUID."""
-        await self._execute_command(f"PlayAlbum {guid}")
+        await self._execute_raw(f"PlayAlbum {guid}")
 
     async def play_all_music(self) -> None:
         """Play all music."""
-        await self._execute_command("PlayAllMusic")
+        await self._execute_raw(self._CMD_PLAY_ALL_MUSIC)
 
     async def jump_to_now_playing_item(self, index: int) -> None:
         """Jump to specific item in now playing queue."""
-        await self._execute_command(f"JumpToNowPlayingItem {index}")
+        await self._execute_raw(self._CMD_JUMP_TO_NOW_PLAYING_ITEM % index)
 
     # ==================== QUEUE MANAGEMENT ====================
 
     async def add_to_queue(self, guid: str) -> None:
         """Add item to now playing queue."""
-        await self._execute_command(f"AddToQueue {guid}")
+        await self._execute_raw(f"AddToQueue {guid}")
 
     async def add_list_to_queue(self) -> None:
         """Add entire current list to queue."""
-        await self._execute_command("AddListToQueue")
+        await self._execute_raw(self._CMD_ADD_LIST_TO_QUEUE)
 
     async def clear_now_playing(self) -> None:
         """Clear the now playing queue."""
-        await self._execute_command("ClearNowPlaying")
+        await self._execute_raw(self._CMD_CLEAR_NOW_PLAYING)
 
     async def remove_now_playing_item(self, index: int) -> None:
         """Remove specific item from queue."""
-        await self._execute_command(f"RemoveNowPlayingItem {index}")
+        await self._execute_raw(self._CMD_REMOVE_NOW_PLAYING_ITEM % index)
 
     async def save_playlist(self, name: str) -> None:
         """Save current queue as a playlist."""
-        await self._execute_command(f"SavePlaylist {name}")
+        await self._execute_raw(f"SavePlaylist {name}")
 
     # ==================== CONTROL ====================
 
@@ -497,7 +570,7 @@ class MCSClient:
         Args:
             volume: Volume level 0-100
         """
-        await self._execute_command(f"SetVolume {volume}")
+        await self._execute_raw(self._CMD_SET_VOLUME % volume)
 
     # ==================== STATUS ====================
 
@@ -506,7 +579,7 @@ class MCSClient:
         Get full Music Server status.
         Returns dict with server state, now playing info, etc.
         """
-        response = await self._execute_command("GetMCEStatus", timeout=10.0)
+        response = await self._execute_command(self._CMD_GET_STATUS, timeout=10.0)
 
         status = {
             'server_name': None,
@@ -519,31 +592,22 @@ class MCSClient:
             'supported_types': [],
         }
 
-        # Parse response lines
+        # Lines look like "ReportState Music_Server_A Volume=50"
         for line in response:
-            if 'ServerName=' in line:
-                status['server_name'] = line.split('=', 1)[1].strip()
-            elif 'InstanceName=' in line:
-                status['instance_name'] = line.split('=', 1)[1].strip()
-            elif 'Running=' in line:
-                status['running'] = 'True' in line
-            elif 'Volume=' in line:
+            name, sep, value = line.partition('=')
+            if not sep:
+                continue
+            key = name.rpartition(' ')[2]
+            value = value.strip()
+
+            field = _STATUS_FIELDS.get(key)
+            if field:
+                status_key, convert = field
                 try:
-                    status['volume'] = int(line.split('=', 1)[1].strip())
-                except:
+                    status[status_key] = convert(value)
+                except ValueError:
                     pass
-            elif 'Mute=' in line:
-                status['mute'] = 'True' in line
-            elif 'PlayState=' in line:
-                status['play_state'] = line.split('=', 1)[1].strip()
-            elif 'SupportedAudioTypes=' in line:
-                types_str = line.split('=', 1)[1].strip()
-                status['supported_types'] = types_str.split(',')
-            elif 'TrackName=' in line:
-                status['now_playing']['track'] = line.split('=', 1)[1].strip()
-            elif 'ArtistName=' in line:
-                status['now_playing']['artist'] = line.split('=', 1)[1].strip()
-            elif 'StationName=' in line:
-                status['now_playing']['station'] = line.split('=', 1)[1].strip()
+            elif key in _NOW_PLAYING_FIELDS:
+                status['now_playing'][_NOW_PLAYING_FIELDS[key]] = value
 
         return status
@@ -6,12 +6,195 @@ instead of persistent background listeners.
 """
 
 import asyncio
+import base64
+import traceback
 import xml.etree.ElementTree as ET
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Callable, Iterator, Tuple, Union, cast
 from dataclasses import dataclass
 
+from .client import set_nodelay
+from .models import slots_dataclass
 
-@dataclass
+
+# A line completes a response if it is exactly "Ok" or ends in "=Done" or
+# "=Ok"; a closing XML tag anywhere in a line also completes it. A bare
+# "Ok" must match exactly, since a status value may itself end in "Ok".
+_RESPONSE_OK = b'Ok'
+_RESPONSE_END_MARKERS = (b'=Done', b'=Ok')
+
+
+def _ends_response(line: bytes) -> bool:
+    """Return True if a stripped line is a completion marker."""
+    return line == _RESPONSE_OK or line.endswith(_RESPONSE_END_MARKERS)
+
+
+def _decode_lines(lines: List[bytes]) -> List[str]:
+    """Decode response lines in one call; stripped lines hold no newlines."""
+    if not lines:
+        return []
+    return b'\n'.join(lines).decode('utf-8', errors='ignore').split('\n')
+
+
+def _iter_elements(xml_data: bytes, tag: str) -> Iterator[ET.Element]:
+    """
+    Yield each <tag> element of an XML response as soon as it is parsed.
+
+    Elements are cleared once the caller has read them, so a long list is
+    never held as a full tree.
+
+    Raises:
+        ET.ParseError: If the XML is malformed
+    """
+    parser: ET.XMLPullParser = ET.XMLPullParser(events=('end',))
+    parser.feed(xml_data)
+    # With only 'end' events requested, every event is an (event, Element) pair
+    events = cast(Iterator[Tuple[str, ET.Element]], parser.read_events())
+    for _, element in events:
+        if element.tag == tag:
+            yield element
+            element.clear()
+    parser.close()
+
+
+# List parsers are pure functions of the raw response so the async browse
+# methods can run them off the event loop with asyncio.to_thread
+
+def _parse_radio_stations(xml_data: bytes) -> List['PickListItem']:
+    """Parse a BrowseRadioStations response into pick list items."""
+    items = []
+    try:
+        for station in _iter_elements(xml_data, 'RadioStation'):
+            attrs = station.attrib
+            name = attrs.get('name', 'Unknown')
+            guid = attrs.get('guid', '')
+            desc = attrs.get('desc', name)
+
+            items.append(PickListItem(
+                index=len(items),
+                title=name,
+                guid=guid,
+                item_type="RadioStation",
+                metadata={'desc': desc}
+            ))
+
+    except Exception as e:
+        print(f"[SimpleMCS] Error parsing radio stations: {e}")
+        traceback.print_exc()
+
+    return items
+
+
+def _is_one(value: str) -> bool:
+    return value == '1'
+
+
+# Browse list schemas: result key -> (XML attribute, default, converter);
+# the converter is applied only to attributes that are present
+_FieldSchema = Dict[str, Tuple[str, Any, Callable[[str], Any]]]
+
+_NOW_PLAYING_FIELDS: _FieldSchema = {
+    'guid': ('guid', '', str),
+    'name': ('name', 'Unknown', str),
+    'artist': ('artist', '', str),
+    'album': ('album', '', str),
+    'album_guid': ('albumGuid', '', str),
+    'duration': ('duration', '00:00:00', str),
+    'track_number': ('track', 0, int),
+    'queue_index': ('npIndex', 0, int),
+    'is_now_playing': ('np', False, _is_one),
+}
+
+_ALBUM_TITLE_FIELDS: _FieldSchema = {
+    'guid': ('guid', '', str),
+    'name': ('name', 'Unknown', str),
+    'artist': ('artist', '', str),
+    'album': ('album', '', str),
+    'duration': ('duration', '00:00:00', str),
+    'track_number': ('track', 0, int),
+}
+
+_ALBUM_FIELDS: _FieldSchema = {
+    'guid': ('guid', '', str),
+    'name': ('name', 'Unknown Album', str),
+    'artist': ('artist', '', str),
+    'unique_name': ('unique', '', str),
+}
+
+_ARTIST_FIELDS: _FieldSchema = {
+    'guid': ('guid', '', str),
+    'name': ('name', 'Unknown Artist', str),
+}
+
+
+def _parse_elements(xml_data: bytes, tag: str, fields: _FieldSchema) -> List[Dict[str, Any]]:
+    """Parse each <tag> element of a browse response into a dict per schema."""
+    rows = []
+    try:
+        for element in _iter_elements(xml_data, tag):
+            attrs = element.attrib
+            row = {}
+            for key, (attribute, default, convert) in fields.items():
+                value = attrs.get(attribute)
+                row[key] = default if value is None else convert(value)
+            rows.append(row)
+
+    except Exception as e:
+        print(f"[SimpleMCS] Error parsing {tag} list: {e}")
+
+    return rows
+
+
+def _decode(value: bytes) -> str:
+    return value.decode('utf-8', errors='ignore')
+
+
+# GetStatus keys -> (status key, value converter)
+_STATUS_FIELDS: Dict[bytes, Tuple[str, Callable[[bytes], Any]]] = {
+    b'Volume': ('volume', int),
+    b'Mute': ('mute', lambda value: value.lower() == b'true'),
+    b'PlayState': ('play_state', _decode),
+}
+
+# GetStatus keys -> now_playing key
+_STATUS_NOW_PLAYING_FIELDS = {
+    b'TrackName': 'track',
+    b'ArtistName': 'artist',
+    b'MediaName': 'album',
+    b'StationName': 'station',
+}
+
+
+def _parse_status(response: List[bytes]) -> Dict[str, Any]:
+    """Parse raw GetStatus response lines into a status dict."""
+    status = {
+        'volume': 0,
+        'mute': False,
+        'play_state': 'Unknown',
+        'now_playing': {},
+    }
+
+    # Lines look like "ReportState Music_Server_A Volume=50"
+    for line in response:
+        name, sep, value = line.partition(b'=')
+        if not sep:
+            continue
+        key = name.rpartition(b' ')[2]
+        value = value.strip()
+
+        field = _STATUS_FIELDS.get(key)
+        if field:
+            status_key, convert = field
+            try:
+                status[status_key] = convert(value)
+            except ValueError:
+                pass
+        elif key in _STATUS_NOW_PLAYING_FIELDS:
+            status['now_playing'][_STATUS_NOW_PLAYING_FIELDS[key]] = _decode(value)
+
+    return status
+
+
+@slots_dataclass
 class MusicServer:
     """Represents a Music Server instance."""
     name: str
@@ -28,6 +211,10 @@ class MusicServer:
 @dataclass
 class PickListItem:
     """Represents an item in a browse menu/pick list."""
+    # Browse lists hold up to SetPickListCount of these. Slots are written
+    # out by hand since dataclass(slots=True) needs Python 3.10.
+    __slots__ = ('index', 'title', 'guid', 'item_type', 'metadata')
+
     index: int
     title: str
     guid: str
@@ -49,6 +236,30 @@ class SimpleMCSClient:
     DEFAULT_PORT = 5004
     COMMAND_TIMEOUT = 10.0
     CONNECT_TIMEOUT = 5.0
+    RESPONSE_IDLE_TIMEOUT = 0.5  # Quiet period that ends an unterminated response
+    # Longest line the reader will buffer; station and album lists can
+    # exceed asyncio's 64 KiB default
+    STREAM_LIMIT = 1 << 20
+    # Reconnect delay after repeated command failures, doubling each time
+    RECONNECT_BACKOFF_START = 0.1
+    RECONNECT_BACKOFF_MAX = 2.0
+
+    # Pre-encoded commands; the parameterized ones take a % bytes argument
+    _CMD_BROWSE_INSTANCES = b"BrowseInstancesEX\r\n"
+    _CMD_BROWSE_RADIO_STATIONS = b"BrowseRadioStations\r\n"
+    _CMD_BROWSE_NOW_PLAYING = b"BrowseNowPlaying\r\n"
+    _CMD_BROWSE_ALBUMS = b"BrowseAlbums\r\n"
+    _CMD_BROWSE_ARTISTS = b"BrowseArtists\r\n"
+    _CMD_GET_STATUS = b"GetStatus\r\n"
+    _CMD_PLAY_ALL_MUSIC = b"PlayAllMusic\r\n"
+    _CMD_SET_INSTANCE = b"SetInstance %s\r\n"
+    _CMD_BROWSE_ALBUM_TITLES = b"BrowseAlbumTitles %s\r\n"
+    _CMD_PLAY_RADIO_STATION = b"PlayRadioStation %s\r\n"
+    _CMD_PLAY_TITLE = b"PlayTitle %s\r\n"
+    _CMD_PLAY_ALBUM = b"PlayAlbum %s\r\n"
+    _CMD_PLAY_ARTIST = b"PlayArtist %s\r\n"
+    _CMD_ACK_PICK_ITEM = b"AckPickItem %d\r\n"
+    _CMD_SET_RADIO_FILTER = b"SetRadioFilter %s\r\n"
 
     def __init__(self, host: Optional[str] = None, port: int = DEFAULT_PORT):
         """Initialize simple MCS client."""
@@ -60,6 +271,7 @@ class SimpleMCSClient:
         self._writer: Optional[asyncio.StreamWriter] = None
         self._connected = False
         self._current_instance: Optional[str] = None
+        self._consecutive_failures = 0
 
         # Single command lock to prevent concurrent commands
         self._command_lock: Optional[asyncio.Lock] = None
@@ -88,9 +300,10 @@ class SimpleMCSClient:
 
         try:
             self._reader, self._writer = await asyncio.wait_for(
-                asyncio.open_connection(self.host, self.port),
+                asyncio.open_connection(self.host, self.port, limit=self.STREAM_LIMIT),
                 timeout=self.CONNECT_TIMEOUT
             )
+            set_nodelay(self._writer)
 
             # Send initialization commands and consume their responses
             # NOTE: Not subscribing to events for now - they interfere with command responses
@@ -104,28 +317,13 @@ class SimpleMCSClient:
                 # "SubscribeEvents"  # Disabled - causes StateChanged to flood responses
             ]
 
-            for cmd in init_commands:
-                self._writer.write(f"{cmd}\r\n".encode('utf-8'))
-                await self._writer.drain()
+            # Independent of each other's replies, so send them all at once
+            self._writer.writelines(f"{cmd}\r\n".encode('utf-8') for cmd in init_commands)
+            await self._writer.drain()
 
-            # Wait for all init responses and consume them
-            # Each command generates a response
+            # Each command generates a response; consume them all
             print("[SimpleMCS] Consuming init responses...")
-            await asyncio.sleep(1.0)  # Give time for responses to arrive
-
-            consumed = 0
-            try:
-                while consumed < 20:  # Max 20 lines to prevent infinite loop
-                    line = await asyncio.wait_for(self._reader.readline(), timeout=0.2)
-                    if not line:
-                        break
-                    text = line.decode('utf-8', errors='ignore').strip()
-                    if text:
-                        print(f"[SimpleMCS] Init response: {text}")
-                        consumed += 1
-            except asyncio.TimeoutError:
-                pass  # No more data
-
+            consumed = await self._consume_init_responses(len(init_commands))
             print(f"[SimpleMCS] Consumed {consumed} init response lines")
 
             self._connected = True
@@ -137,6 +335,46 @@ class SimpleMCSClient:
             self._writer = None
             raise ConnectionError(f"Failed to connect: {e}")
 
+    async def _consume_init_responses(self, expected: int) -> int:
+        """
+        Read and drop the replies to the init commands.
+
+        Stops as soon as `expected` replies have completed (a line ending in
+        a completion marker). A device that answers differently is covered
+        by the idle timeout once replies start, and by CONNECT_TIMEOUT
+        before they do.
+
+        Returns:
+            Number of non-empty lines consumed
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.CONNECT_TIMEOUT
+        consumed = 0
+        completed = 0
+
+        while completed < expected and consumed < 20:  # Max 20 lines to prevent infinite loop
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                line = await asyncio.wait_for(
+                    self._reader.readline(),
+                    timeout=min(self.RESPONSE_IDLE_TIMEOUT, remaining) if consumed else remaining
+                )
+            except asyncio.TimeoutError:
+                break  # No more data
+            if not line:
+                break
+
+            line = line.strip()
+            if line:
+                print(f"[SimpleMCS] Init response: {line.decode('utf-8', errors='ignore')}")
+                consumed += 1
+                if _ends_response(line):
+                    completed += 1
+
+        return consumed
+
     async def disconnect(self) -> None:
         """Disconnect from MCS server."""
         print("[SimpleMCS] Disconnecting")
@@ -179,57 +417,65 @@ class SimpleMCSClient:
 
         print("[SimpleMCS] Reconnection complete")
 
-    async def _write_line(self, command: str) -> None:
-        """Write a command line to the server."""
+    async def _write_line(self, command: Union[str, bytes]) -> None:
+        """Write a command string, or already-encoded bytes ending in \\r\\n."""
         if not self._writer:
             raise ConnectionError("Not connected")
 
-        self._writer.write(f"{command}\r\n".encode('utf-8'))
+        if isinstance(command, str):
+            command = f"{command}\r\n".encode('utf-8')
+        self._writer.write(command)
         await self._writer.drain()
 
-    async def _read_response(self, timeout: float = COMMAND_TIMEOUT) -> List[str]:
+    async def _read_response(self, timeout: float = COMMAND_TIMEOUT) -> List[bytes]:
         """
         Read response lines until we get a completion marker or timeout.
 
-        Filters out event notifications (StateChanged) to get actual command responses.
+        Lines are returned stripped but undecoded, so XML responses can go
+        straight to the parser.
         """
         if not self._reader:
             raise ConnectionError("Not connected")
 
-        lines = []
-        deadline = asyncio.get_event_loop().time() + timeout
+        lines: List[bytes] = []
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
 
         while True:
-            remaining = deadline - asyncio.get_event_loop().time()
+            remaining = deadline - loop.time()
             if remaining <= 0:
                 break
 
+            # Wait the whole remaining time for the first line; after that
+            # a quiet spell ends a response that has no completion marker
             try:
                 line = await asyncio.wait_for(
                     self._reader.readline(),
-                    timeout=min(0.5, remaining)
+                    timeout=min(self.RESPONSE_IDLE_TIMEOUT, remaining) if lines else remaining
                 )
+            except asyncio.TimeoutError:
+                break
 
-                if not line:
-                    break
-
-                text = line.decode('utf-8', errors='ignore').strip()
-                if text:
-                    lines.append(text)
+            if not line:
+                break
 
-                # Check for completion markers
-                if any(marker in text for marker in ['=Done', 'Ok', '</']) or len(lines) > 100:
-                    break
+            line = line.strip()
+            if line:
+                lines.append(line)
 
-            except asyncio.TimeoutError:
-                if lines:  # Got some response, that's OK
-                    break
+            # Check for completion markers
+            if _ends_response(line) or b'</' in line:
+                break
 
         return lines
 
-    async def _execute_command(self, command: str, retry_on_error: bool = True) -> List[str]:
+    async def _execute_command(self, command: Union[str, bytes], retry_on_error: bool = True) -> List[str]:
+        """Execute a command and return its decoded response lines."""
+        return _decode_lines(await self._execute_raw(command, retry_on_error))
+
+    async def _execute_raw(self, command: Union[str, bytes], retry_on_error: bool = True) -> List[bytes]:
         """
-        Execute a command with simple error handling.
+        Execute a command with simple error handling, returning raw lines.
 
         Pattern: send → read response → if error, reconnect and retry once
         """
@@ -239,7 +485,7 @@ class SimpleMCSClient:
             try:
                 # Check if connected
                 if not self._connected or not self._writer:
-                    print(f"[SimpleMCS] Not connected, connecting for command: {command}")
+                    print(f"[SimpleMCS] Not connected, connecting for command: {command!r}")
                     await self.connect()
 
                 # Send command
@@ -247,13 +493,14 @@ class SimpleMCSClient:
 
                 # Read response immediately
                 response = await self._read_response()
+                self._consecutive_failures = 0
                 return response
 
             except (ConnectionError, BrokenPipeError, OSError, asyncio.TimeoutError,
                     ConnectionResetError, ConnectionAbortedError, Exception) as e:
                 # Catch all connection-related errors including Windows-specific ones
                 # (WinError 10054: connection forcibly closed)
-                print(f"[SimpleMCS] Command '{command}' failed: {type(e).__name__}: {e}")
+                print(f"[SimpleMCS] Command {command!r} failed: {type(e).__name__}: {e}")
 
                 # Mark as disconnected
                 self._connected = False
@@ -261,29 +508,88 @@ class SimpleMCSClient:
                 # Retry once if allowed
                 if retry_on_error:
                     print(f"[SimpleMCS] Retrying after reconnect...")
-
-                    # Clean disconnect
-                    await self.disconnect()
-
-                    # Wait for device to settle
-                    await asyncio.sleep(2.0)
-
-                    # Reconnect fresh
-                    await self.connect()
-
-                    # Restore instance if one was set
-                    if self._current_instance:
-                        print(f"[SimpleMCS] Restoring instance: {self._current_instance}")
-                        await self._write_line(f"SetInstance {self._current_instance}")
-                        await asyncio.sleep(1.0)
+                    await self._reconnect_for_retry()
 
                     # Retry the command (no retry this time to avoid infinite loop)
                     await self._write_line(command)
                     response = await self._read_response()
+                    self._consecutive_failures = 0
                     return response
                 else:
                     raise
 
+    async def _reconnect_for_retry(self) -> None:
+        """
+        Reconnect after a failed command, ready to resend it.
+
+        A single failure (typically an idle connection the device dropped)
+        reconnects straight away. Back-to-back failures wait with exponential
+        backoff first, so a device that is really down isn't hammered.
+        """
+        self._consecutive_failures += 1
+        await self.disconnect()
+
+        if self._consecutive_failures > 1:
+            delay = min(
+                self.RECONNECT_BACKOFF_START * 2 ** (self._consecutive_failures - 2),
+                self.RECONNECT_BACKOFF_MAX,
+            )
+            await asyncio.sleep(delay)
+
+        await self.connect()
+
+        # Restore instance if one was set; its reply confirms the switch
+        if self._current_instance:
+            print(f"[SimpleMCS] Restoring instance: {self._current_instance}")
+            await self._write_line(
+                self._CMD_SET_INSTANCE % self._current_instance.encode('utf-8')
+            )
+            await self._read_response()
+
+    async def _execute_pipeline(self, commands: List[bytes]) -> List[List[bytes]]:
+        """
+        Send several commands in one write and read their responses in order.
+
+        The server answers commands in the order it receives them, so one
+        round trip serves the whole batch. The command lock is held until
+        the last response is read. Only the last command may have a
+        response without a completion marker, since such a response ends
+        only when the connection goes quiet.
+
+        Returns:
+            Raw response lines for each command, in command order
+        """
+        self._ensure_lock()
+        assert self._command_lock is not None
+
+        async with self._command_lock:
+            for attempt in range(2):
+                try:
+                    if not self._connected or not self._writer:
+                        await self.connect()
+                    writer = self._writer
+                    if writer is None:
+                        raise ConnectionError("Not connected")
+
+                    writer.writelines(commands)
+                    await writer.drain()
+
+                    responses = [await self._read_response() for _ in commands]
+                    self._consecutive_failures = 0
+                    return responses
+
+                except Exception as e:
+                    print(f"[SimpleMCS] Pipeline {commands} failed: {type(e).__name__}: {e}")
+                    self._connected = False
+                    if attempt:
+                        raise
+
+                    # Reconnect and retry once, as _execute_raw does
+                    await self._reconnect_for_retry()
+
+        # The second attempt always returns or raises
+        raise AssertionError("unreachable")
+
     # ==================== CONFIGURATION ====================
 
     async def set_instance(self, instance_name: str) -> None:
@@ -293,7 +599,7 @@ class SimpleMCSClient:
         Args:
             instance_name: e.g., "Music_Server_A", "Music_Server_B", etc.
         """
-        await self._execute_command(f"SetInstance {instance_name}")
+        await self._execute_raw(self._CMD_SET_INSTANCE % instance_name.encode('utf-8'))
         self._current_instance = instance_name
 
     # ==================== BROWSING ====================
@@ -305,15 +611,13 @@ class SimpleMCSClient:
         Returns:
             List of instance names (e.g., ["Music_Server_A", "Music_Server_B"])
         """
-        response = await self._execute_command("BrowseInstancesEX")
+        response = await self._execute_raw(self._CMD_BROWSE_INSTANCES)
 
         instances = []
-        xml_data = '\n'.join(response)
+        xml_data = b'\n'.join(response)
 
         try:
-            root = ET.fromstring(xml_data)
-            # Find all InstanceInfoEx elements
-            for instance in root.findall('.//InstanceInfoEx'):
+            for instance in _iter_elements(xml_data, 'InstanceInfoEx'):
                 instance_name = instance.get('instance', '')
                 if instance_name:
                     instances.append(instance_name)
@@ -328,37 +632,11 @@ class SimpleMCSClient:
         Uses BrowseRadioStations command.
         Returns list of radio station items.
         """
-        # Use _execute_command for proper reconnection handling
-        response = await self._execute_command("BrowseRadioStations")
+        # Use _execute_raw for proper reconnection handling
+        response = await self._execute_raw(self._CMD_BROWSE_RADIO_STATIONS)
 
-        items = []
-
-        # Parse XML response
-        xml_data = '\n'.join(response)
         print(f"[SimpleMCS] BrowseRadioStations response: {len(response)} lines")
-
-        try:
-            # Parse using ElementTree
-            root = ET.fromstring(xml_data)
-
-            # Find all RadioStation elements
-            for station in root.findall('.//RadioStation'):
-                name = station.get('name', 'Unknown')
-                guid = station.get('guid', '')
-                desc = station.get('desc', name)
-
-                items.append(PickListItem(
-                    index=len(items),
-                    title=name,
-                    guid=guid,
-                    item_type="RadioStation",
-                    metadata={'desc': desc}
-                ))
-
-        except Exception as e:
-            print(f"[SimpleMCS] Error parsing radio stations: {e}")
-            import traceback
-            traceback.print_exc()
+        items = await asyncio.to_thread(_parse_radio_stations, b'\n'.join(response))
 
         print(f"[SimpleMCS] Parsed {len(items)} radio stations")
         if items:
@@ -375,7 +653,7 @@ class SimpleMCSClient:
         Args:
             guid: Station GUID from BrowseRadioStations
         """
-        await self._execute_command(f"PlayRadioStation {guid}")
+        await self._execute_raw(self._CMD_PLAY_RADIO_STATION % guid.encode('utf-8'))
 
     async def play_radio_station_by_name(self, name: str) -> None:
         """
@@ -384,10 +662,15 @@ class SimpleMCSClient:
         Args:
             name: Station name
         """
-        await self._execute_command(f'PlayRadioStation "{name}"')
+        await self._execute_raw(self._CMD_PLAY_RADIO_STATION % f'"{name}"'.encode('utf-8'))
 
     # ==================== LOCAL MUSIC LIBRARY ====================
 
+    async def _browse(self, command: bytes, tag: str, fields: _FieldSchema) -> List[Dict[str, Any]]:
+        """Send a browse command and parse its <tag> elements off the event loop."""
+        response = await self._execute_raw(command)
+        return await asyncio.to_thread(_parse_elements, b'\n'.join(response), tag, fields)
+
     async def browse_now_playing(self) -> List[Dict[str, Any]]:
         """
         Browse the current queue/now playing list.
@@ -395,33 +678,7 @@ class SimpleMCSClient:
         Returns:
             List of tracks with metadata (name, artist, album, guid, duration, etc.)
         """
-        response = await self._execute_command("BrowseNowPlaying")
-
-        tracks = []
-        xml_data = '\n'.join(response)
-
-        try:
-            root = ET.fromstring(xml_data)
-
-            # Find all Title elements
-            for title in root.findall('.//Title'):
-                track = {
-                    'guid': title.get('guid', ''),
-                    'name': title.get('name', 'Unknown'),
-                    'artist': title.get('artist', ''),
-                    'album': title.get('album', ''),
-                    'album_guid': title.get('albumGuid', ''),
-                    'duration': title.get('duration', '00:00:00'),
-                    'track_number': int(title.get('track', 0)),
-                    'queue_index': int(title.get('npIndex', 0)),
-                    'is_now_playing': title.get('np', '') == '1'
-                }
-                tracks.append(track)
-
-        except Exception as e:
-            print(f"[SimpleMCS] Error parsing now playing: {e}")
-
-        return tracks
+        return await self._browse(self._CMD_BROWSE_NOW_PLAYING, 'Title', _NOW_PLAYING_FIELDS)
 
     async def browse_albums(self) -> List[Dict[str, str]]:
         """
@@ -430,27 +687,7 @@ class SimpleMCSClient:
         Returns:
             List of albums with name and GUID
         """
-        response = await self._execute_command("BrowseAlbums")
-
-        albums = []
-        xml_data = '\n'.join(response)
-
-        try:
-            root = ET.fromstring(xml_data)
-
-            # Find all Album elements
-            for album in root.findall('.//Album'):
-                albums.append({
-                    'guid': album.get('guid', ''),
-                    'name': album.get('name', 'Unknown Album'),
-                    'artist': album.get('artist', ''),
-                    'unique_name': album.get('unique', '')
-                })
-
-        except Exception as e:
-            print(f"[SimpleMCS] Error parsing albums: {e}")
-
-        return albums
+        return await self._browse(self._CMD_BROWSE_ALBUMS, 'Album', _ALBUM_FIELDS)
 
     async def browse_artists(self) -> List[Dict[str, str]]:
         """
@@ -459,25 +696,7 @@ class SimpleMCSClient:
         Returns:
             List of artists with name and GUID
         """
-        response = await self._execute_command("BrowseArtists")
-
-        artists = []
-        xml_data = '\n'.join(response)
-
-        try:
-            root = ET.fromstring(xml_data)
-
-            # Find all Artist elements
-            for artist in root.findall('.//Artist'):
-                artists.append({
-                    'guid': artist.get('guid', ''),
-                    'name': artist.get('name', 'Unknown Artist')
-                })
-
-        except Exception as e:
-            print(f"[SimpleMCS] Error parsing artists: {e}")
-
-        return artists
+        return await self._browse(self._CMD_BROWSE_ARTISTS, 'Artist', _ARTIST_FIELDS)
 
     async def browse_album_titles(self, album_guid: str) -> List[Dict[str, Any]]:
         """
@@ -489,29 +708,11 @@ class SimpleMCSClient:
         Returns:
             List of tracks in the album
         """
-        response = await self._execute_command(f"BrowseAlbumTitles {album_guid}")
-
-        tracks = []
-        xml_data = '\n'.join(response)
-
-        try:
-            root = ET.fromstring(xml_data)
-
-            # Find all Title elements
-            for title in root.findall('.//Title'):
-                tracks.append({
-                    'guid': title.get('guid', ''),
-                    'name': title.get('name', 'Unknown'),
-                    'artist': title.get('artist', ''),
-                    'album': title.get('album', ''),
-                    'duration': title.get('duration', '00:00:00'),
-                    'track_number': int(title.get('track', 0))
-                })
-
-        except Exception as e:
-            print(f"[SimpleMCS] Error parsing album titles: {e}")
-
-        return tracks
+        return await self._browse(
+            self._CMD_BROWSE_ALBUM_TITLES % album_guid.encode('utf-8'),
+            'Title',
+            _ALBUM_TITLE_FIELDS,
+        )
 
     async def play_title(self, guid: str) -> None:
         """
@@ -520,7 +721,7 @@ class SimpleMCSClient:
         Args:
             guid: Track GUID
         """
-        await self._execute_command(f"PlayTitle {guid}")
+        await self._execute_raw(self._CMD_PLAY_TITLE % guid.encode('utf-8'))
 
     async def play_album(self, guid: str) -> None:
         """
@@ -529,7 +730,7 @@ class SimpleMCSClient:
         Args:
             guid: Album GUID
         """
-        await self._execute_command(f"PlayAlbum {guid}")
+        await self._execute_raw(self._CMD_PLAY_ALBUM % guid.encode('utf-8'))
 
     async def play_artist(self, guid: str) -> None:
         """
@@ -538,11 +739,11 @@ class SimpleMCSClient:
         Args:
             guid: Artist GUID
         """
-        await self._execute_command(f"PlayArtist {guid}")
+        await self._execute_raw(self._CMD_PLAY_ARTIST % guid.encode('utf-8'))
 
     async def play_all_music(self) -> None:
         """Play all music in the library."""
-        await self._execute_command("PlayAllMusic")
+        await self._execute_raw(self._CMD_PLAY_ALL_MUSIC)
 
     # ==================== NAVIGATION ====================
 
@@ -551,67 +752,49 @@ class SimpleMCSClient:
         Select/acknowledge a pick list item by index.
         Used to navigate into menus or play items.
         """
-        await self._execute_command(f"AckPickItem {index}")
+        await self._execute_raw(self._CMD_ACK_PICK_ITEM % index)
 
     async def set_radio_filter(self, filter_text: str) -> None:
         """Set radio station filter text."""
-        import base64
         # Base64 encode the filter text
-        encoded = base64.b64encode(filter_text.encode('utf-8')).decode('ascii')
-        await self._execute_command(f"SetRadioFilter {encoded}")
+        encoded = base64.b64encode(filter_text.encode('utf-8'))
+        await self._execute_raw(self._CMD_SET_RADIO_FILTER % encoded)
 
     # ==================== STATUS ====================
 
     async def get_status(self) -> Dict[str, Any]:
         """Get current MCS status."""
-        response = await self._execute_command("GetStatus")
-
-        status = {
-            'volume': 0,
-            'mute': False,
-            'play_state': 'Unknown',
-            'now_playing': {},
-        }
-
-        # Parse status response
-        # GetStatus returns lines like: "ReportState Music_Server_A Volume=50"
-        for line in response:
-            if '=' not in line:
-                continue
-
-            # Handle "ReportState Instance_Name Key=Value" format
-            if line.startswith('ReportState'):
-                parts = line.split(None, 2)  # Split on whitespace, max 2 splits
-                if len(parts) >= 3:
-                    key_value = parts[2]  # Extract "Key=Value" part
-                else:
-                    continue
-            else:
-                key_value = line
-
-            # Now extract key and value
-            if '=' in key_value:
-                key, value = key_value.split('=', 1)
-                key = key.strip()
-                value = value.strip()
-
-                # Parse known fields
-                if key == 'Volume':
-                    try:
-                        status['volume'] = int(value)
-                    except:
-                        pass
-                elif key == 'Mute':
-                    status['mute'] = value.lower() == 'true'
-                elif key == 'PlayState':
-                    status['play_state'] = value
-                elif key == 'TrackName':
-                    status['now_playing']['track'] = value
-                elif key == 'ArtistName':
-                    status['now_playing']['artist'] = value
-                elif key == 'MediaName':
-                    status['now_playing']['album'] = value
-                elif key == 'StationName':
-                    status['now_playing']['station'] = value
-
-        return status
+        response = await self._execute_raw(self._CMD_GET_STATUS)
+        return _parse_status(response)
+
+    async def fetch_initial_state(
+        self,
+    ) -> Tuple[List[Dict[str, str]], List[Dict[str, str]], Dict[str, Any]]:
+        """
+        Fetch albums, artists and status in a single round trip.
+
+        Responses are framed by their completion markers. An empty list
+        sent as a self-closing root (e.g. <Albums total="0"/>) has none, so
+        the albums read would also take the artists reply and the status
+        read would wait out COMMAND_TIMEOUT. Use browse_albums,
+        browse_artists and get_status separately on a server that answers
+        that way.
+
+        Returns:
+            Tuple of (albums, artists, status) as returned by browse_albums,
+            browse_artists and get_status
+        """
+        albums_response, artists_response, status_response = await self._execute_pipeline(
+            [self._CMD_BROWSE_ALBUMS, self._CMD_BROWSE_ARTISTS, self._CMD_GET_STATUS]
+        )
+
+        # The two lists can be large; parse them off the event loop
+        albums, artists = await asyncio.gather(
+            asyncio.to_thread(
+                _parse_elements, b'\n'.join(albums_response), 'Album', _ALBUM_FIELDS
+            ),
+            asyncio.to_thread(
+                _parse_elements, b'\n'.join(artists_response), 'Artist', _ARTIST_FIELDS
+            ),
+        )
+        return albums, artists, _parse_status(status_response)
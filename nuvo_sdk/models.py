@@ -1,10 +1,22 @@
 """Data models for NuVo MusicPort system."""
 
+import sys
 from dataclasses import dataclass
-from typing import Optional, List
+from typing import TYPE_CHECKING, Optional, List
 
+# Models are created per zone, source and event; use slots where the
+# interpreter supports them with dataclass defaults (Python 3.10+).
+# Type checkers can't see through the conditional alias, so they get the
+# plain decorator.
+if TYPE_CHECKING:
+    from dataclasses import dataclass as slots_dataclass
+elif sys.version_info >= (3, 10):
+    slots_dataclass = dataclass(slots=True)
+else:
+    slots_dataclass = dataclass
 
-@dataclass
+
+@slots_dataclass
 class Zone:
     """Represents a zone in the NuVo system."""
 
@@ -27,7 +39,7 @@ class Zone:
     is_locked: bool = False
 
 
-@dataclass
+@slots_dataclass
 class Source:
     """Represents a music source in the NuVo system."""
 
@@ -59,7 +71,7 @@ class SystemStatus:
     sources: List[Source]
 
 
-@dataclass
+@slots_dataclass
 class StateChangeEvent:
     """Represents a state change event from the device."""
 
@@ -1,12 +1,32 @@
 """Protocol parser for NuVo MusicPort MRAD protocol."""
 
-import re
 import xml.etree.ElementTree as ET
-from typing import List, Dict, Optional, Tuple
+from typing import Any, Callable, List, Dict, Optional, Tuple
 from .models import Zone, Source, StateChangeEvent
 from .exceptions import ProtocolError
 
 
+def _split_state_line(line: str, kind: str) -> Optional[Tuple[str, str, str]]:
+    """
+    Split a "<kind> <target> <property>=<value>" line.
+
+    Splits at the first "=", so values may themselves contain "=".
+
+    Returns:
+        Tuple of (target, property, value) or None if the line doesn't match
+    """
+    parts = line.split(None, 2)
+    if len(parts) != 3 or parts[0] != kind:
+        return None
+
+    property_name, sep, value = parts[2].partition("=")
+    value = value.strip()
+    if not sep or not property_name or not value:
+        return None
+
+    return parts[1], property_name, value
+
+
 def build_command(command: str) -> bytes:
     """
     Build a command string with proper line ending.
@@ -39,29 +59,30 @@ def parse_zones_xml(xml_data: str) -> List[Zone]:
         root = ET.fromstring(xml_data)
         zones = []
 
-        for zone_elem in root.findall("Zone"):
+        for zone_elem in root.iterfind("Zone"):
+            attrs = zone_elem.attrib
             # Parse boolean values
-            is_on = zone_elem.get("isOn", "False") == "True"
+            is_on = attrs.get("isOn", "False") == "True"
             mute = False  # Will be set from GetStatus
             do_not_disturb = False
             is_locked = False
 
             zone = Zone(
-                guid=zone_elem.get("guid", ""),
-                name=zone_elem.get("name", ""),
-                zone_id=zone_elem.get("id", ""),
-                zone_number=int(zone_elem.get("id", "Zone_0").split("_")[1]),
+                guid=attrs.get("guid", ""),
+                name=attrs.get("name", ""),
+                zone_id=attrs.get("id", ""),
+                zone_number=int(attrs.get("id", "Zone_0").split("_")[1]),
                 is_on=is_on,
                 volume=0,  # Will be set from GetStatus
                 mute=mute,
-                source_id=int(zone_elem.get("sourceId", "0")),
-                source_name=zone_elem.get("sourceName", ""),
-                source_guid=zone_elem.get("sGuid", ""),
+                source_id=int(attrs.get("sourceId", "0")),
+                source_name=attrs.get("sourceName", ""),
+                source_guid=attrs.get("sGuid", ""),
                 party_mode="Off",  # Will be set from GetStatus
                 max_volume=79,  # Default, will be set from GetStatus
                 min_volume=0,
-                zone_group_name=zone_elem.get("gName", ""),
-                zone_group_id=zone_elem.get("gId", ""),
+                zone_group_name=attrs.get("gName", ""),
+                zone_group_id=attrs.get("gId", ""),
                 do_not_disturb=do_not_disturb,
                 is_locked=is_locked,
             )
@@ -92,20 +113,21 @@ def parse_sources_xml(xml_data: str) -> List[Source]:
         root = ET.fromstring(xml_data)
         sources = []
 
-        for source_elem in root.findall("Source"):
+        for source_elem in root.iterfind("Source"):
+            attrs = source_elem.attrib
             source = Source(
-                guid=source_elem.get("guid", ""),
-                name=source_elem.get("name", ""),
-                source_id=int(source_elem.get("sId", "0")),
-                is_smart=source_elem.get("smart", "0") == "1",
-                is_network=source_elem.get("nnet", "0") == "1",
-                zone_count=int(source_elem.get("znCount", "0")),
-                zone_list=source_elem.get("znList", ""),
-                metadata1=source_elem.get("m1", ""),
-                metadata2=source_elem.get("m2", ""),
-                metadata3=source_elem.get("m3", ""),
-                metadata4=source_elem.get("m4", ""),
-                metadata_art=source_elem.get("mArt", ""),
+                guid=attrs.get("guid", ""),
+                name=attrs.get("name", ""),
+                source_id=int(attrs.get("sId", "0")),
+                is_smart=attrs.get("smart", "0") == "1",
+                is_network=attrs.get("nnet", "0") == "1",
+                zone_count=int(attrs.get("znCount", "0")),
+                zone_list=attrs.get("znList", ""),
+                metadata1=attrs.get("m1", ""),
+                metadata2=attrs.get("m2", ""),
+                metadata3=attrs.get("m3", ""),
+                metadata4=attrs.get("m4", ""),
+                metadata_art=attrs.get("mArt", ""),
             )
             sources.append(source)
 
@@ -132,17 +154,16 @@ def parse_state_changed(line: str) -> Optional[StateChangeEvent]:
     Returns:
         StateChangeEvent object or None if not a state change
     """
-    # Match pattern: "StateChanged <target> <property>=<value>"
-    match = re.match(r"StateChanged\s+(\S+)\s+(\S+)=(.+)", line.strip())
-    if not match:
+    parsed = _split_state_line(line, "StateChanged")
+    if not parsed:
         return None
 
-    target, property_name, value = match.groups()
+    target, property_name, value = parsed
 
     return StateChangeEvent(
         target=target,
         property=property_name,
-        value=value.strip(),
+        value=value,
     )
 
 
@@ -158,12 +179,23 @@ def parse_report_state(line: str) -> Optional[Tuple[str, str, str]]:
     Returns:
         Tuple of (target, property, value) or None
     """
-    match = re.match(r"ReportState\s+(\S+)\s+(\S+)=(.+)", line.strip())
-    if not match:
-        return None
+    return _split_state_line(line, "ReportState")
+
+
+def _is_true(value: str) -> bool:
+    return value == "True"
+
 
-    target, property_name, value = match.groups()
-    return target, property_name, value.strip()
+# ReportState zone property -> (Zone attribute, value converter)
+_ZONE_FIELDS: Dict[str, Tuple[str, Callable[[str], Any]]] = {
+    "Volume": ("volume", int),
+    "PowerOn": ("is_on", _is_true),
+    "Mute": ("mute", _is_true),
+    "PartyMode": ("party_mode", str),
+    "MaxVolume": ("max_volume", int),
+    "MinVolume": ("min_volume", int),
+    "DoNotDisturb": ("do_not_disturb", _is_true),
+}
 
 
 def update_zones_from_status(zones: List[Zone], status_lines: List[str]) -> None:
@@ -178,32 +210,24 @@ def update_zones_from_status(zones: List[Zone], status_lines: List[str]) -> None
     zone_map = {z.zone_id: z for z in zones}
 
     for line in status_lines:
-        parsed = parse_report_state(line)
-        if not parsed:
+        # Most lines are for the device, sources or zone groups; drop them on
+        # the target before looking at the property
+        parts = line.split(None, 2)
+        if len(parts) != 3 or parts[1] not in zone_map or parts[0] != "ReportState":
             continue
 
-        target, prop, value = parsed
+        prop, _, value = parts[2].partition("=")
+        field = _ZONE_FIELDS.get(prop)
+        value = value.strip()
+        if field is None or not value:
+            continue
 
         # Update zone properties
-        if target in zone_map:
-            zone = zone_map[target]
-            try:
-                if prop == "Volume":
-                    zone.volume = int(value)
-                elif prop == "PowerOn":
-                    zone.is_on = value == "True"
-                elif prop == "Mute":
-                    zone.mute = value == "True"
-                elif prop == "PartyMode":
-                    zone.party_mode = value
-                elif prop == "MaxVolume":
-                    zone.max_volume = int(value)
-                elif prop == "MinVolume":
-                    zone.min_volume = int(value)
-                elif prop == "DoNotDisturb":
-                    zone.do_not_disturb = value == "True"
-            except (ValueError, AttributeError):
-                pass  # Skip invalid values
+        attribute, convert = field
+        try:
+            setattr(zone_map[parts[1]], attribute, convert(value))
+        except ValueError:
+            pass  # Skip invalid values
 
 
 def parse_system_properties(status_lines: List[str]) -> Dict[str, str]:
@@ -219,14 +243,14 @@ def parse_system_properties(status_lines: List[str]) -> Dict[str, str]:
     system_props = {}
 
     for line in status_lines:
-        parsed = parse_report_state(line)
-        if not parsed:
+        # System properties (target is device name like "NV-I8G"); check
+        # that before parsing the rest of the line
+        if not line.startswith("ReportState NV-"):
             continue
 
-        target, prop, value = parsed
-
-        # System properties (target is device name like "NV-I8G")
-        if target.startswith("NV-"):
+        parsed = parse_report_state(line)
+        if parsed:
+            _, prop, value = parsed
             system_props[prop] = value
 
     return system_props
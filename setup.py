@@ -43,6 +43,7 @@ setup(
             "fastapi>=0.104.0",
             "uvicorn[standard]>=0.24.0",
             "websockets>=12.0",
+            "orjson>=3.9.0",
         ],
     },
 )
@@ -20,6 +20,8 @@ async def test_websocket():
             while True:
                 message = await websocket.recv()
                 event = json.loads(message)
+                if event.get("type") != "state_change":
+                    continue  # Server heartbeat
 
                 print(
                     f"Event: {event['target']} {event['property']}={event['value']}"
@@ -0,0 +1,274 @@
+"""Unit tests for NuVoClient against an in-process fake device."""
+
+import asyncio
+
+import pytest
+from nuvo_sdk import NuVoClient
+from nuvo_sdk.models import StateChangeEvent
+
+
+ZONES_XML = (
+    '<Zones total="1" more="false"><Zone guid="00010000-84e4-4cf5-b0bc-ab828737ac30" '
+    'name="Kitchen" id="Zone_1" isOn="True" sourceId="1" sourceName="Music Server A" />'
+    "</Zones>"
+)
+SOURCES_XML = (
+    '<Sources total="1" more="false"><Source guid="00000001-84e4-4cf5-b0bc-ab828737ac30" '
+    'name="Music Server A" smart="1" nnet="0" znCount="1" sId="1" /></Sources>'
+)
+
+
+class FakeDevice:
+    """Minimal MRAD server that records received commands."""
+
+    def __init__(self):
+        self.commands = []
+        self.writes = 0
+        self.multiline_xml = False
+        self.delays = {}  # command verb -> seconds before its reply is sent
+        self._server = None
+
+    async def start(self) -> int:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+    def _reply(self, command: str) -> bytes:
+        if command == "*":
+            return b"Welcome to NuVo MusicPort\x07"
+        if command in NuVoClient.INIT_COMMANDS:
+            return b"Ok\r\n"
+        if command == "BrowseZones":
+            return ZONES_XML.encode() + b"\r\n"
+        if command == "BrowseSources" and self.multiline_xml:
+            return SOURCES_XML.replace("><", ">\r\n<").encode() + b"\r\n"
+        if command == "BrowseSources":
+            return SOURCES_XML.encode() + b"\r\n"
+        if command == "GetStatus":
+            return (
+                b"ReportState NV-I8G DeviceType=NV-I8G\r\n"
+                b"ReportState NV-I8G FirmwareVersion=1.2.3\r\n"
+                b"ReportState Zone_1 Volume=42\r\n"
+                b"ReportState Zone_1 Mute=True\r\n"
+            )
+        if command.startswith("Volume "):
+            level, zone = command.split()[1:]
+            return f"StateChanged Zone_{zone} Volume={level}\r\n".encode()
+        return b"Ok\r\n"
+
+    async def _handle(self, reader, writer):
+        try:
+            while True:
+                data = await reader.read(4096)
+                if not data:
+                    break
+                self.writes += 1
+                for command in data.decode().split("\r"):
+                    if command:
+                        self.commands.append(command)
+                        delay = self.delays.get(command.split()[0])
+                        if delay:
+                            asyncio.get_running_loop().call_later(
+                                delay, writer.write, self._reply(command)
+                            )
+                        else:
+                            writer.write(self._reply(command))
+                await writer.drain()
+        finally:
+            writer.close()
+
+
+@pytest.fixture
+async def device():
+    fake = FakeDevice()
+    fake.port = await fake.start()
+    yield fake
+    await fake.stop()
+
+
+@pytest.fixture
+async def client(device):
+    nuvo = NuVoClient("127.0.0.1", device.port)
+    await nuvo.connect()
+    yield nuvo
+    await nuvo.disconnect()
+
+
+class TestConnect:
+    """Test connection setup."""
+
+    async def test_initialization_is_one_write(self, client, device):
+        """Wake-up and setup commands share a single write."""
+        assert device.commands[:3] == ["*", *NuVoClient.INIT_COMMANDS]
+        assert device.writes == 1
+
+    async def test_disconnect_stops_listener_without_cancel(self, device):
+        """The listener exits on EOF rather than being cancelled."""
+        nuvo = NuVoClient("127.0.0.1", device.port)
+        await nuvo.connect()
+        listener = nuvo._listener_task
+
+        await nuvo.disconnect()
+
+        assert listener.done() and not listener.cancelled()
+        assert not nuvo._connected
+
+    async def test_reconnect_after_drop_stops_old_dispatcher(self, device):
+        """Reconnecting after the device drops doesn't leak a dispatcher."""
+        nuvo = NuVoClient("127.0.0.1", device.port)
+        await nuvo.connect()
+        old_dispatcher = nuvo._dispatcher_task
+        nuvo._writer.transport.abort()
+        await asyncio.wait_for(nuvo._listener_task, timeout=1.0)
+
+        await nuvo.connect()
+
+        assert old_dispatcher.done()
+        assert not nuvo._dispatcher_task.done()
+        await nuvo.disconnect()
+
+
+class TestGetStatus:
+    """Test the pipelined status fetch."""
+
+    async def test_status_is_one_round_trip(self, client, device):
+        """Zones, sources and status are requested in a single write."""
+        device.commands.clear()
+        writes_before = device.writes
+
+        status = await client.get_status()
+
+        assert device.commands == ["BrowseZones", "BrowseSources", "GetStatus"]
+        assert device.writes == writes_before + 1
+        assert status.device_type == "NV-I8G"
+        assert status.firmware_version == "1.2.3"
+        assert status.zones[0].name == "Kitchen"
+        assert status.zones[0].volume == 42
+        assert status.zones[0].mute is True
+        assert status.sources[0].name == "Music Server A"
+
+
+    async def test_multiline_xml_is_one_response(self, client, device):
+        """An XML list split across lines is read and parsed as one response."""
+        device.multiline_xml = True
+
+        sources = await client.get_sources()
+
+        assert [s.name for s in sources] == ["Music Server A"]
+
+
+class TestControlCommands:
+    """Test control command synchronization."""
+
+    async def test_returns_on_device_reaction(self, client, device):
+        """A control command completes when the device reacts, not on a timer."""
+        client.CONTROL_ACK_TIMEOUT = 5.0
+        received = asyncio.Queue()
+        client.subscribe(received.put_nowait)
+
+        await asyncio.wait_for(client.set_volume(50, 1), timeout=1.0)
+        event = await asyncio.wait_for(received.get(), timeout=1.0)
+
+        assert device.commands[-1] == "Volume 50 1"
+        assert (event.target, event.value) == ("Zone_1", "50")
+
+    async def test_not_blocked_by_inflight_read(self, client, device):
+        """A control command doesn't wait for a slow read to finish."""
+        # GetStatus has no terminator, so get_zones waits out the idle timeout
+        read = asyncio.create_task(client.get_zones())
+        await asyncio.sleep(0.05)
+
+        await asyncio.wait_for(client.set_volume(50, 1), timeout=0.3)
+
+        assert not read.done()
+        zones = await read
+        assert zones[0].volume == 42
+
+    async def test_late_ack_does_not_end_inflight_read(self, client, device):
+        """An "Ok" arriving after the ack timeout doesn't cut a read short."""
+        device.delays = {"BrowseZones": 0.3, "GetStatus": 0.3, "Power": 0.15}
+        read = asyncio.create_task(client.get_zones())
+        await asyncio.sleep(0.05)
+
+        await client.power_on(1)
+        zones = await read
+
+        assert [z.name for z in zones] == ["Kitchen"]
+        assert zones[0].volume == 42
+        assert device.commands.count("BrowseZones") == 1
+
+    async def test_set_zone_and_is_one_write(self, client, device):
+        """Zone activation and its commands go out together."""
+        writes_before = device.writes
+        device.commands.clear()
+
+        await client.set_zone_and("zone-guid", ["setSource source-guid"])
+
+        assert device.commands == ["setZone zone-guid", "setSource source-guid"]
+        assert device.writes == writes_before + 1
+
+
+class TestEventQueue:
+    """Test decoupling of the listener from subscribers."""
+
+    async def test_slow_subscriber_does_not_block_commands(self, client, device):
+        """Commands complete while a subscriber is still busy with an event."""
+        release = asyncio.Event()
+
+        async def slow_subscriber(event):
+            await release.wait()
+
+        client.subscribe(slow_subscriber)
+        await client.set_volume(50, 1)
+
+        zones = await asyncio.wait_for(client.get_zones(), timeout=2.0)
+
+        assert zones[0].name == "Kitchen"
+        release.set()
+
+    def test_full_queue_drops_oldest(self):
+        """When the queue is full the oldest event makes room."""
+        nuvo = NuVoClient("127.0.0.1")
+        nuvo._event_queue = asyncio.Queue(maxsize=2)
+        for value in ("1", "2", "3"):
+            nuvo._queue_event(StateChangeEvent("Zone_1", "Volume", value))
+
+        queued = [nuvo._event_queue.get_nowait().value for _ in range(2)]
+
+        assert queued == ["2", "3"]
+
+    async def test_falls_back_to_ack_timeout(self, client, device):
+        """Without a reaction the command still completes after the timeout."""
+        client.CONTROL_ACK_TIMEOUT = 0.05
+        device._reply = lambda command: b""
+
+        await asyncio.wait_for(client.power_on(1), timeout=1.0)
+
+        assert device.commands[-1] == "Power On 1"
+
+
+class TestStatusCache:
+    """Test GetStatus reuse between status and zone queries."""
+
+    async def test_get_zones_reuses_recent_status(self, client, device):
+        """get_zones right after get_status doesn't send GetStatus again."""
+        await client.get_status()
+        device.commands.clear()
+
+        zones = await client.get_zones()
+
+        assert device.commands == ["BrowseZones"]
+        assert zones[0].volume == 42
+
+    async def test_control_command_invalidates_status(self, client, device):
+        """A control command forces the next get_zones to refetch status."""
+        await client.get_status()
+        await client.set_volume(50, 1)
+        device.commands.clear()
+
+        await client.get_zones()
+
+        assert device.commands == ["BrowseZones", "GetStatus"]
@@ -0,0 +1,80 @@
+"""Unit tests for event distribution."""
+
+import asyncio
+
+from nuvo_sdk.events import EventManager
+from nuvo_sdk.models import StateChangeEvent
+
+
+def make_event():
+    return StateChangeEvent(target="Zone_1", property="Volume", value="50")
+
+
+class TestEventManager:
+    """Test subscriber dispatch."""
+
+    async def test_sync_and_async_subscribers(self):
+        """Both kinds of callback receive the event."""
+        manager = EventManager()
+        received = []
+
+        async def on_event_async(event):
+            received.append(("async", event.value))
+
+        manager.subscribe(lambda event: received.append(("sync", event.value)))
+        manager.subscribe(on_event_async)
+
+        await manager.notify(make_event())
+
+        assert sorted(received) == [("async", "50"), ("sync", "50")]
+
+    async def test_async_subscribers_run_concurrently(self):
+        """A slow async subscriber doesn't hold up the others."""
+        manager = EventManager()
+        fast_done = asyncio.Event()
+
+        async def slow(event):
+            await asyncio.wait_for(fast_done.wait(), timeout=1.0)
+
+        async def fast(event):
+            fast_done.set()
+
+        manager.subscribe(slow)
+        manager.subscribe(fast)
+
+        await manager.notify(make_event())
+
+        assert fast_done.is_set()
+
+    async def test_subscriber_error_is_contained(self):
+        """A failing subscriber doesn't stop delivery to the rest."""
+        manager = EventManager()
+        received = []
+
+        async def broken(event):
+            raise RuntimeError("boom")
+
+        async def working(event):
+            received.append(event)
+
+        manager.subscribe(broken)
+        manager.subscribe(working)
+
+        await manager.notify(make_event())
+
+        assert len(received) == 1
+
+    async def test_unsubscribe(self):
+        """Unsubscribed callbacks are no longer called."""
+        manager = EventManager()
+        received = []
+
+        async def on_event(event):
+            received.append(event)
+
+        manager.subscribe(on_event)
+        manager.unsubscribe(on_event)
+
+        await manager.notify(make_event())
+
+        assert received == []
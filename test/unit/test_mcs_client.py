@@ -0,0 +1,209 @@
+"""Unit tests for MCSClient."""
+
+import asyncio
+
+import pytest
+from nuvo_sdk.mcs_client import MCSClient
+
+
+class FakeMCSServer:
+    """Minimal MCS server: acks every command, optionally with events first."""
+
+    def __init__(self):
+        self.commands = []
+        self.writes = 0
+        self.events_before_reply = 0
+        self.replies = {}  # command verb -> reply lines instead of "Verb=Ok"
+        self._server = None
+
+    async def start(self) -> int:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader, writer):
+        try:
+            while True:
+                data = await reader.read(4096)
+                if not data:
+                    break
+                self.writes += 1
+                for command in data.decode().split("\r\n"):
+                    if not command:
+                        continue
+                    self.commands.append(command)
+                    for _ in range(self.events_before_reply):
+                        writer.write(b"StateChanged Music_Server_A Volume=10\r\n")
+                    verb = command.split()[0]
+                    for reply in self.replies.get(verb, [f"{verb}=Ok"]):
+                        writer.write(f"{reply}\r\n".encode())
+                await writer.drain()
+        finally:
+            writer.close()
+
+
+@pytest.fixture
+async def server():
+    fake = FakeMCSServer()
+    fake.port = await fake.start()
+    yield fake
+    await fake.stop()
+
+
+@pytest.fixture
+async def mcs(server):
+    client = MCSClient("127.0.0.1", server.port)
+    client.INIT_IDLE_TIMEOUT = 0.05
+    await client.connect()
+    yield client
+    await client.disconnect()
+
+
+def client_with_response(lines):
+    """An MCSClient whose commands all return the given response lines."""
+    mcs = MCSClient("127.0.0.1")
+
+    async def execute(command, timeout=MCSClient.COMMAND_TIMEOUT, retry=True):
+        return lines
+
+    mcs._execute_command = execute
+    return mcs
+
+
+class TestBrowsePickList:
+    """Test pick list parsing."""
+
+    async def test_items_and_attributes(self):
+        """Each PickListItem tag becomes an item with its attributes."""
+        mcs = client_with_response([
+            '<PickList total="2">',
+            '<PickListItem title="Jazz" guid="g1" type="Station" subtitle="x"/>',
+            '<PickListItem guid="g2"/>',
+            '</PickList>',
+        ])
+
+        items = await mcs.browse_pick_list()
+
+        assert [(i.index, i.title, i.guid, i.item_type) for i in items] == [
+            (0, "Jazz", "g1", "Station"),
+            (1, "Item 1", "g2", "Unknown"),
+        ]
+
+
+class TestBrowseInstances:
+    """Test instance list parsing."""
+
+    async def test_instance_names(self):
+        """Instance elements are read by name, ignoring other lines."""
+        mcs = client_with_response([
+            '<InstancesEx>',
+            '<InstanceInfoEx name="Music_Server_A" />',
+            '<InstanceInfoEx name="Music_Server_B" />',
+            '</InstancesEx>',
+            'Ok',
+        ])
+
+        assert await mcs.browse_instances() == ["Music_Server_A", "Music_Server_B"]
+
+    async def test_malformed_response(self):
+        """Unparseable XML yields no instances rather than an error."""
+        mcs = client_with_response(['<InstanceInfoEx name="A"'])
+
+        assert await mcs.browse_instances() == []
+
+
+class TestConnect:
+    """Test connection setup."""
+
+    async def test_init_is_one_write(self, mcs, server):
+        """SetHost and the setup commands go out together."""
+        assert server.commands == ["SetHost 127.0.0.1", *MCSClient.INIT_COMMANDS]
+        assert server.writes == 1
+
+
+class TestCommandResponses:
+    """Test reading responses directly from the stream."""
+
+    async def test_command_before_connect(self):
+        """A command before connect() raises ConnectionError, not TypeError."""
+        with pytest.raises(ConnectionError):
+            await MCSClient("127.0.0.1").set_volume(10)
+
+    async def test_init_replies_are_not_taken_as_responses(self, mcs, server):
+        """The first command reads its own reply, not a leftover init ack."""
+        response = await mcs._execute_command("SetInstance Music_Server_A")
+
+        assert response == ["SetInstance=Ok"]
+
+    async def test_events_are_skipped(self, mcs, server):
+        """StateChanged lines ahead of the reply are not part of it."""
+        server.events_before_reply = 3
+
+        response = await mcs._execute_command("SetVolume 10")
+
+        assert response == ["SetVolume=Ok"]
+
+    async def test_ok_inside_a_line_does_not_end_response(self, mcs, server):
+        """Only a line ending in Ok completes the response, not one containing it."""
+        server.replies["GetMCEStatus"] = [
+            "ReportState Music_Server_A TrackName=Okie Dokie",
+            "ReportState Music_Server_A PlayState=Playing",
+            "GetMCEStatus=Done",
+        ]
+
+        status = await mcs.get_status()
+
+        assert status['now_playing'] == {'track': "Okie Dokie"}
+        assert status['play_state'] == "Playing"
+
+
+    async def test_value_ending_in_ok_does_not_end_response(self, mcs, server):
+        """A status value ending in "Ok" is not taken for a bare Ok."""
+        server.replies["GetMCEStatus"] = [
+            "ReportState Music_Server_A TrackName=It's Ok",
+            "ReportState Music_Server_A PlayState=Playing",
+            "GetMCEStatus=Done",
+        ]
+
+        status = await mcs.get_status()
+        response = await mcs._execute_command("SetInstance Music_Server_A")
+
+        assert status['now_playing'] == {'track': "It's Ok"}
+        assert status['play_state'] == "Playing"
+        assert response == ["SetInstance=Ok"]
+
+class TestGetStatus:
+    """Test GetMCEStatus parsing."""
+
+    async def test_fields(self):
+        """Known keys are converted; unknown and bad values are ignored."""
+        mcs = client_with_response([
+            "ReportState Music_Server_A ServerName=MusicPort",
+            "ReportState Music_Server_A Running=True",
+            "ReportState Music_Server_A Volume=35",
+            "ReportState Music_Server_A Mute=False",
+            "ReportState Music_Server_A PlayState=Playing",
+            "ReportState Music_Server_A SupportedAudioTypes=Pandora,TuneIn",
+            "ReportState Music_Server_A TrackName=So What",
+            "ReportState Music_Server_A Unknown=1",
+            "Ok",
+        ])
+
+        status = await mcs.get_status()
+
+        assert status['server_name'] == "MusicPort"
+        assert status['running'] is True
+        assert status['volume'] == 35
+        assert status['mute'] is False
+        assert status['play_state'] == "Playing"
+        assert status['supported_types'] == ["Pandora", "TuneIn"]
+        assert status['now_playing'] == {'track': "So What"}
+
+    async def test_bad_volume_keeps_default(self):
+        """A non-numeric volume leaves the default in place."""
+        mcs = client_with_response(["ReportState Music_Server_A Volume=loud"])
+
+        assert (await mcs.get_status())['volume'] == 50
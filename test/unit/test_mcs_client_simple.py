@@ -0,0 +1,199 @@
+"""Unit tests for SimpleMCSClient."""
+
+import asyncio
+
+from nuvo_sdk.mcs_client_simple import SimpleMCSClient
+
+from .test_mcs_client import FakeMCSServer
+
+
+def client_with_response(lines):
+    """A SimpleMCSClient whose commands all return the given response lines."""
+    mcs = SimpleMCSClient("127.0.0.1")
+
+    async def execute(command, retry_on_error=True):
+        return [line.encode() for line in lines]
+
+    mcs._execute_raw = execute
+    return mcs
+
+
+class TestBrowse:
+    """Test list parsing."""
+
+    async def test_albums(self):
+        """Nested Album elements are all returned with their attributes."""
+        mcs = client_with_response([
+            '<Albums total="2">',
+            '<Album guid="a1" name="Kind of Blue" artist="Miles Davis" />',
+            '<Album guid="a2" name="Blue Train" />',
+            '</Albums>',
+        ])
+
+        albums = await mcs.browse_albums()
+
+        assert [(a['guid'], a['name'], a['artist']) for a in albums] == [
+            ("a1", "Kind of Blue", "Miles Davis"),
+            ("a2", "Blue Train", ""),
+        ]
+
+    async def test_now_playing_field_types(self):
+        """Numeric and flag attributes are converted; missing ones get defaults."""
+        mcs = client_with_response([
+            '<NowPlaying><Title guid="t1" name="So What" track="1" npIndex="3" np="1" />',
+            '<Title guid="t2" /></NowPlaying>',
+        ])
+
+        tracks = await mcs.browse_now_playing()
+
+        assert (tracks[0]['track_number'], tracks[0]['queue_index']) == (1, 3)
+        assert tracks[0]['is_now_playing'] is True
+        assert tracks[1] == {
+            'guid': "t2", 'name': "Unknown", 'artist': "", 'album': "",
+            'album_guid': "", 'duration': "00:00:00", 'track_number': 0,
+            'queue_index': 0, 'is_now_playing': False,
+        }
+
+    async def test_radio_stations(self):
+        """Stations become pick list items in order."""
+        mcs = client_with_response([
+            '<RadioStations><RadioStation name="Jazz" guid="s1" desc="Cool" />',
+            '<RadioStation name="Rock" guid="s2" /></RadioStations>',
+        ])
+
+        items = await mcs.browse_pick_list()
+
+        assert [(i.index, i.title, i.guid, i.metadata['desc']) for i in items] == [
+            (0, "Jazz", "s1", "Cool"),
+            (1, "Rock", "s2", "Rock"),
+        ]
+
+    async def test_malformed_response(self):
+        """Unparseable XML is reported rather than raised."""
+        mcs = client_with_response(['<Artists><Artist name="A"'])
+
+        assert await mcs.browse_artists() == []
+
+
+class TestGetStatus:
+    """Test status parsing from decoded lines."""
+
+    async def test_fields(self):
+        """ReportState lines are decoded and mapped to status keys."""
+        mcs = client_with_response([
+            "ReportState Music_Server_A Volume=35",
+            "ReportState Music_Server_A StationName=Café Jazz",
+            "Ok",
+        ])
+
+        status = await mcs.get_status()
+
+        assert status['volume'] == 35
+        assert status['now_playing'] == {'station': "Café Jazz"}
+
+
+class TestReadResponse:
+    """Test response framing on the stream."""
+
+    async def test_long_list_is_not_truncated(self):
+        """A list of more than 100 lines is read through to its closing tag."""
+        mcs = SimpleMCSClient("127.0.0.1")
+        mcs._reader = asyncio.StreamReader()
+        mcs._reader.feed_data(
+            b"<Albums>\r\n"
+            + b"".join(b'<Album guid="a%d" />\r\n' % i for i in range(150))
+            + b"</Albums>\r\n"
+        )
+
+        lines = await mcs._read_response(timeout=1.0)
+
+        assert len(lines) == 152
+        assert lines[-1] == b"</Albums>"
+
+
+    async def test_value_ending_in_ok_does_not_end_response(self):
+        """Only a bare "Ok" or a "=Ok" line completes a response."""
+        mcs = SimpleMCSClient("127.0.0.1")
+        mcs._reader = asyncio.StreamReader()
+        mcs._reader.feed_data(
+            b"ReportState Music_Server_A TrackName=It's Ok\r\n"
+            b"ReportState Music_Server_A Volume=35\r\n"
+            b"Ok\r\n"
+        )
+
+        lines = await mcs._read_response(timeout=1.0)
+
+        assert lines[-1] == b"Ok"
+        assert len(lines) == 3
+
+class TestConnect:
+    """Test connection setup against a fake server."""
+
+    async def test_init_replies_end_the_handshake(self):
+        """connect() returns once every init command is acknowledged."""
+        server = FakeMCSServer()
+        port = await server.start()
+        mcs = SimpleMCSClient("127.0.0.1", port)
+        try:
+            await asyncio.wait_for(mcs.connect(), timeout=0.4)
+
+            assert server.writes == 1
+            assert await mcs._execute_command("SetInstance Music_Server_A") == [
+                "SetInstance=Ok"
+            ]
+        finally:
+            await mcs.disconnect()
+            await server.stop()
+
+
+class TestFetchInitialState:
+    """Test the pipelined initial load."""
+
+    async def test_one_write_for_all_commands(self):
+        """Albums, artists and status are requested together and parsed in order."""
+        server = FakeMCSServer()
+        server.replies = {
+            "BrowseAlbums": ['<Albums><Album guid="a1" name="Blue Train" />', '</Albums>'],
+            "BrowseArtists": ['<Artists><Artist guid="r1" name="Coltrane" /></Artists>'],
+            "GetStatus": ["ReportState Music_Server_A Volume=35", "GetStatus=Ok"],
+        }
+        port = await server.start()
+        mcs = SimpleMCSClient("127.0.0.1", port)
+        try:
+            await mcs.connect()
+            writes_before = server.writes
+
+            albums, artists, status = await mcs.fetch_initial_state()
+
+            assert server.writes == writes_before + 1
+            assert server.commands[-3:] == ["BrowseAlbums", "BrowseArtists", "GetStatus"]
+            assert [a['name'] for a in albums] == ["Blue Train"]
+            assert [a['name'] for a in artists] == ["Coltrane"]
+            assert status['volume'] == 35
+        finally:
+            await mcs.disconnect()
+            await server.stop()
+
+
+class TestRetry:
+    """Test recovery from a dropped connection."""
+
+    async def test_first_failure_reconnects_without_delay(self):
+        """A command on a dropped connection is resent on a fresh one at once."""
+        server = FakeMCSServer()
+        port = await server.start()
+        mcs = SimpleMCSClient("127.0.0.1", port)
+        try:
+            await mcs.connect()
+            await mcs.set_instance("Music_Server_A")
+            mcs._writer.transport.abort()
+            await asyncio.sleep(0)
+
+            response = await asyncio.wait_for(mcs._execute_command("PlayAllMusic"), timeout=1.0)
+
+            assert response == ["PlayAllMusic=Ok"]
+            assert server.commands[-2:] == ["SetInstance Music_Server_A", "PlayAllMusic"]
+            assert mcs._consecutive_failures == 0
+        finally:
+            await mcs.disconnect()
+            await server.stop()
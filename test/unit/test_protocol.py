@@ -7,6 +7,7 @@ from nuvo_sdk.protocol import (
     parse_sources_xml,
     parse_state_changed,
     parse_report_state,
+    parse_system_properties,
     update_zones_from_status,
 )
 from nuvo_sdk.models import Zone
@@ -193,6 +194,17 @@ class TestParseReportState:
         assert prop == "PowerOn"
         assert value == "True"
 
+    def test_value_containing_equals(self):
+        """Test that the property ends at the first '='."""
+        result = parse_report_state("ReportState Zone_1 MetaData1=http://art?id=7 ")
+
+        assert result == ("Zone_1", "MetaData1", "http://art?id=7")
+
+    def test_parse_missing_value(self):
+        """Test that a line without a value is rejected."""
+        assert parse_report_state("ReportState Zone_1 Volume=") is None
+        assert parse_report_state("ReportState Zone_1") is None
+
 
 class TestUpdateZonesFromStatus:
     """Test updating zones from GetStatus."""
@@ -230,3 +242,36 @@ class TestUpdateZonesFromStatus:
         assert zone.is_on is True
         assert zone.mute is True
         assert zone.party_mode == "On"
+
+    def test_ignores_other_targets_and_bad_values(self):
+        """Lines for other targets and unparseable values leave the zone as is."""
+        zone = Zone(
+            guid="", name="Kitchen", zone_id="Zone_1", zone_number=1,
+            is_on=False, volume=10, mute=False, source_id=0, source_name="",
+            source_guid="", party_mode="Off", max_volume=79, min_volume=0,
+            zone_group_name="ZG_1", zone_group_id="",
+        )
+
+        update_zones_from_status([zone], [
+            "ReportState ZG_1 Volume=50",
+            "ReportState Zone_2 Volume=50",
+            "ReportState Zone_1 Volume=loud",
+            "ReportState Zone_1 MaxVolume=",
+            "StateChanged Zone_1 Mute=True",
+        ])
+
+        assert (zone.volume, zone.mute, zone.max_volume) == (10, False, 79)
+
+
+class TestParseSystemProperties:
+    """Test device properties from GetStatus."""
+
+    def test_only_device_lines(self):
+        """Only lines for the NV- device end up in the properties."""
+        props = parse_system_properties([
+            "ReportState NV-I8G FirmwareVersion=1.2.3",
+            "ReportState Zone_1 Volume=65",
+            "ReportState NV-I8G AllMute=False",
+        ])
+
+        assert props == {"FirmwareVersion": "1.2.3", "AllMute": "False"}
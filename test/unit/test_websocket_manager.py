@@ -0,0 +1,52 @@
+"""Unit tests for WebSocket event broadcasting."""
+
+import json
+
+from api.services.websocket_manager import WebSocketManager
+from nuvo_sdk.models import StateChangeEvent
+
+
+class FakeWebSocket:
+    """Records the messages sent to a client."""
+
+    def __init__(self):
+        self.sent = []
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, message):
+        self.sent.append(json.loads(message)["value"])
+
+
+def volume(value):
+    return StateChangeEvent(target="Zone_1", property="Volume", value=value)
+
+
+class TestBroadcast:
+    """Test duplicate suppression."""
+
+    async def test_repeated_value_is_skipped(self):
+        """An event repeating the last broadcast value isn't sent again."""
+        manager = WebSocketManager()
+        client = FakeWebSocket()
+        await manager.connect(client)
+
+        for value in ("50", "50", "30"):
+            await manager.broadcast(volume(value))
+
+        assert client.sent == ["50", "30"]
+
+    async def test_change_without_clients_is_recorded(self):
+        """A change made while no client is connected doesn't hide a revert."""
+        manager = WebSocketManager()
+        client = FakeWebSocket()
+        await manager.connect(client)
+        await manager.broadcast(volume("50"))
+
+        manager.disconnect(client)
+        await manager.broadcast(volume("30"))
+        await manager.connect(client)
+        await manager.broadcast(volume("50"))
+
+        assert client.sent == ["50", "50"]
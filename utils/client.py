@@ -47,7 +47,7 @@ class MusicPortClient:
             print(f"  ASCII: {data.decode('ascii', errors='ignore')}")
 
             if self.protocol == 'tcp':
-                self.socket.send(data)
+                self.socket.sendall(data)
             else:
                 self.socket.sendto(data, (self.ip, self.port))
 
@@ -68,7 +68,7 @@ class MusicPortClient:
             print(f"  HEX: {data.hex()}")
 
             if self.protocol == 'tcp':
-                self.socket.send(data)
+                self.socket.sendall(data)
             else:
                 self.socket.sendto(data, (self.ip, self.port))
 
@@ -3,31 +3,33 @@
 Explore MRAD zone control commands
 """
 
-import telnetlib
-import time
+import asyncio
 import os
 
+from mrad_client import read_available
+
 MUSICPORT_IP = "10.0.0.45"
 TELNET_PORT = 23
 
-def send_command(tn, command):
+async def send_command(reader, writer, command):
     """Send command and get response"""
     print(f"\n{'='*60}")
     print(f"Command: {command}")
     print('='*60)
-    tn.write(command.encode('ascii') + b'\n')
-    time.sleep(0.5)
-    response = tn.read_very_eager().decode('ascii', errors='ignore')
+    writer.write(command.encode('ascii') + b'\n')
+    await writer.drain()
+    response = await read_available(reader, timeout=1.0)
     print(response)
     return response
 
-def main():
+async def main():
     print("Connecting to MusicPort...")
-    tn = telnetlib.Telnet(MUSICPORT_IP, TELNET_PORT, timeout=5)
+    reader, writer = await asyncio.wait_for(
+        asyncio.open_connection(MUSICPORT_IP, TELNET_PORT), timeout=5
+    )
 
     # Read banner
-    time.sleep(0.5)
-    tn.read_very_eager()
+    await read_available(reader)
 
     # Try to find MRAD/zone commands
     commands = [
@@ -56,9 +58,8 @@ def main():
     all_output = []
 
     for cmd in commands:
-        response = send_command(tn, cmd)
+        response = await send_command(reader, writer, cmd)
         all_output.append(f"\n{'='*60}\nCommand: {cmd}\n{'='*60}\n{response}")
-        time.sleep(0.3)
 
     # Save to file
     output_file = r"C:\Users\Corey\PycharmProjects\musicport\tmp\mrad-exploration.txt"
@@ -68,7 +69,8 @@ def main():
 
     print(f"\n\nOutput saved to: {output_file}")
 
-    tn.close()
+    writer.close()
+    await writer.wait_closed()
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
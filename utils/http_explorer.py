@@ -4,10 +4,11 @@ Nuvo MusicPort HTTP/API Explorer
 Test if the device has an HTTP API
 """
 
-import requests
-import socket
+import asyncio
 from urllib.parse import urljoin
 
+import aiohttp
+
 MUSICPORT_IP = "10.0.0.45"
 COMMON_PORTS = [80, 8000, 8008, 8080, 8443, 443, 5000]
 COMMON_PATHS = [
@@ -30,39 +31,43 @@ COMMON_PATHS = [
     "/MediaRenderer/desc.xml",  # UPnP
 ]
 
-def check_port_open(ip, port, timeout=1):
+HTTP_TIMEOUT = aiohttp.ClientTimeout(total=3)
+
+async def check_port_open(ip, port, timeout=1.0):
     """Check if port is open"""
     try:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(timeout)
-        result = sock.connect_ex((ip, port))
-        sock.close()
-        return result == 0
-    except:
+        _, writer = await asyncio.wait_for(asyncio.open_connection(ip, port), timeout=timeout)
+        writer.close()
+        await writer.wait_closed()
+        return True
+    except (OSError, asyncio.TimeoutError):
         return False
 
-def test_http_endpoint(base_url, path):
-    """Test an HTTP endpoint"""
+async def test_http_endpoint(session, base_url, path):
+    """Test an HTTP endpoint, returning report lines or None if unreachable"""
     url = urljoin(base_url, path)
     try:
         # Try GET request
-        response = requests.get(url, timeout=3)
-        print(f"  [+] {path}")
-        print(f"      Status: {response.status_code}")
-        print(f"      Content-Type: {response.headers.get('Content-Type', 'unknown')}")
-        print(f"      Size: {len(response.content)} bytes")
-
-        # Show preview of content
-        if response.status_code == 200:
-            content_preview = response.text[:200]
-            print(f"      Preview: {content_preview}...")
-
-        return True
-
-    except requests.exceptions.RequestException:
-        return False
-
-def explore_http_api(ip, port):
+        async with session.get(url, ssl=False) as response:
+            content = await response.read()
+            lines = [
+                f"  [+] {path}",
+                f"      Status: {response.status}",
+                f"      Content-Type: {response.headers.get('Content-Type', 'unknown')}",
+                f"      Size: {len(content)} bytes",
+            ]
+
+            # Show preview of content
+            if response.status == 200:
+                content_preview = content[:200].decode('utf-8', errors='replace')
+                lines.append(f"      Preview: {content_preview}...")
+
+            return lines
+
+    except (aiohttp.ClientError, asyncio.TimeoutError):
+        return None
+
+async def explore_http_api(session, ip, port):
     """Explore HTTP API on given port"""
     print(f"\n{'='*60}")
     print(f"Exploring HTTP on {ip}:{port}")
@@ -75,29 +80,31 @@ def explore_http_api(ip, port):
 
         try:
             # Test root first
-            response = requests.get(base_url, timeout=3, verify=False)
-            print(f"\n[+] {protocol.upper()} is accessible!")
-            print(f"    Status: {response.status_code}")
-            print(f"    Server: {response.headers.get('Server', 'unknown')}")
+            async with session.get(base_url, ssl=False) as response:
+                print(f"\n[+] {protocol.upper()} is accessible!")
+                print(f"    Status: {response.status}")
+                print(f"    Server: {response.headers.get('Server', 'unknown')}")
 
-            # Test common paths
+            # Test common paths concurrently; results come back in path order
             print(f"\n  Testing common API endpoints...")
-            found_paths = []
+            results = await asyncio.gather(
+                *(test_http_endpoint(session, base_url, path) for path in COMMON_PATHS)
+            )
 
-            for path in COMMON_PATHS:
-                if test_http_endpoint(base_url, path):
-                    found_paths.append(path)
+            found = [lines for lines in results if lines]
+            for lines in found:
+                print("\n".join(lines))
 
-            if found_paths:
-                print(f"\n  Found {len(found_paths)} accessible endpoint(s)")
+            if found:
+                print(f"\n  Found {len(found)} accessible endpoint(s)")
             else:
                 print(f"\n  No additional endpoints found")
 
             return True
 
-        except requests.exceptions.SSLError:
+        except aiohttp.ClientSSLError:
             print(f"  [-] {protocol.upper()} SSL error (certificate issue)")
-        except requests.exceptions.ConnectionError:
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
             print(f"  [-] {protocol.upper()} not accessible")
         except Exception as e:
             print(f"  [-] {protocol.upper()} error: {e}")
@@ -153,17 +160,20 @@ def check_upnp(ip):
         print(f"[-] UPnP check failed: {e}")
         return False
 
-def main():
+async def main():
     print("="*60)
     print("Nuvo MusicPort HTTP/API Explorer")
     print("="*60)
 
-    # Check which HTTP ports are open
+    # Check which HTTP ports are open, probing them all at once
     print(f"\nScanning for HTTP services on {MUSICPORT_IP}...")
+    results = await asyncio.gather(
+        *(check_port_open(MUSICPORT_IP, port) for port in COMMON_PORTS)
+    )
     open_ports = []
 
-    for port in COMMON_PORTS:
-        if check_port_open(MUSICPORT_IP, port):
+    for port, is_open in zip(COMMON_PORTS, results):
+        if is_open:
             print(f"  [+] Port {port} is OPEN")
             open_ports.append(port)
         else:
@@ -171,21 +181,18 @@ def main():
 
     # Explore each open port
     if open_ports:
-        for port in open_ports:
-            explore_http_api(MUSICPORT_IP, port)
+        async with aiohttp.ClientSession(timeout=HTTP_TIMEOUT) as session:
+            for port in open_ports:
+                await explore_http_api(session, MUSICPORT_IP, port)
     else:
         print("\n[!] No HTTP ports found open")
 
-    # Check for UPnP
-    check_upnp(MUSICPORT_IP)
+    # Check for UPnP (blocking socket code, so keep it off the event loop)
+    await asyncio.to_thread(check_upnp, MUSICPORT_IP)
 
     print("\n" + "="*60)
     print("Exploration complete!")
     print("="*60)
 
 if __name__ == "__main__":
-    # Disable SSL warnings for self-signed certificates
-    import urllib3
-    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-
-    main()
+    asyncio.run(main())
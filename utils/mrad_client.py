@@ -4,31 +4,54 @@ MRAD (Multi-Room Audio Distribution) Client
 Port 5006 - Zone control interface
 """
 
-import telnetlib
+import asyncio
 import sys
-import time
 import os
 
 MUSICPORT_IP = "10.0.0.45"
 MRAD_PORT = 5006
 LOG_FILE = r"C:\Users\Corey\PycharmProjects\musicport\tmp\mrad-commands.txt"
 
+
+async def read_available(reader, timeout=2.0, idle=0.3):
+    """
+    Read whatever the device sends until it goes quiet.
+
+    Waits up to `timeout` for the first bytes, then keeps reading until no
+    more data arrives for `idle` seconds.
+    """
+    chunks = []
+    wait = timeout
+    while True:
+        try:
+            data = await asyncio.wait_for(reader.read(4096), timeout=wait)
+        except asyncio.TimeoutError:
+            break
+        if not data:
+            break
+        chunks.append(data)
+        wait = idle
+    return b"".join(chunks).decode('ascii', errors='ignore')
+
+
 class MRADClient:
     def __init__(self, host, port):
         self.host = host
         self.port = port
-        self.tn = None
+        self._reader = None
+        self._writer = None
         self.log_data = []
 
-    def connect(self):
+    async def connect(self):
         """Connect to MRAD server"""
         try:
             print(f"[*] Connecting to {self.host}:{self.port}...")
-            self.tn = telnetlib.Telnet(self.host, self.port, timeout=5)
+            self._reader, self._writer = await asyncio.wait_for(
+                asyncio.open_connection(self.host, self.port), timeout=5
+            )
 
             # Read welcome banner
-            time.sleep(0.5)
-            banner = self.tn.read_very_eager().decode('ascii', errors='ignore')
+            banner = await read_available(self._reader)
             print("\n" + "="*60)
             print("MRAD SERVER CONNECTED")
             print("="*60)
@@ -40,15 +63,15 @@ class MRADClient:
             print(f"[!] Connection failed: {e}")
             return False
 
-    def send_command(self, command):
+    async def send_command(self, command):
         """Send command and get response"""
         try:
             # Send command
-            self.tn.write(command.encode('ascii') + b'\r\n')
+            self._writer.write(command.encode('ascii') + b'\r\n')
+            await self._writer.drain()
 
-            # Wait for response
-            time.sleep(0.3)
-            response = self.tn.read_very_eager().decode('ascii', errors='ignore')
+            # Read until the device stops sending
+            response = await read_available(self._reader, timeout=1.0)
 
             # Log
             self.log_data.append({
@@ -82,7 +105,7 @@ class MRADClient:
         except:
             pass
 
-    def interactive_mode(self):
+    async def interactive_mode(self):
         """Interactive command shell"""
         print("\n" + "="*60)
         print("Interactive MRAD Mode - Zone Control")
@@ -95,7 +118,7 @@ class MRADClient:
 
         while True:
             try:
-                command = input("MRAD> ").strip()
+                command = (await asyncio.to_thread(input, "MRAD> ")).strip()
 
                 if not command:
                     continue
@@ -103,7 +126,7 @@ class MRADClient:
                 if command.lower() == 'quit':
                     break
 
-                self.send_command(command)
+                await self.send_command(command)
 
             except KeyboardInterrupt:
                 print("\n")
@@ -111,14 +134,15 @@ class MRADClient:
             except EOFError:
                 break
 
-    def close(self):
+    async def close(self):
         """Close connection"""
-        if self.tn:
-            self.tn.close()
+        if self._writer:
+            self._writer.close()
+            await self._writer.wait_closed()
         print(f"\n[*] Connection closed")
         print(f"[*] Log saved to: {LOG_FILE}")
 
-def main():
+async def main():
     print("="*60)
     print("MRAD (Multi-Room Audio Distribution) Client")
     print("="*60)
@@ -126,15 +150,14 @@ def main():
 
     client = MRADClient(MUSICPORT_IP, MRAD_PORT)
 
-    if client.connect():
+    if await client.connect():
         # Try getting help first
         print("[*] Getting available commands...\n")
-        client.send_command("?")
-        time.sleep(0.5)
+        await client.send_command("?")
 
         # Enter interactive mode
-        client.interactive_mode()
-        client.close()
+        await client.interactive_mode()
+        await client.close()
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
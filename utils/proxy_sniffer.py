@@ -83,7 +83,7 @@ class ProxyConnection:
                     break
 
                 self.log_packet("CLIENT -> SERVER", data)
-                target_socket.send(data)
+                target_socket.sendall(data)
 
         except Exception as e:
             print(f"[!] Client->Server error: {e}")
@@ -100,7 +100,7 @@ class ProxyConnection:
                     break
 
                 self.log_packet("SERVER -> CLIENT", data)
-                self.client_socket.send(data)
+                self.client_socket.sendall(data)
 
         except Exception as e:
             print(f"[!] Server->Client error: {e}")
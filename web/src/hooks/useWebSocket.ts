@@ -33,7 +33,10 @@ export function useWebSocket(onMessage: (event: StateChangeEvent) => void) {
       ws.onmessage = (event) => {
         try {
           const data = JSON.parse(event.data);
-          onMessage(data);
+          // Ignore server heartbeats and anything else that isn't a state change
+          if (data.type === 'state_change') {
+            onMessage(data);
+          }
         } catch (error) {
           console.error('Failed to parse WebSocket message:', error);
         }